@@ -0,0 +1,91 @@
+"""
+Size and cost of the binary access token codec against JSON.
+
+Compares ``encode_access_token``/``decode_access_token`` with Pydantic's
+``model_dump_json``/``model_validate_json`` on a minimal token, a typical user
+token and a token with a scope bitset. Both decode paths run the full
+``AccessToken`` validation. Run from the repository root:
+
+    python -m benchmarks.bench_codec
+"""
+
+import timeit
+from datetime import datetime, timezone
+
+from spryx_core.id import generate_entity_id
+from spryx_core.security.claims import AccessToken
+from spryx_core.security.codec import decode_access_token, encode_access_token
+from spryx_core.security.scopes import ScopeRegistry, register_scope_registry
+
+NOW = datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo=timezone.utc)
+SCOPES = [f"resource{i}:{action}" for i in range(16) for action in ("read", "write")]
+REGISTRY = register_scope_registry(ScopeRegistry("bench.v1", SCOPES))
+
+BASE = {
+    "iss": "https://auth.spryx.ai",
+    "sub": generate_entity_id(),
+    "aud": "spryx-api",
+    "iat": NOW,
+    "exp": datetime(2099, 1, 1, tzinfo=timezone.utc),
+    "jti": generate_entity_id(),
+}
+TOKENS = {
+    "minimal": AccessToken(**BASE, meta={"token_type": "app"}),
+    "user": AccessToken(
+        **BASE,
+        meta={"token_type": "user", "sid": generate_entity_id()},
+        plt_context={"role_id": "admin", "scopes": SCOPES[:8]},
+        org_context={
+            "id": generate_entity_id(),
+            "role_id": generate_entity_id(),
+            "status": "active",
+            "scopes": SCOPES[:12],
+        },
+    ),
+    "user (bitset)": AccessToken(
+        **BASE,
+        meta={"token_type": "user", "sid": generate_entity_id()},
+        org_context={
+            "id": generate_entity_id(),
+            "role_id": generate_entity_id(),
+            "status": "active",
+            **REGISTRY.to_claims(SCOPES),
+        },
+    ),
+}
+
+
+def measure(func, number=20_000):
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    return best / number * 1e6
+
+
+def main():
+    print(
+        f"{'token':<14} {'format':<7} {'bytes':>6}"
+        f" {'encode us':>10} {'decode us':>10}"
+    )
+    for label, token in TOKENS.items():
+        binary = encode_access_token(token)
+        text = token.model_dump_json()
+        assert decode_access_token(binary) == token
+        rows = [
+            (
+                "binary",
+                len(binary),
+                measure(lambda: encode_access_token(token)),
+                measure(lambda: decode_access_token(binary)),
+            ),
+            (
+                "json",
+                len(text),
+                measure(token.model_dump_json),
+                measure(lambda: AccessToken.model_validate_json(text)),
+            ),
+        ]
+        for name, size, encode, decode in rows:
+            print(f"{label:<14} {name:<7} {size:>6} {encode:>10.2f} {decode:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Cost of an error storm with and without ``ErrorReporter``.
+
+Raises the same ``SpryxError`` repeatedly and handles it either by logging
+``to_dict()`` for every occurrence or through an ``ErrorReporter`` with the
+default budget, whose ``LoggingErrorSink`` writes to the same logger. Log lines
+are formatted and written to ``os.devnull``. Run from the repository root:
+
+    python -m benchmarks.bench_errors
+"""
+
+import logging
+import os
+import timeit
+from enum import StrEnum
+
+from spryx_core.errors import ErrorReporter, LoggingErrorSink, SpryxError
+
+
+class Code(StrEnum):
+    UPSTREAM_TIMEOUT = "upstream_timeout"
+
+
+class CountingHandler(logging.StreamHandler):
+    def __init__(self, stream):
+        super().__init__(stream)
+        self.lines = 0
+
+    def emit(self, record):
+        self.lines += 1
+        super().emit(record)
+
+
+def fail():
+    raise SpryxError(
+        Code.UPSTREAM_TIMEOUT, "Billing service timed out", {"service": "billing"}
+    )
+
+
+def main(number=100_000):
+    logger = logging.getLogger("bench_errors")
+    logger.propagate = False
+    with open(os.devnull, "w") as devnull:
+        handler = CountingHandler(devnull)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+        logger.addHandler(handler)
+
+        def plain():
+            try:
+                fail()
+            except SpryxError as error:
+                logger.error(
+                    "%s: %s",
+                    error.code.value,
+                    error.message,
+                    extra={"error": error.to_dict()},
+                )
+
+        def reported():
+            try:
+                fail()
+            except SpryxError as error:
+                reporter.report(error)
+
+        print(f"{'handling':<16} {'us/error':>9} {'lines':>8}")
+        for label, func in (("to_dict + log", plain), ("ErrorReporter", reported)):
+            best = float("inf")
+            for _ in range(5):
+                reporter = ErrorReporter(LoggingErrorSink(logger))
+                handler.lines = 0
+                best = min(best, timeit.timeit(func, number=number))
+                reporter.flush()
+            print(f"{label:<16} {best / number * 1e6:>9.2f} {handler.lines:>8}")
+        logger.removeHandler(handler)
+
+
+if __name__ == "__main__":
+    main()
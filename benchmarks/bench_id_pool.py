@@ -0,0 +1,61 @@
+"""
+Event-loop time per message with and without ``EntityIdPool``.
+
+Simulates an ingestion loop that assigns an ID to every message. It reports
+the time the event loop spends inside the handler per message, and the wall
+time per message, which also includes loop-side refill callbacks and refill
+threads competing for the GIL.
+Run from the repository root:
+
+    python -m benchmarks.bench_id_pool
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from spryx_core.id import EntityIdPool, generate_entity_id
+
+MESSAGES = 200_000
+BATCH = 500
+
+
+async def consume(next_id):
+    loop_seconds = 0.0
+    start = time.perf_counter()
+    for _ in range(MESSAGES // BATCH):
+        batch_start = time.perf_counter()
+        for _ in range(BATCH):
+            next_id()
+        loop_seconds += time.perf_counter() - batch_start
+        # Yield as a real consumer does while awaiting the next messages
+        await asyncio.sleep(0)
+    return loop_seconds, time.perf_counter() - start
+
+
+async def run(label, next_id, pool=None):
+    if pool is not None:
+        await pool.fill()
+    loop_seconds, wall_seconds = await consume(next_id)
+    print(
+        f"{label:<28} loop {loop_seconds / MESSAGES * 1e9:>7.0f} ns/msg"
+        f"   wall {wall_seconds / MESSAGES * 1e9:>7.0f} ns/msg"
+    )
+    if pool is not None:
+        print(
+            f"{'':<28} refills={pool.refills}"
+            f" avg_refill={pool.total_refill_seconds / max(pool.refills, 1) * 1e3:.2f} ms"
+        )
+
+
+async def main():
+    await run("generate_entity_id", generate_entity_id)
+    pool = EntityIdPool(size=8192)
+    await run("EntityIdPool (loop)", pool.next_id, pool)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pool = EntityIdPool(size=8192, executor=executor)
+        await run("EntityIdPool (executor)", pool.next_id, pool)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+"""
+Overhead of the instrumentation probes, disabled and enabled.
+
+Times each instrumented hot path through its public entry point and through
+the uninstrumented implementation behind it: the private function, the
+compiled ``AccessToken`` validator (which instrumentation only replaces while
+enabled) or ``BaseModel.model_dump_json``. Run from the repository root:
+
+    python -m benchmarks.bench_instrumentation
+"""
+
+import timeit
+from datetime import datetime, timezone
+
+from pydantic import BaseModel
+
+from spryx_core import instrumentation, serialization, time as spryx_time
+from spryx_core.id import _new_ulid, generate_entity_id
+from spryx_core.pagination import Page
+from spryx_core.security.claims import AccessToken
+
+NOW = datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo=timezone.utc)
+CLAIMS = {
+    "iss": "https://auth.spryx.ai",
+    "sub": generate_entity_id(),
+    "aud": "spryx-api",
+    "iat": NOW,
+    "exp": datetime(2099, 1, 1, tzinfo=timezone.utc),
+    "jti": generate_entity_id(),
+    "meta": {"token_type": "user"},
+    "plt_context": {"role_id": "admin", "scopes": ["users:read", "users:write"]},
+}
+PAGE = Page[int](items=list(range(20)), page=1, page_size=20, total=100)
+PLAIN_TOKEN_VALIDATOR = AccessToken.__pydantic_validator__
+
+CASES = {
+    "generate_entity_id": (generate_entity_id, _new_ulid),
+    "to_iso": (
+        lambda: spryx_time.to_iso(NOW),
+        lambda: spryx_time._to_iso(NOW, False),
+    ),
+    "parse_iso": (
+        lambda: spryx_time.parse_iso("2024-05-06T07:08:09.123456Z"),
+        lambda: spryx_time._parse_iso("2024-05-06T07:08:09.123456Z"),
+    ),
+    "serialization.dumps": (
+        lambda: serialization.dumps({"at": NOW, "n": 1}),
+        lambda: serialization.get_backend().dumps({"at": NOW, "n": 1}),
+    ),
+    "AccessToken validation": (
+        lambda: AccessToken.__pydantic_validator__.validate_python(CLAIMS),
+        lambda: PLAIN_TOKEN_VALIDATOR.validate_python(CLAIMS),
+    ),
+    "Page.model_dump_json": (
+        PAGE.model_dump_json,
+        lambda: BaseModel.model_dump_json(PAGE),
+    ),
+}
+
+
+def measure(funcs, number=20_000, repeat=9):
+    # Interleave the runs so drift on a noisy machine hits every variant alike
+    best = [float("inf")] * len(funcs)
+    for _ in range(repeat):
+        for i, func in enumerate(funcs):
+            best[i] = min(best[i], timeit.timeit(func, number=number))
+    return [seconds / number * 1e9 for seconds in best]
+
+
+def main():
+    print(
+        f"{'path':<24} {'baseline ns':>12} {'disabled ns':>12}"
+        f" {'overhead ns':>12} {'enabled ns':>11}"
+    )
+    for label, (instrumented, baseline) in CASES.items():
+        instrumentation.disable()
+        base, disabled = measure([baseline, instrumented])
+        instrumentation.enable()
+        (enabled,) = measure([instrumented])
+        instrumentation.disable()
+        print(
+            f"{label:<24} {base:>12.0f} {disabled:>12.0f}"
+            f" {disabled - base:>12.0f} {enabled:>11.0f}"
+        )
+    instrumentation.reset()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Resident memory of cached access tokens with and without ``INTERN_POOL``.
+
+Validates one million tokens, keeps them all alive and reports the RSS growth
+per token. Tokens are validated both from ``json.loads`` output (how JWT
+libraries hand over claims, with a fresh object for every string) and with
+``model_validate_json``, whose parser already caches short strings. Each run
+uses its own interpreter; interning is switched off by clearing the pool and
+setting its ``maxsize`` to 0. Run from the repository root:
+
+    python -m benchmarks.bench_interning [count]
+"""
+
+import gc
+import json
+import os
+import subprocess
+import sys
+
+from spryx_core.id import generate_entity_id
+from spryx_core.security.claims import INTERN_POOL, AccessToken
+
+ISSUERS = [f"https://auth{i}.spryx.ai" for i in range(4)]
+ROLES = [f"role-{i}" for i in range(20)]
+SCOPE_SETS = [[f"resource{j}:read" for j in range(i, i + 6)] for i in range(50)]
+
+
+def payload(i):
+    return json.dumps(
+        {
+            "iss": ISSUERS[i % len(ISSUERS)],
+            "sub": generate_entity_id(),
+            "aud": "spryx-api",
+            "iat": "2024-05-06T07:08:09Z",
+            "exp": "2099-01-01T00:00:00Z",
+            "jti": generate_entity_id(),
+            "meta": {"token_type": "user"},
+            "plt_context": {
+                "role_id": ROLES[i % len(ROLES)],
+                "scopes": SCOPE_SETS[i % len(SCOPE_SETS)],
+            },
+            "org_context": {
+                "id": f"org-{i % 100}",
+                "role_id": ROLES[(i + 7) % len(ROLES)],
+                "status": "active",
+                "scopes": SCOPE_SETS[(i + 3) % len(SCOPE_SETS)],
+            },
+        }
+    )
+
+
+def rss_bytes():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def run(source, mode, count):
+    if mode == "plain":
+        INTERN_POOL.clear()
+        INTERN_POOL.maxsize = 0
+    payloads = [payload(i) for i in range(1000)]
+    gc.collect()
+    before = rss_bytes()
+    if source == "json.loads":
+        tokens = [
+            AccessToken.model_validate(json.loads(payloads[i % len(payloads)]))
+            for i in range(count)
+        ]
+    else:
+        tokens = [
+            AccessToken.model_validate_json(payloads[i % len(payloads)])
+            for i in range(count)
+        ]
+    gc.collect()
+    grown = rss_bytes() - before
+    print(
+        f"{source:<20} {mode:<9} {len(tokens):>9} tokens {grown / 2**20:>9.1f} MiB"
+        f" {grown / len(tokens):>8.0f} B/token"
+    )
+
+
+def main():
+    count = sys.argv[1] if len(sys.argv) > 1 else "1000000"
+    if not sys.platform.startswith("linux"):
+        sys.exit("RSS is read from /proc; run this benchmark on Linux")
+    for source in ("json.loads", "model_validate_json"):
+        for mode in ("interned", "plain"):
+            subprocess.run(
+                [sys.executable, "-m", __spec__.name, "--run", source, mode, count],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--run":
+        run(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+    else:
+        main()
@@ -0,0 +1,50 @@
+"""
+Throughput of the ULID routers.
+
+Routes a batch of 10,000 IDs spread over 30 days with ``route_many`` and with
+one ``route`` call per ID, for ``ShardRouter`` and ``TimePartitionRouter``.
+Run from the repository root:
+
+    python -m benchmarks.bench_routing
+"""
+
+import random
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from spryx_core.id import ShardRouter, TimePartitionRouter, entity_id_from_int
+
+START_MS = int(datetime(2024, 5, 1, tzinfo=timezone.utc).timestamp() * 1000)
+SPAN_MS = 30 * 24 * 3600 * 1000
+
+_rng = random.Random(0)
+IDS = [
+    entity_id_from_int(
+        (START_MS + _rng.randrange(SPAN_MS)) << 80 | _rng.getrandbits(80)
+    )
+    for _ in range(10_000)
+]
+ROUTERS = {
+    "ShardRouter(16)": ShardRouter(16),
+    "ShardRouter(1024)": ShardRouter(1024),
+    "TimePartitionRouter(1h)": TimePartitionRouter(timedelta(hours=1)),
+    "TimePartitionRouter(1d)": TimePartitionRouter(timedelta(days=1)),
+}
+
+
+def measure(func, number=20):
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    return best / number / len(IDS) * 1e9
+
+
+def main():
+    print(f"{'router':<24} {'route_many ns/id':>17} {'route ns/id':>12}")
+    for label, router in ROUTERS.items():
+        assert router.route_many(IDS) == [router.route(i) for i in IDS]
+        batch = measure(lambda: router.route_many(IDS))
+        single = measure(lambda: [router.route(i) for i in IDS])
+        print(f"{label:<24} {batch:>17.0f} {single:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
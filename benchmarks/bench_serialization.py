@@ -0,0 +1,76 @@
+"""
+Throughput of ``serialization.dumps`` per JSON backend.
+
+Compares the installed backends with Pydantic's own ``model_dump_json`` on a
+page of 1,000 rows, an access token and an error. Run from the repository root:
+
+    python -m benchmarks.bench_serialization
+"""
+
+import timeit
+from datetime import datetime, timezone
+from enum import StrEnum
+
+from spryx_core import serialization
+from spryx_core.errors import SpryxError
+from spryx_core.id import generate_entity_id
+from spryx_core.pagination import Page
+from spryx_core.security.claims import AccessToken
+
+
+class Code(StrEnum):
+    NOT_FOUND = "not_found"
+
+
+NOW = datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo=timezone.utc)
+
+PAGE = Page[dict](
+    items=[
+        {"id": generate_entity_id(), "name": f"item {i}", "price": i * 1.25, "at": NOW}
+        for i in range(1000)
+    ],
+    page=1,
+    page_size=1000,
+    total=25_000,
+)
+TOKEN = AccessToken(
+    iss="https://auth.spryx.ai",
+    sub=generate_entity_id(),
+    aud="spryx-api",
+    iat=NOW,
+    exp=datetime(2099, 1, 1, tzinfo=timezone.utc),
+    jti=generate_entity_id(),
+    meta={"token_type": "user"},
+    plt_context={"role_id": "admin", "scopes": ["users:read", "users:write"]},
+)
+ERROR = SpryxError(Code.NOT_FOUND, "User not found", {"at": NOW, "id": "u1"})
+
+PAYLOADS = {"page (1k rows)": PAGE, "access token": TOKEN, "error": ERROR}
+
+
+def measure(func, number):
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    return best / number
+
+
+def main():
+    print(f"{'payload':<16} {'backend':<18} {'us/op':>10} {'MB/s':>8}")
+    for label, value in PAYLOADS.items():
+        number = 50 if value is PAGE else 20_000
+        candidates = {
+            name: serialization.create_backend(name).dumps
+            for name in serialization.available_backends()
+        }
+        if hasattr(value, "model_dump_json"):
+            candidates["model_dump_json"] = type(value).model_dump_json
+        for name, dumps in candidates.items():
+            size = len(dumps(value))
+            seconds = measure(lambda: dumps(value), number)
+            print(
+                f"{label:<16} {name:<18} {seconds * 1e6:>10.1f}"
+                f" {size / seconds / 1e6:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
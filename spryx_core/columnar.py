@@ -0,0 +1,274 @@
+"""
+Columnar binary files of entity IDs and timestamps.
+
+This module provides a compact file format for large exports of
+``(EntityId, timestamp)`` rows, such as nightly dumps of entity creation dates.
+IDs are stored as 16-byte binary ULIDs and timestamps as int64 epoch
+microseconds, each in its own contiguous column. Files are written by
+streaming rows and read through a memory map, which exposes the columns as
+zero-copy views (and NumPy arrays when NumPy is installed).
+
+File layout (little-endian)::
+
+    magic       4 bytes  b"SPXC"
+    version     uint16
+    reserved    uint16
+    row count   uint64
+    reserved    16 bytes
+    ids         row count * 16 bytes
+    timestamps  row count * int64
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from datetime import datetime
+from typing import Any, BinaryIO, Iterable, Iterator, Tuple
+
+from spryx_core.id import EntityId, entity_id_from_bytes, entity_id_to_bytes
+from spryx_core.time import from_epoch_micros, to_epoch_micros
+
+MAGIC = b"SPXC"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHQ16x")
+_TIMESTAMP = struct.Struct("<q")
+_ID_SIZE = 16
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+PathLike = str | os.PathLike[str]
+
+
+class ColumnarWriter:
+    """
+    Stream ``(EntityId, timestamp)`` rows into a columnar file.
+
+    IDs are written straight to the destination while timestamps are spooled to
+    a temporary file and appended on ``close``, so rows never need to be held in
+    memory. Use as a context manager to make sure the file is finalized.
+
+    Args:
+        path: Destination file (overwritten)
+    """
+
+    def __init__(self, path: PathLike) -> None:
+        self._file: BinaryIO = open(path, "wb")
+        self._timestamps: BinaryIO = tempfile.TemporaryFile()
+        self._count = 0
+        self._file.write(_HEADER.pack(MAGIC, VERSION, 0, 0))
+
+    def write(self, entity_id: str | bytes, timestamp: datetime | int) -> None:
+        """
+        Append one row.
+
+        Args:
+            entity_id: ULID string or its 16-byte binary form
+            timestamp: Datetime, or epoch microseconds
+
+        Raises:
+            ValueError: If the ID is not a valid ULID
+        """
+        if isinstance(entity_id, str):
+            entity_id = entity_id_to_bytes(entity_id)
+        elif len(entity_id) != _ID_SIZE:
+            raise ValueError(f"Binary ULID must be 16 bytes, got {len(entity_id)}")
+        if isinstance(timestamp, datetime):
+            timestamp = to_epoch_micros(timestamp)
+        self._file.write(entity_id)
+        self._timestamps.write(_TIMESTAMP.pack(timestamp))
+        self._count += 1
+
+    def write_many(self, rows: Iterable[Tuple[str | bytes, datetime | int]]) -> None:
+        """
+        Append rows.
+
+        Args:
+            rows: ``(entity_id, timestamp)`` pairs
+        """
+        for entity_id, timestamp in rows:
+            self.write(entity_id, timestamp)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        """Append the timestamp column and write the final row count."""
+        if self._file.closed:
+            return
+        try:
+            self._timestamps.seek(0)
+            shutil.copyfileobj(self._timestamps, self._file)
+            self._file.seek(0)
+            self._file.write(_HEADER.pack(MAGIC, VERSION, 0, self._count))
+        finally:
+            self._timestamps.close()
+            self._file.close()
+
+    def __enter__(self) -> ColumnarWriter:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class ColumnarReader:
+    """
+    Memory-mapped reader for files written by ``ColumnarWriter``.
+
+    Column views are backed by the mapping and copy nothing. They must be
+    released (or go out of scope) before the reader is closed.
+
+    Args:
+        path: File to read
+
+    Raises:
+        ValueError: If the file is not a valid columnar file
+    """
+
+    def __init__(self, path: PathLike) -> None:
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, _, count = _HEADER.unpack_from(self._mmap)
+        except struct.error:
+            self._mmap.close()
+            raise ValueError("File is too small to be a columnar file") from None
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError("Not a supported columnar file")
+        self._count = count
+        self._ids_offset = _HEADER.size
+        self._timestamps_offset = self._ids_offset + count * _ID_SIZE
+        if len(self._mmap) != self._timestamps_offset + count * _TIMESTAMP.size:
+            self._mmap.close()
+            raise ValueError("Columnar file is truncated")
+        self._view = memoryview(self._mmap)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _id_view(self, start: int, stop: int) -> memoryview:
+        offset = self._ids_offset
+        return self._view[offset + start * _ID_SIZE : offset + stop * _ID_SIZE]
+
+    def _timestamp_view(self, start: int, stop: int) -> memoryview | array:
+        offset = self._timestamps_offset
+        raw = self._view[offset + start * 8 : offset + stop * 8]
+        if _NATIVE_LITTLE_ENDIAN:
+            return raw.cast("q")
+        values = array("q", raw)
+        values.byteswap()
+        return values
+
+    @property
+    def ids(self) -> memoryview:
+        """All IDs as one bytes view, 16 bytes per row."""
+        return self._id_view(0, self._count)
+
+    @property
+    def timestamps(self) -> memoryview | array:
+        """
+        All timestamps as epoch microseconds.
+
+        A zero-copy int64 view on little-endian hosts, a converted copy otherwise.
+        """
+        return self._timestamp_view(0, self._count)
+
+    def id_at(self, index: int) -> EntityId:
+        """
+        Get the ID of one row.
+
+        Args:
+            index: Row number
+
+        Returns:
+            EntityId: The ULID string
+        """
+        if not 0 <= index < self._count:
+            raise IndexError("row index out of range")
+        return entity_id_from_bytes(self._id_view(index, index + 1))
+
+    def timestamp_at(self, index: int) -> datetime:
+        """
+        Get the timestamp of one row.
+
+        Args:
+            index: Row number
+
+        Returns:
+            datetime: The timestamp in UTC
+        """
+        if not 0 <= index < self._count:
+            raise IndexError("row index out of range")
+        offset = self._timestamps_offset + index * _TIMESTAMP.size
+        return from_epoch_micros(_TIMESTAMP.unpack_from(self._mmap, offset)[0])
+
+    def iter_chunks(
+        self, size: int = 65_536
+    ) -> Iterator[Tuple[memoryview, memoryview | array]]:
+        """
+        Iterate over the columns in chunks of rows, without loading the file.
+
+        Args:
+            size: Maximum number of rows per chunk
+
+        Yields:
+            tuple: ``(ids, timestamps)`` views for the rows of the chunk
+        """
+        for start in range(0, self._count, size):
+            stop = min(start + size, self._count)
+            yield self._id_view(start, stop), self._timestamp_view(start, stop)
+
+    def __iter__(self) -> Iterator[Tuple[EntityId, datetime]]:
+        for ids, timestamps in self.iter_chunks():
+            for i, timestamp in enumerate(timestamps):
+                yield (
+                    entity_id_from_bytes(ids[i * _ID_SIZE : (i + 1) * _ID_SIZE]),
+                    from_epoch_micros(timestamp),
+                )
+
+    def to_numpy(self) -> Tuple[Any, Any]:
+        """
+        Get the columns as NumPy arrays backed by the mapping.
+
+        Returns:
+            tuple: IDs as a ``(rows, 16)`` uint8 array and timestamps as an
+                int64 array of epoch microseconds
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        import numpy as np
+
+        ids = np.frombuffer(
+            self._mmap,
+            dtype=np.uint8,
+            count=self._count * _ID_SIZE,
+            offset=self._ids_offset,
+        ).reshape(self._count, _ID_SIZE)
+        timestamps = np.frombuffer(
+            self._mmap, dtype="<i8", count=self._count, offset=self._timestamps_offset
+        )
+        return ids, timestamps
+
+    def close(self) -> None:
+        """
+        Unmap the file.
+
+        Raises:
+            BufferError: If column views are still in use
+        """
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> ColumnarReader:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -1,5 +1,22 @@
+import logging
+import re
+import threading
+import time
 from enum import StrEnum
-from typing import Any, Dict, Generic, Optional, TypedDict, TypeVar
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Tuple,
+    TypedDict,
+    TypeVar,
+)
 
 T = TypeVar("T", bound=StrEnum)
 
@@ -22,9 +39,259 @@ class SpryxError(Exception, Generic[T]):
         self.message: str = message
         self.details: Dict[str, Any] = details or {}
 
+    def __reduce__(self):
+        # Exception pickling calls ``cls(*args)`` with only the message; restore
+        # the attributes without calling ``__init__`` so code and details survive
+        # process pools and queues, including for subclasses with their own
+        # constructors
+        return (_restore_error, (self.__class__, self.args, self.__dict__))
+
     def to_dict(self) -> SpryxErrorDict:
         return SpryxErrorDict(
             error=self.code.value,
             message=self.message,
             details=self.details,
         )
+
+
+def _restore_error(
+    cls: type[SpryxError], args: Tuple[Any, ...], state: Dict[str, Any]
+) -> SpryxError:
+    error = Exception.__new__(cls)
+    error.args = args
+    error.__dict__.update(state)
+    return error
+
+
+Fingerprint = Tuple[str, str]
+"""Error code and normalized message identifying repeats of the same error."""
+
+# Variable parts of messages, most specific first
+_MESSAGE_PATTERNS = [
+    (
+        re.compile(
+            r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b", re.I
+        ),
+        "<uuid>",
+    ),
+    (re.compile(r"\b[0-7][0-9A-HJKMNP-TV-Z]{25}\b"), "<ulid>"),
+    (
+        re.compile(
+            r"\b(?:0x[0-9a-f]+|(?=[0-9a-f]*\d)(?=[0-9a-f]*[a-f])[0-9a-f]{6,})\b", re.I
+        ),
+        "<hex>",
+    ),
+    (re.compile(r"\d+(?:\.\d+)?"), "<n>"),
+]
+
+
+@lru_cache(maxsize=4096)
+def normalize_message(message: str) -> str:
+    """
+    Replace ids, hex values and numbers in a message with placeholders.
+
+    Args:
+        message: The error message
+
+    Returns:
+        str: The message with variable parts replaced (e.g. "<ulid>", "<n>")
+    """
+    for pattern, placeholder in _MESSAGE_PATTERNS:
+        message = pattern.sub(placeholder, message)
+    return message
+
+
+def error_fingerprint(error: SpryxError) -> Fingerprint:
+    """
+    Identify an error by its code and normalized message.
+
+    Args:
+        error: The error
+
+    Returns:
+        Fingerprint: Errors with the same fingerprint are reported as repeats
+    """
+    return (error.code.value, normalize_message(error.message))
+
+
+class ErrorReport(NamedTuple):
+    """
+    An error delivered to a sink.
+
+    ``count`` is 1 for errors reported as they happen. Summaries of coalesced
+    repeats carry the last error seen and the number of repeats suppressed
+    over ``duration`` seconds.
+    """
+
+    fingerprint: Fingerprint
+    error: SpryxError
+    count: int = 1
+    duration: float = 0.0
+
+
+class ErrorSink(Protocol):
+    """Destination for error reports."""
+
+    def emit(self, report: ErrorReport) -> None: ...
+
+
+class LoggingErrorSink:
+    """
+    Sink that logs one line per report.
+
+    Args:
+        logger: Logger to write to (defaults to "spryx_core.errors")
+        level: Logging level used for the lines
+    """
+
+    def __init__(
+        self, logger: Optional[logging.Logger] = None, level: int = logging.ERROR
+    ) -> None:
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def emit(self, report: ErrorReport) -> None:
+        error = report.error
+        extra = {"error": error.to_dict(), "count": report.count}
+        if report.count == 1:
+            self.logger.log(
+                self.level, "%s: %s", error.code.value, error.message, extra=extra
+            )
+        else:
+            self.logger.log(
+                self.level,
+                "%s: %s (repeated %d times in %.1fs)",
+                error.code.value,
+                error.message,
+                report.count,
+                report.duration,
+                extra=extra,
+            )
+
+
+class _Bucket:
+    __slots__ = ("tokens", "updated", "suppressed", "since", "last")
+
+    def __init__(self, tokens: float, now: float, error: SpryxError) -> None:
+        self.tokens = tokens
+        self.updated = now
+        self.suppressed = 0
+        self.since = now
+        self.last = error
+
+
+class ErrorReporter:
+    """
+    Rate-limited reporter that coalesces repeated errors.
+
+    Each fingerprint has a token bucket of ``burst`` reports refilled at
+    ``rate`` per second. Errors within budget go to the sink immediately;
+    the rest are only counted, and a summary with the count is emitted once
+    per ``window`` seconds (and on ``flush``). Reporting a suppressed error
+    costs a dict lookup and a few arithmetic operations.
+
+    Args:
+        sink: Destination for reports (defaults to a ``LoggingErrorSink``)
+        rate: Reports per second allowed per fingerprint
+        burst: Reports allowed per fingerprint before rate limiting starts
+        window: Seconds between summaries of suppressed repeats
+        max_fingerprints: Maximum number of fingerprints tracked at once
+        clock: Monotonic clock in seconds
+    """
+
+    def __init__(
+        self,
+        sink: Optional[ErrorSink] = None,
+        *,
+        rate: float = 1.0,
+        burst: int = 10,
+        window: float = 60.0,
+        max_fingerprints: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.sink = sink or LoggingErrorSink()
+        self.rate = rate
+        self.burst = burst
+        self.window = window
+        self.max_fingerprints = max_fingerprints
+        self._clock = clock
+        self._buckets: Dict[Fingerprint, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def report(self, error: SpryxError) -> bool:
+        """
+        Report an error.
+
+        Args:
+            error: The error
+
+        Returns:
+            bool: True if the error was sent to the sink, False if it was
+                coalesced into a later summary
+        """
+        fingerprint = error_fingerprint(error)
+        pending: List[ErrorReport] = []
+        with self._lock:
+            now = self._clock()
+            bucket = self._buckets.get(fingerprint)
+            if bucket is None:
+                if len(self._buckets) >= self.max_fingerprints:
+                    # Oldest fingerprint first; summarize it before forgetting it
+                    oldest = next(iter(self._buckets))
+                    pending.extend(self._drain(oldest, self._buckets.pop(oldest), now))
+                bucket = self._buckets[fingerprint] = _Bucket(self.burst, now, error)
+            else:
+                bucket.tokens = min(
+                    self.burst, bucket.tokens + (now - bucket.updated) * self.rate
+                )
+                bucket.updated = now
+
+            if bucket.tokens >= 1:
+                bucket.tokens -= 1
+                emitted = True
+                pending.append(ErrorReport(fingerprint, error))
+            else:
+                emitted = False
+                if not bucket.suppressed:
+                    bucket.since = now
+                bucket.suppressed += 1
+                bucket.last = error
+                if now - bucket.since >= self.window:
+                    pending.extend(self._drain(fingerprint, bucket, now))
+
+        for report in pending:
+            self.sink.emit(report)
+        return emitted
+
+    def flush(self) -> int:
+        """
+        Emit summaries for every fingerprint with suppressed repeats.
+
+        Returns:
+            int: Number of summaries emitted
+        """
+        with self._lock:
+            now = self._clock()
+            pending = [
+                report
+                for fingerprint, bucket in self._buckets.items()
+                for report in self._drain(fingerprint, bucket, now)
+            ]
+        for report in pending:
+            self.sink.emit(report)
+        return len(pending)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    @staticmethod
+    def _drain(
+        fingerprint: Fingerprint, bucket: _Bucket, now: float
+    ) -> List[ErrorReport]:
+        if not bucket.suppressed:
+            return []
+        report = ErrorReport(
+            fingerprint, bucket.last, bucket.suppressed, now - bucket.since
+        )
+        bucket.suppressed = 0
+        return [report]
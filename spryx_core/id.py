@@ -2,22 +2,33 @@
 ID generation and validation utilities.
 
 This module provides functions for generating and validating unique entity IDs.
-It uses ULID (Universally Unique Lexicographically Sortable Identifier) as the
-primary ID format, with fallback to UUID4 if the ULID library is not available.
+IDs are ULIDs (Universally Unique Lexicographically Sortable Identifiers),
+generated in-process without third-party libraries.
+
+ID generation keeps its monotonic state per thread, so threads never contend on
+a shared lock, and every ID and time helper here is safe to call concurrently,
+including on free-threaded (no-GIL) builds.
 """
 
 from __future__ import annotations
 
+import asyncio
+import math
+import mmap
+import os
 import re
-import uuid
-from typing import Final, NewType
-
-try:
-    import ulid as ulid_lib
+import threading
+import time
+import weakref
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import Executor
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Callable, Deque, Dict, Final, Iterable, Iterator, List, NewType
 
-    _has_ulid = True
-except ImportError:
-    _has_ulid = False
+from spryx_core import instrumentation
+from spryx_core.time import from_epoch_micros, to_epoch_micros
 
 # Custom type for entity IDs
 EntityId = NewType("EntityId", str)
@@ -25,18 +36,105 @@ EntityId = NewType("EntityId", str)
 # Regex for validating ULID format
 _ULID_RE: Final = re.compile(r"^[0-9A-HJKMNP-TV-Z]{26}$")
 
+# Crockford base32 (ULID) <-> base32hex (int()/b32hexencode) translation tables
+_CROCKFORD: Final = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_BASE32HEX: Final = "0123456789ABCDEFGHIJKLMNOPQRSTUV"
+_TO_BASE32HEX: Final = str.maketrans(_CROCKFORD, _BASE32HEX)
+_CROCKFORD_PAIRS: Final = [a + b for a in _CROCKFORD for b in _CROCKFORD]
+
+_MAX_ULID_TIMESTAMP: Final = (1 << 48) - 1
+_RANDOM_BITS: Final = 80
+_RANDOM_MASK: Final = (1 << _RANDOM_BITS) - 1
+_KEY_MASK: Final = (1 << 64) - 1
+
+_GENERATE_PROBE: Final = instrumentation.probe("id.generate_entity_id")
+
+
+class _GeneratorState(threading.local):
+    """Per-thread state of the monotonic ULID generator."""
+
+    last_ms: int = -1
+    last_random: int = 0
+
+
+_generator_state: Final = _GeneratorState()
+
+
+def _reset_generator_state() -> None:
+    # A forked child inherits the parent's last value; continuing from it would
+    # produce the same IDs as the parent within the same millisecond
+    _generator_state.last_ms = -1
+    _generator_state.last_random = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_generator_state)
+
 
 def generate_entity_id() -> EntityId:
     """
     Generate a new unique entity ID.
 
     Returns:
-        EntityId: A new ULID as a string (falls back to UUID4 if ULID is not available)
+        EntityId: A new ULID as a string
     """
-    if _has_ulid:
-        # Use ulid package to generate a new ULID
-        return EntityId(str(ulid_lib.ULID()))
-    return EntityId(str(uuid.uuid4()))
+    if _GENERATE_PROBE.active:
+        return _GENERATE_PROBE.observe(_new_ulid)
+    return _new_ulid()
+
+
+def _new_ulid() -> EntityId:
+    """
+    Generate a ULID that sorts after every ULID previously generated by this thread.
+
+    Within one millisecond (or if the clock goes backwards) the random part of
+    the previous ID is incremented instead of drawn again, as in the ULID spec's
+    monotonic mode. The state is per thread: IDs from different threads are kept
+    unique by their independent 80-bit random parts.
+    """
+    state = _generator_state
+    ms = time.time_ns() // 1_000_000
+    if ms > state.last_ms:
+        random = int.from_bytes(os.urandom(10), "big")
+    else:
+        ms = state.last_ms
+        random = state.last_random + 1
+        if random > _RANDOM_MASK:
+            ms += 1
+            random = int.from_bytes(os.urandom(10), "big")
+    state.last_ms = ms
+    state.last_random = random
+    return entity_id_from_int((ms << _RANDOM_BITS) | random)
+
+
+def _new_ulids(count: int) -> List[EntityId]:
+    """
+    Generate ``count`` ULIDs as ``_new_ulid`` would, in one batch.
+
+    The clock and ``os.urandom`` are read once per batch and the random part is
+    incremented for each ID, so a batch costs little more than encoding it.
+    """
+    state = _generator_state
+    ms = time.time_ns() // 1_000_000
+    if ms > state.last_ms:
+        random = int.from_bytes(os.urandom(10), "big")
+    else:
+        ms = state.last_ms
+        random = state.last_random + 1
+    ids: List[EntityId] = []
+    encode = entity_id_from_int
+    while count > 0:
+        if random > _RANDOM_MASK:
+            ms += 1
+            random = int.from_bytes(os.urandom(10), "big")
+        n = min(count, _RANDOM_MASK - random + 1)
+        base = (ms << _RANDOM_BITS) | random
+        ids.extend([encode(base + i) for i in range(n)])
+        random += n
+        count -= n
+    state.last_ms = ms
+    state.last_random = random - 1
+    return ids
 
 
 def is_valid_ulid(value: str) -> bool:
@@ -63,3 +161,793 @@ def cast_entity_id(value: str) -> EntityId:
         EntityId: The string as an EntityId
     """
     return EntityId(value)
+
+
+def entity_id_to_int(value: str) -> int:
+    """
+    Convert a ULID entity ID to its 128-bit integer value.
+
+    Args:
+        value: The ULID string
+
+    Returns:
+        int: The ULID as an unsigned 128-bit integer
+
+    Raises:
+        ValueError: If the value is not a valid ULID
+    """
+    if not _ULID_RE.fullmatch(value) or value[0] > "7":
+        raise ValueError(f"Invalid ULID: {value!r}")
+    return int(value.translate(_TO_BASE32HEX), 32)
+
+
+def entity_id_from_int(value: int) -> EntityId:
+    """
+    Convert a 128-bit integer back to a ULID entity ID.
+
+    Args:
+        value: The ULID as an unsigned 128-bit integer
+
+    Returns:
+        EntityId: The ULID string
+
+    Raises:
+        ValueError: If the value does not fit in 128 unsigned bits
+    """
+    if value < 0 or value >> 128:
+        raise ValueError(f"Not a 128-bit unsigned integer: {value}")
+    # 26 chars hold 130 bits: one 3-bit leading char, twelve 10-bit pairs and
+    # a final 5-bit char. Table lookups beat base64's pure-Python encoder
+    pairs = _CROCKFORD_PAIRS
+    return EntityId(
+        "".join(
+            [
+                _CROCKFORD[value >> 125],
+                pairs[value >> 115 & 1023],
+                pairs[value >> 105 & 1023],
+                pairs[value >> 95 & 1023],
+                pairs[value >> 85 & 1023],
+                pairs[value >> 75 & 1023],
+                pairs[value >> 65 & 1023],
+                pairs[value >> 55 & 1023],
+                pairs[value >> 45 & 1023],
+                pairs[value >> 35 & 1023],
+                pairs[value >> 25 & 1023],
+                pairs[value >> 15 & 1023],
+                pairs[value >> 5 & 1023],
+                _CROCKFORD[value & 31],
+            ]
+        )
+    )
+
+
+def entity_id_to_bytes(value: str) -> bytes:
+    """
+    Convert a ULID entity ID to its 16-byte big-endian binary form.
+
+    The binary form sorts in the same order as the string form.
+
+    Args:
+        value: The ULID string
+
+    Returns:
+        bytes: 16 bytes
+
+    Raises:
+        ValueError: If the value is not a valid ULID
+    """
+    return entity_id_to_int(value).to_bytes(16, "big")
+
+
+def entity_id_from_bytes(value: bytes) -> EntityId:
+    """
+    Convert a 16-byte binary ULID back to an entity ID.
+
+    Args:
+        value: 16 bytes in big-endian order
+
+    Returns:
+        EntityId: The ULID string
+
+    Raises:
+        ValueError: If the value is not 16 bytes long
+    """
+    if len(value) != 16:
+        raise ValueError(f"Binary ULID must be 16 bytes, got {len(value)}")
+    return entity_id_from_int(int.from_bytes(value, "big"))
+
+
+def entity_id_timestamp(value: str) -> datetime:
+    """
+    Get the creation time encoded in a ULID entity ID.
+
+    Args:
+        value: The ULID string
+
+    Returns:
+        datetime: The ULID timestamp in UTC, with millisecond precision
+
+    Raises:
+        ValueError: If the value is not a valid ULID
+    """
+    return from_epoch_micros((entity_id_to_int(value) >> _RANDOM_BITS) * 1000)
+
+
+def min_entity_id(dt: datetime) -> EntityId:
+    """
+    Get the smallest ULID with the timestamp of ``dt``.
+
+    Every ULID generated at or after ``dt`` sorts at or after this value, which
+    makes it a lower bound for time-based ID range queries.
+
+    Args:
+        dt: The datetime (clamped to the ULID timestamp range)
+
+    Returns:
+        EntityId: The ULID with the millisecond timestamp of ``dt`` and no random bits
+    """
+    return entity_id_from_bytes(_timestamp_prefix(dt) + bytes(10))
+
+
+def _timestamp_prefix(dt: datetime) -> bytes:
+    """Return the 6-byte ULID timestamp prefix for ``dt``, clamped to the ULID range."""
+    ms = min(max(to_epoch_micros(dt) // 1000, 0), _MAX_ULID_TIMESTAMP)
+    return ms.to_bytes(6, "big")
+
+
+class EntityIdSet:
+    """
+    Immutable sorted set of ULID entity IDs stored as packed 16-byte values.
+
+    IDs are kept in one contiguous buffer in ULID (and therefore creation time)
+    order, using 16 bytes per ID instead of a Python string each. Membership is
+    a binary search, set operations merge the two sorted buffers, and since the
+    first 6 bytes of a ULID are its millisecond timestamp, time ranges map to
+    contiguous slices.
+
+    The buffer layout is the raw concatenation of the sorted IDs, which is also
+    the serialized form, so sets can be written to disk and memory-mapped back.
+
+    Args:
+        ids: ULID strings to include (duplicates are dropped)
+
+    Raises:
+        ValueError: If an ID is not a valid ULID
+    """
+
+    __slots__ = ("_buf", "_len")
+
+    def __init__(self, ids: Iterable[str] = ()) -> None:
+        packed = sorted({entity_id_to_bytes(entity_id) for entity_id in ids})
+        self._buf = memoryview(b"".join(packed))
+        self._len = len(packed)
+
+    @classmethod
+    def _from_sorted(cls, buf: bytes | memoryview) -> EntityIdSet:
+        instance = cls.__new__(cls)
+        instance._buf = memoryview(buf).cast("B")
+        instance._len = len(instance._buf) // 16
+        return instance
+
+    @classmethod
+    def from_buffer(
+        cls, buffer: bytes | bytearray | memoryview | mmap.mmap, *, validate: bool = True
+    ) -> EntityIdSet:
+        """
+        Wrap a buffer of sorted packed IDs without copying it.
+
+        Args:
+            buffer: Buffer produced by ``to_bytes`` (bytes, mmap, ...)
+            validate: Check that the IDs are strictly increasing
+
+        Returns:
+            EntityIdSet: A set backed by ``buffer``
+
+        Raises:
+            ValueError: If the buffer is not a sorted sequence of 16-byte IDs
+        """
+        view = memoryview(buffer).cast("B")
+        if len(view) % 16:
+            raise ValueError("Buffer size must be a multiple of 16 bytes")
+        instance = cls._from_sorted(view)
+        if validate:
+            previous = b""
+            for i in range(instance._len):
+                key = instance._key(i)
+                if key <= previous:
+                    raise ValueError("Buffer IDs must be sorted and unique")
+                previous = key
+        return instance
+
+    @classmethod
+    def open(cls, path: str | os.PathLike[str], *, validate: bool = False) -> EntityIdSet:
+        """
+        Memory-map a file written by ``write``.
+
+        Args:
+            path: Path of the file
+            validate: Check that the IDs are strictly increasing
+
+        Returns:
+            EntityIdSet: A read-only set backed by the mapped file
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return cls()
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls.from_buffer(mapped, validate=validate)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the set.
+
+        Returns:
+            bytes: The sorted packed IDs
+        """
+        return self._buf.tobytes()
+
+    def write(self, path: str | os.PathLike[str]) -> None:
+        """
+        Write the serialized set to ``path``.
+
+        Args:
+            path: Destination file
+        """
+        with open(path, "wb") as f:
+            f.write(self._buf)
+
+    def _key(self, index: int) -> bytes:
+        start = index * 16
+        return self._buf[start : start + 16].tobytes()
+
+    def _keys(self) -> Iterator[bytes]:
+        buf = self._buf
+        for start in range(0, self._len * 16, 16):
+            yield buf[start : start + 16].tobytes()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[EntityId]:
+        for key in self._keys():
+            yield entity_id_from_bytes(key)
+
+    def __getitem__(self, index: int) -> EntityId:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("EntityIdSet index out of range")
+        return entity_id_from_bytes(self._key(index))
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, str):
+            return False
+        try:
+            key = entity_id_to_bytes(value)
+        except ValueError:
+            return False
+        index = bisect_left(range(self._len), key, key=self._key)
+        return index < self._len and self._key(index) == key
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EntityIdSet):
+            return NotImplemented
+        return self._buf == other._buf
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"EntityIdSet(<{self._len} ids>)"
+
+    def __reduce__(self):
+        # The memoryview slot cannot be pickled or copied; rebuild from the
+        # packed IDs instead (a memory-mapped set comes back in memory)
+        return (type(self)._from_sorted, (self.to_bytes(),))
+
+    def _merge(
+        self, other: EntityIdSet, keep_left: bool, keep_both: bool, keep_right: bool
+    ) -> EntityIdSet:
+        out = bytearray()
+        i = j = 0
+        n, m = self._len, other._len
+        left, right = self._key, other._key
+        while i < n and j < m:
+            a, b = left(i), right(j)
+            if a < b:
+                if keep_left:
+                    out += a
+                i += 1
+            elif b < a:
+                if keep_right:
+                    out += b
+                j += 1
+            else:
+                if keep_both:
+                    out += a
+                i += 1
+                j += 1
+        if keep_left:
+            out += self._buf[i * 16 : n * 16]
+        if keep_right:
+            out += other._buf[j * 16 : m * 16]
+        return EntityIdSet._from_sorted(bytes(out))
+
+    def union(self, other: EntityIdSet) -> EntityIdSet:
+        """Return the IDs in either set."""
+        return self._merge(other, True, True, True)
+
+    def intersection(self, other: EntityIdSet) -> EntityIdSet:
+        """Return the IDs in both sets."""
+        return self._merge(other, False, True, False)
+
+    def difference(self, other: EntityIdSet) -> EntityIdSet:
+        """Return the IDs in this set but not in ``other``."""
+        return self._merge(other, True, False, False)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def between(self, start: datetime, end: datetime) -> EntityIdSet:
+        """
+        Return the IDs created between two datetimes, without copying.
+
+        Bounds are inclusive and have millisecond precision, like ULID timestamps.
+
+        Args:
+            start: Earliest creation time
+            end: Latest creation time
+
+        Returns:
+            EntityIdSet: A view over the matching IDs
+        """
+        low = _timestamp_prefix(start) + bytes(10)
+        high = _timestamp_prefix(end) + b"\xff" * 10
+        lo = bisect_left(range(self._len), low, key=self._key)
+        hi = bisect_right(range(self._len), high, lo=lo, key=self._key)
+        return EntityIdSet._from_sorted(self._buf[lo * 16 : max(lo, hi) * 16])
+
+
+def _mix64(x: int) -> int:
+    # splitmix64 finalizer: spreads nearby inputs over the whole 64-bit range
+    x = (x ^ (x >> 30)) * 0xBF58476D1CE4E5B9 & _KEY_MASK
+    x = (x ^ (x >> 27)) * 0x94D049BB133111EB & _KEY_MASK
+    return x ^ (x >> 31)
+
+
+class SeenIdFilter:
+    """
+    Time-partitioned Bloom filter answering "was this ULID seen before?".
+
+    Meant for deduplicating redelivered events by ID without an ever-growing
+    set. Each partition covers a fixed span of ULID timestamps and holds a
+    Bloom filter sized for ``capacity`` IDs. An ID is only ever checked against
+    the partition of its own timestamp, and partitions older than ``retention``
+    are dropped as newer IDs arrive, so memory stays flat.
+
+    The 80 random bits of a ULID are passed through a cheap integer mix
+    (splitmix64) to derive the two base hashes for double hashing, instead of
+    hashing the whole ID string. The mix matters: IDs generated within one
+    millisecond differ only by small increments of their random part.
+
+    A filter can report false positives (an unseen ID reported as seen) at
+    roughly ``error_rate`` but never false negatives within the retention
+    window. IDs older than the window are reported as unseen and not stored,
+    and so are IDs timestamped more than ``max_skew`` in the future (clock skew
+    or a bad producer): storing them would rotate the window and evict every
+    recent partition.
+
+    Args:
+        capacity: Expected number of IDs per partition
+        error_rate: Target false-positive rate per partition
+        partition: Time span covered by one partition
+        retention: How long IDs are remembered
+        max_skew: How far in the future an ID's timestamp may be
+        clock: Function returning the current time in epoch seconds
+    """
+
+    def __init__(
+        self,
+        *,
+        capacity: int,
+        error_rate: float = 0.001,
+        partition: timedelta = timedelta(hours=1),
+        retention: timedelta = timedelta(days=1),
+        max_skew: timedelta = timedelta(minutes=5),
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        bits = -capacity * math.log(error_rate) / math.log(2) ** 2
+        self.num_bits = max(8, math.ceil(bits))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._partition_ms = max(1, partition // timedelta(milliseconds=1))
+        self._max_partitions = max(1, math.ceil(retention / partition))
+        self._max_skew_ms = max_skew // timedelta(milliseconds=1)
+        self._clock = clock
+        self._partitions: Dict[int, bytearray] = {}
+        self._newest = -1
+
+    def _positions(self, value: int) -> List[int]:
+        rand = value & _RANDOM_MASK
+        h1 = _mix64(rand & _KEY_MASK ^ rand >> 64)
+        h2 = _mix64(h1) | 1
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def _partition(self, value: int, create: bool) -> bytearray | None:
+        timestamp = value >> _RANDOM_BITS
+        index = timestamp // self._partition_ms
+        if index > self._newest:
+            # Rejected rather than clamped into a partition picked by the clock,
+            # which would file redeliveries of the same ID under different ones
+            if timestamp > int(self._clock() * 1000) + self._max_skew_ms:
+                return None
+        if index <= self._newest - self._max_partitions:
+            return None
+        bits = self._partitions.get(index)
+        if bits is None and create:
+            if index > self._newest:
+                self._newest = index
+                oldest = index - self._max_partitions
+                for stale in [i for i in self._partitions if i <= oldest]:
+                    del self._partitions[stale]
+            bits = self._partitions[index] = bytearray((self.num_bits + 7) // 8)
+        return bits
+
+    def add(self, entity_id: str) -> bool:
+        """
+        Record an ID.
+
+        Args:
+            entity_id: The ULID to record
+
+        Returns:
+            bool: True if the ID was (probably) already seen
+
+        Raises:
+            ValueError: If the ID is not a valid ULID
+        """
+        value = entity_id_to_int(entity_id)
+        bits = self._partition(value, create=True)
+        if bits is None:
+            return False
+        seen = True
+        for pos in self._positions(value):
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & mask:
+                seen = False
+                bits[byte] |= mask
+        return seen
+
+    def __contains__(self, entity_id: str) -> bool:
+        value = entity_id_to_int(entity_id)
+        bits = self._partition(value, create=False)
+        if bits is None:
+            return False
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+    def add_many(self, entity_ids: Iterable[str]) -> List[bool]:
+        """
+        Record a batch of IDs.
+
+        Args:
+            entity_ids: ULIDs to record
+
+        Returns:
+            list[bool]: For each ID, whether it was (probably) already seen,
+                including earlier occurrences in the same batch
+        """
+        add = self.add
+        return [add(entity_id) for entity_id in entity_ids]
+
+    def contains_many(self, entity_ids: Iterable[str]) -> List[bool]:
+        """
+        Check a batch of IDs without recording them.
+
+        Args:
+            entity_ids: ULIDs to check
+
+        Returns:
+            list[bool]: For each ID, whether it was (probably) seen
+        """
+        contains = self.__contains__
+        return [contains(entity_id) for entity_id in entity_ids]
+
+    @property
+    def partitions(self) -> int:
+        """Number of partitions currently held in memory."""
+        return len(self._partitions)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes used by the partitions' bit arrays."""
+        return sum(len(bits) for bits in self._partitions.values())
+
+    def estimated_false_positive_rate(self) -> float:
+        """
+        Estimate the current false-positive rate from the fill of the partitions.
+
+        Returns:
+            float: The highest estimated rate across partitions
+        """
+        rates = [
+            (int.from_bytes(bits, "big").bit_count() / self.num_bits) ** self.num_hashes
+            for bits in self._partitions.values()
+        ]
+        return max(rates, default=0.0)
+
+
+class ShardRouter:
+    """
+    Consistent router from ULIDs to a fixed number of shards.
+
+    Uses jump consistent hashing keyed directly on the low 64 random bits of
+    the ULID, so no hashing of the ID string is needed. When the number of
+    shards grows from n to n + 1, only about 1/(n + 1) of the IDs move, and
+    all of them move to the new shard.
+
+    Args:
+        num_shards: Number of shards (or queue partitions)
+    """
+
+    __slots__ = ("num_shards",)
+
+    def __init__(self, num_shards: int) -> None:
+        if num_shards <= 0:
+            raise ValueError("num_shards must be positive")
+        self.num_shards = num_shards
+
+    def route(self, entity_id: str) -> int:
+        """
+        Get the shard of an ID.
+
+        Args:
+            entity_id: The ULID to route
+
+        Returns:
+            int: Shard number in ``range(num_shards)``
+
+        Raises:
+            ValueError: If the ID is not a valid ULID
+        """
+        return self.route_many((entity_id,))[0]
+
+    def route_many(self, entity_ids: Iterable[str]) -> List[int]:
+        """
+        Get the shard of each ID in a batch.
+
+        Args:
+            entity_ids: ULIDs to route
+
+        Returns:
+            list[int]: Shard numbers, in input order
+        """
+        shards = self.num_shards
+        result = []
+        append = result.append
+        for entity_id in entity_ids:
+            key = entity_id_to_int(entity_id) & _KEY_MASK
+            bucket, j = -1, 0
+            while j < shards:
+                bucket = j
+                key = (key * 2862933555777941757 + 1) & _KEY_MASK
+                j = int((bucket + 1) * (2147483648.0 / ((key >> 33) + 1)))
+            append(bucket)
+        return result
+
+
+class TimePartitionRouter:
+    """
+    Router from ULIDs to time partitions, based on their timestamp prefix.
+
+    Useful for time-partitioned tables: the partition of an ID is known from
+    the ID alone, without looking up its creation date.
+
+    Args:
+        partition: Time span covered by one partition
+    """
+
+    __slots__ = ("_partition_ms",)
+
+    def __init__(self, partition: timedelta) -> None:
+        self._partition_ms = partition // timedelta(milliseconds=1)
+        if self._partition_ms <= 0:
+            raise ValueError("partition must be at least one millisecond")
+
+    def route(self, entity_id: str) -> datetime:
+        """
+        Get the partition of an ID.
+
+        Args:
+            entity_id: The ULID to route
+
+        Returns:
+            datetime: Start of the partition containing the ID's timestamp (UTC)
+
+        Raises:
+            ValueError: If the ID is not a valid ULID
+        """
+        return self.route_many((entity_id,))[0]
+
+    def route_many(self, entity_ids: Iterable[str]) -> List[datetime]:
+        """
+        Get the partition of each ID in a batch.
+
+        Args:
+            entity_ids: ULIDs to route
+
+        Returns:
+            list[datetime]: Partition starts, in input order
+        """
+        span = self._partition_ms
+        starts: Dict[int, datetime] = {}
+        result = []
+        for entity_id in entity_ids:
+            index = (entity_id_to_int(entity_id) >> _RANDOM_BITS) // span
+            start = starts.get(index)
+            if start is None:
+                start = starts[index] = from_epoch_micros(index * span * 1000)
+            result.append(start)
+        return result
+
+
+# Pools whose buffers must be dropped in a forked child
+_pools: Final[weakref.WeakSet[EntityIdPool]] = weakref.WeakSet()
+
+
+def _reset_pools() -> None:
+    # The child inherits the parent's buffered IDs; handing them out too would
+    # duplicate every ID the parent still has to hand out
+    for pool in list(_pools):
+        pool._reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools)
+
+
+class EntityIdPool:
+    """
+    Buffer of pre-generated entity IDs for asyncio services.
+
+    ``next_id`` pops an ID from the buffer in O(1). When the buffer falls to
+    ``low_water``, a refill is scheduled on the event loop with
+    ``loop.call_soon`` and generates ``chunk`` IDs per callback, so it runs
+    between other callbacks instead of inside the handler that drained the
+    pool. Refills use the batch generator, which reads the clock and
+    ``os.urandom`` once per chunk and is cheaper per ID than generating inline.
+    If the buffer runs dry (or no event loop is running), IDs are generated
+    inline, so ``next_id`` never waits. Buffers are dropped in forked children.
+
+    Generation is pure Python and holds the GIL, so running it in a thread
+    does not free up the loop; pass ``executor`` only on free-threaded builds,
+    where threads do run Python in parallel.
+
+    IDs carry the time of their refill rather than of ``next_id``; ``max_age``
+    bounds how far behind that can be. The price is paid at low message rates:
+    with the defaults, a pool that serves fewer than ``size`` IDs a second
+    discards what is left after every idle second and generates a full ``size``
+    again, a few milliseconds of loop time per refill for the 4096 default
+    (spread over ``chunk``-sized callbacks). Services that take a few IDs a
+    second should lower ``size`` to roughly their peak IDs per ``max_age``, or
+    pass ``max_age=None`` if ID timestamps may lag.
+
+    Args:
+        size: Number of IDs generated per refill
+        low_water: Buffer level at which a refill starts (defaults to half of
+            ``size``)
+        max_age: Seconds after which buffered IDs are discarded, or None to keep
+            them until used
+        chunk: Number of IDs generated per event loop callback during a refill
+        executor: Executor to run refills in instead of the event loop
+    """
+
+    def __init__(
+        self,
+        size: int = 4096,
+        *,
+        low_water: int | None = None,
+        max_age: float | None = 1.0,
+        chunk: int = 256,
+        executor: Executor | None = None,
+    ) -> None:
+        if size <= 0:
+            raise ValueError("size must be positive")
+        if chunk <= 0:
+            raise ValueError("chunk must be positive")
+        self.size = size
+        self.low_water = size // 2 if low_water is None else low_water
+        self.max_age = max_age
+        self.chunk = chunk
+        self._executor = executor
+        self._buffer: Deque[EntityId] = deque()
+        self._filled_at = 0.0
+        self._refill: asyncio.Future[List[EntityId]] | None = None
+        self._probe = instrumentation.probe("id.entity_id_pool")
+        self.refills = 0
+        self.last_refill_seconds = 0.0
+        self.total_refill_seconds = 0.0
+        _pools.add(self)
+
+    @property
+    def fill_level(self) -> int:
+        """Number of IDs currently buffered."""
+        return len(self._buffer)
+
+    def next_id(self) -> EntityId:
+        """
+        Take the next ID from the pool.
+
+        Returns:
+            EntityId: A new unique ID
+        """
+        buffer = self._buffer
+        max_age = self.max_age
+        if max_age is not None and time.monotonic() - self._filled_at > max_age:
+            buffer.clear()
+        if len(buffer) <= self.low_water and self._refill is None:
+            self._start_refill()
+        if buffer:
+            self._probe.hit()
+            return buffer.popleft()
+        self._probe.miss()
+        return _new_ulid()
+
+    async def fill(self) -> None:
+        """Fill the buffer and wait for it, e.g. before serving traffic."""
+        if self._refill is None:
+            self._start_refill()
+        if self._refill is not None:
+            await asyncio.shield(self._refill)
+
+    def _start_refill(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        started = time.perf_counter()
+        if self._executor is None:
+            self._refill = loop.create_future()
+            loop.call_soon(self._refill_chunk, self._refill, [])
+        else:
+            self._refill = loop.run_in_executor(self._executor, _new_ulids, self.size)
+        self._refill.add_done_callback(partial(self._finish_refill, started=started))
+
+    def _refill_chunk(
+        self, future: asyncio.Future[List[EntityId]], ids: List[EntityId]
+    ) -> None:
+        if future is not self._refill or future.done():
+            return
+        ids.extend(_new_ulids(min(self.chunk, self.size - len(ids))))
+        if len(ids) < self.size:
+            future.get_loop().call_soon(self._refill_chunk, future, ids)
+        else:
+            future.set_result(ids)
+
+    def _finish_refill(
+        self, future: asyncio.Future[List[EntityId]], started: float
+    ) -> None:
+        if future is not self._refill:
+            # Started before a fork or reset; its IDs are not ours to hand out
+            return
+        self._refill = None
+        if future.cancelled() or future.exception() is not None:
+            return
+        elapsed = time.perf_counter() - started
+        self.refills += 1
+        self.last_refill_seconds = elapsed
+        self.total_refill_seconds += elapsed
+        if self._probe.active:
+            self._probe.record(int(elapsed * 1e9))
+        if self.max_age is not None:
+            # Leftovers would otherwise count as fresh as the new batch
+            self._buffer.clear()
+        self._buffer.extend(future.result())
+        self._filled_at = time.monotonic()
+
+    def _reset(self) -> None:
+        self._buffer.clear()
+        self._refill = None
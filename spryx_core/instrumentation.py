@@ -0,0 +1,333 @@
+"""
+Opt-in instrumentation for spryx-core hot paths.
+
+This module provides call counters, latency histograms and cache hit ratios
+for the package's hot paths (ID generation, ISO parsing and formatting, token
+validation and serialization). Instrumentation is disabled by default; while
+disabled, instrumented functions only pay for a single attribute check.
+
+Metrics are collected in probes and exported on demand to a pluggable sink.
+Counters are updated without locks to keep the enabled path cheap, so under
+heavy multi-threading (notably on free-threaded builds) they are best-effort
+and may undercount slightly.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Protocol, Tuple, TypeVar
+
+_R = TypeVar("_R")
+
+# Histogram bucket upper bounds in seconds (Prometheus-style, cumulative on export)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    1e-2,
+    1e-1,
+)
+_BUCKETS_NS: Tuple[int, ...] = tuple(int(bound * 1e9) for bound in DEFAULT_BUCKETS)
+
+
+class ProbeSnapshot(NamedTuple):
+    """Point-in-time copy of a probe's metrics."""
+
+    name: str
+    calls: int
+    errors: int
+    total_seconds: float
+    buckets: Tuple[int, ...]
+    cache_hits: int
+    cache_misses: int
+
+    @property
+    def cache_hit_ratio(self) -> Optional[float]:
+        """Fraction of cache lookups that hit, or None without lookups."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else None
+
+
+class Probe:
+    """
+    Metrics collector for one instrumented code path.
+
+    Instrumented functions check ``active`` before doing any work, so probes
+    cost a single attribute lookup while instrumentation is disabled.
+
+    Args:
+        name: Dotted metric name, e.g. "id.generate_entity_id"
+    """
+
+    __slots__ = ("name", "active", "calls", "errors", "total_ns", "buckets", "hits", "misses")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.active = _enabled
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all collected metrics."""
+        self.calls = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.buckets = [0] * (len(_BUCKETS_NS) + 1)
+        self.hits = 0
+        self.misses = 0
+
+    def observe(self, func: Callable[..., _R], *args: Any, **kwargs: Any) -> _R:
+        """
+        Call ``func`` and record its latency.
+
+        Args:
+            func: The function to time
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            The return value of ``func``
+        """
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            self.errors += 1
+            raise
+        finally:
+            self.record(time.perf_counter_ns() - start)
+
+    def record(self, elapsed_ns: int) -> None:
+        """
+        Record one call that took ``elapsed_ns`` nanoseconds.
+
+        Args:
+            elapsed_ns: Duration of the call in nanoseconds
+        """
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        self.buckets[bisect_left(_BUCKETS_NS, elapsed_ns)] += 1
+
+    def hit(self) -> None:
+        """Record a cache hit."""
+        if self.active:
+            self.hits += 1
+
+    def miss(self) -> None:
+        """Record a cache miss."""
+        if self.active:
+            self.misses += 1
+
+    def snapshot(self) -> ProbeSnapshot:
+        """
+        Copy the current metrics.
+
+        Returns:
+            ProbeSnapshot: The probe's metrics
+        """
+        return ProbeSnapshot(
+            name=self.name,
+            calls=self.calls,
+            errors=self.errors,
+            total_seconds=self.total_ns / 1e9,
+            buckets=tuple(self.buckets),
+            cache_hits=self.hits,
+            cache_misses=self.misses,
+        )
+
+
+_enabled = False
+_probes: Dict[str, Probe] = {}
+_toggle_callbacks: List[Callable[[bool], None]] = []
+
+
+def probe(name: str) -> Probe:
+    """
+    Get or create the probe registered under ``name``.
+
+    Args:
+        name: Dotted metric name
+
+    Returns:
+        Probe: The registered probe
+    """
+    if name not in _probes:
+        _probes[name] = Probe(name)
+    return _probes[name]
+
+
+def on_toggle(callback: Callable[[bool], None]) -> None:
+    """
+    Call ``callback`` with the new state whenever instrumentation is toggled.
+
+    For hooks that cannot check ``Probe.active`` cheaply (e.g. installing a
+    wrapper only while enabled). The callback is also called right away with
+    the current state.
+
+    Args:
+        callback: Function receiving True when enabled and False when disabled
+    """
+    _toggle_callbacks.append(callback)
+    callback(_enabled)
+
+
+def _set_enabled(enabled: bool) -> None:
+    global _enabled
+    _enabled = enabled
+    for p in _probes.values():
+        p.active = enabled
+    for callback in _toggle_callbacks:
+        callback(enabled)
+
+
+def enable() -> None:
+    """Turn instrumentation on for every probe."""
+    _set_enabled(True)
+
+
+def disable() -> None:
+    """Turn instrumentation off for every probe; collected metrics are kept."""
+    _set_enabled(False)
+
+
+def is_enabled() -> bool:
+    """
+    Check whether instrumentation is on.
+
+    Returns:
+        bool: True if probes are collecting metrics
+    """
+    return _enabled
+
+
+def reset() -> None:
+    """Clear the metrics of every probe."""
+    for p in _probes.values():
+        p.reset()
+
+
+def snapshot() -> List[ProbeSnapshot]:
+    """
+    Copy the metrics of every probe that has recorded something.
+
+    Returns:
+        list[ProbeSnapshot]: Snapshots sorted by probe name
+    """
+    return [
+        p.snapshot()
+        for name, p in sorted(_probes.items())
+        if p.calls or p.hits or p.misses
+    ]
+
+
+class MetricsSink(Protocol):
+    """Destination for exported metrics."""
+
+    def export(self, snapshots: List[ProbeSnapshot]) -> None: ...
+
+
+class InMemorySink:
+    """Sink that keeps every export in memory, mostly useful for tests."""
+
+    def __init__(self) -> None:
+        self.exports: List[List[ProbeSnapshot]] = []
+
+    def export(self, snapshots: List[ProbeSnapshot]) -> None:
+        self.exports.append(snapshots)
+
+    @property
+    def latest(self) -> Dict[str, ProbeSnapshot]:
+        """The most recent export, keyed by probe name."""
+        return {s.name: s for s in self.exports[-1]} if self.exports else {}
+
+
+class LoggingSink:
+    """
+    Sink that logs one line per probe.
+
+    Args:
+        logger: Logger to write to (defaults to "spryx_core.instrumentation")
+        level: Logging level used for the lines
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO) -> None:
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def export(self, snapshots: List[ProbeSnapshot]) -> None:
+        for s in snapshots:
+            avg_us = s.total_seconds / s.calls * 1e6 if s.calls else 0.0
+            ratio = s.cache_hit_ratio
+            self.logger.log(
+                self.level,
+                "%s calls=%d errors=%d avg_us=%.2f cache_hit_ratio=%s",
+                s.name,
+                s.calls,
+                s.errors,
+                avg_us,
+                "n/a" if ratio is None else f"{ratio:.3f}",
+            )
+
+
+def _metric_name(name: str) -> str:
+    return "spryx_core_" + name.replace(".", "_")
+
+
+def prometheus_text(snapshots: List[ProbeSnapshot]) -> str:
+    """
+    Render snapshots in the Prometheus text exposition format.
+
+    Args:
+        snapshots: Snapshots to render
+
+    Returns:
+        str: The metrics text
+    """
+    lines: List[str] = []
+    for s in snapshots:
+        metric = _metric_name(s.name)
+        if s.calls:
+            lines.append(f"# TYPE {metric}_seconds histogram")
+            cumulative = 0
+            for bound, count in zip(DEFAULT_BUCKETS, s.buckets):
+                cumulative += count
+                lines.append(f'{metric}_seconds_bucket{{le="{bound:g}"}} {cumulative}')
+            lines.append(f'{metric}_seconds_bucket{{le="+Inf"}} {s.calls}')
+            lines.append(f"{metric}_seconds_sum {s.total_seconds:.9f}")
+            lines.append(f"{metric}_seconds_count {s.calls}")
+            lines.append(f"# TYPE {metric}_errors_total counter")
+            lines.append(f"{metric}_errors_total {s.errors}")
+        if s.cache_hits or s.cache_misses:
+            lines.append(f"# TYPE {metric}_cache_hits_total counter")
+            lines.append(f"{metric}_cache_hits_total {s.cache_hits}")
+            lines.append(f"# TYPE {metric}_cache_misses_total counter")
+            lines.append(f"{metric}_cache_misses_total {s.cache_misses}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+class PrometheusTextSink:
+    """Sink that keeps the last export rendered in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        self.text = ""
+
+    def export(self, snapshots: List[ProbeSnapshot]) -> None:
+        self.text = prometheus_text(snapshots)
+
+
+def export(sink: MetricsSink) -> None:
+    """
+    Export the current metrics of every probe to ``sink``.
+
+    Args:
+        sink: Destination for the metrics
+    """
+    sink.export(snapshot())
@@ -5,30 +5,89 @@ This module provides standardized models for implementing and handling paginated
 results in APIs and data retrieval operations.
 """
 
-from typing import Generic, List, Literal, Optional, TypeAlias, TypeVar
+import array
+import struct
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    Hashable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    TypeAlias,
+    TypeVar,
+    Union,
+)
+from urllib.parse import parse_qsl
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import (
+    BaseModel,
+    Field,
+    computed_field,
+    field_serializer,
+    model_validator,
+)
+
+from spryx_core import instrumentation, serialization
+from spryx_core.id import (
+    EntityId,
+    entity_id_from_int,
+    entity_id_timestamp,
+    entity_id_to_int,
+    min_entity_id,
+)
 
 T = TypeVar("T")
 SortOrder: TypeAlias = Literal["asc", "desc"]
 
+_COLUMNAR_MAGIC = b"SPXP"
+_HEADER_LENGTH = struct.Struct("<I")
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+# Numeric array typecodes; unicode arrays are written as JSON
+_RAW_TYPECODES = frozenset(array.typecodes) - {"u", "w"}
+
+_DUMP_JSON_PROBE = instrumentation.probe("pagination.page.model_dump_json")
+
 
-class Page(BaseModel, Generic[T]):
+class _PageNavigation(BaseModel):
     """
-    Generic pagination model that can be used for any type of paginated data.
+    Navigation fields computed from the pagination metadata.
 
-    This model represents a paginated response with metadata about the pagination
-    state and the actual items for the current page.
+    Subclasses declare ``page``, ``page_size``, ``total`` and ``has_more``
+    themselves so each keeps its own field order.
     """
 
-    items: List[T] = Field(..., description="The items in the current page of results")
-    page: int = Field(..., description="Current page number (1-based)", ge=1)
-    page_size: int = Field(..., description="Number of items per page", gt=0)
-    total: int = Field(..., description="Total number of items across all pages", ge=0)
+    if TYPE_CHECKING:
+        page: int
+        page_size: int
+        total: Optional[int]
+        has_more: Optional[bool]
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        # A wrap model_serializer would also cover nested pages, but it makes
+        # pydantic-core build an intermediate dict even while disabled
+        if _DUMP_JSON_PROBE.active:
+            return _DUMP_JSON_PROBE.observe(BaseModel.model_dump_json, self, **kwargs)
+        return BaseModel.model_dump_json(self, **kwargs)
 
     @computed_field
-    def total_pages(self) -> int:
-        """Calculate the total number of pages."""
+    def total_pages(self) -> Optional[int]:
+        """Calculate the total number of pages, if the total is known."""
+        if self.total is None:
+            return None
         if self.page_size == 0:
             return 0
         return (self.total + self.page_size - 1) // self.page_size
@@ -41,6 +100,10 @@ class Page(BaseModel, Generic[T]):
     @computed_field
     def has_next(self) -> bool:
         """Check if there is a next page available."""
+        if self.has_more is not None:
+            return self.has_more
+        if self.total is None:
+            return False
         return self.page < self.total_pages
 
     @computed_field
@@ -54,7 +117,707 @@ class Page(BaseModel, Generic[T]):
         return self.page - 1 if self.has_previous else None
 
 
+class Page(_PageNavigation, Generic[T]):
+    """
+    Generic pagination model that can be used for any type of paginated data.
+
+    This model represents a paginated response with metadata about the pagination
+    state and the actual items for the current page.
+
+    When ``total`` is not known (the count was skipped), navigation relies on
+    ``has_more`` instead, which is typically obtained by over-fetching one row
+    (see ``Page.from_overfetch``).
+    """
+
+    items: List[T] = Field(..., description="The items in the current page of results")
+    page: int = Field(..., description="Current page number (1-based)", ge=1)
+    page_size: int = Field(..., description="Number of items per page", gt=0)
+    total: Optional[int] = Field(
+        None, description="Total number of items across all pages, if counted", ge=0
+    )
+    is_estimate: bool = Field(
+        False, description="Whether total is an estimate rather than an exact count"
+    )
+    has_more: Optional[bool] = Field(
+        None, description="Whether more items exist after this page, if known"
+    )
+
+    @classmethod
+    def from_count(
+        cls, items: Sequence[T], *, page: int, page_size: int, count: "TotalCount"
+    ) -> "Page[T]":
+        """
+        Build a page from its items and the result of a count provider.
+
+        Args:
+            items: The items in the current page
+            page: Current page number (1-based)
+            page_size: Number of items per page
+            count: Total count returned by a ``CountProvider``
+
+        Returns:
+            Page: The page, flagged with ``is_estimate`` when applicable
+        """
+        return cls(
+            items=list(items),
+            page=page,
+            page_size=page_size,
+            total=count.value,
+            is_estimate=count.is_estimate,
+        )
+
+    @classmethod
+    def from_overfetch(cls, rows: Sequence[T], *, page: int, page_size: int) -> "Page[T]":
+        """
+        Build an uncounted page from a query that fetched ``page_size + 1`` rows.
+
+        The extra row is only used to detect whether a next page exists and is
+        dropped from the returned items.
+
+        Args:
+            rows: Up to ``page_size + 1`` rows fetched for the current page
+            page: Current page number (1-based)
+            page_size: Number of items per page
+
+        Returns:
+            Page: A page with ``total`` unset and ``has_more`` filled in
+        """
+        return cls(
+            items=list(rows[:page_size]),
+            page=page,
+            page_size=page_size,
+            has_more=len(rows) > page_size,
+        )
+
+
+def _column_to_list(column: Any) -> List[Any]:
+    """Convert a column (list, tuple, ``array.array`` or NumPy array) to a list."""
+    if isinstance(column, list):
+        return column
+    tolist = getattr(column, "tolist", None)
+    return tolist() if tolist is not None else list(column)
+
+
+def _raw_column(column: Any) -> Optional[Tuple[str, bytes]]:
+    """Return the array typecode and little-endian bytes of a numeric column."""
+    if isinstance(column, array.array):
+        typecode = column.typecode
+    else:
+        dtype = getattr(column, "dtype", None)
+        typecode = getattr(dtype, "char", None)
+        if (
+            typecode not in _RAW_TYPECODES
+            or not dtype.isnative
+            or dtype.itemsize != array.array(typecode).itemsize
+        ):
+            return None
+        column = array.array(typecode, column.tobytes())
+    if typecode not in _RAW_TYPECODES:
+        return None
+    if not _NATIVE_LITTLE_ENDIAN:
+        column = array.array(typecode, column)
+        column.byteswap()
+    return typecode, column.tobytes()
+
+
+class ColumnarPage(_PageNavigation):
+    """
+    Page whose items are stored as columns rather than as one object per row.
+
+    Each column holds one value per item, as a list, tuple, ``array.array`` or
+    NumPy array. Columns are neither copied nor validated element by element,
+    so building and dumping a page of thousands of rows costs a handful of
+    list conversions instead of one model or dict per row. The pagination
+    metadata and navigation fields are those of ``Page``.
+
+    JSON dumps are column-oriented (``{"columns": {"id": [...], ...}, ...}``);
+    ``to_bytes`` writes numeric columns as raw arrays instead.
+    """
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    columns: Dict[str, Any] = Field(
+        ..., description="Item values by column name, one value per item"
+    )
+    page: int = Field(..., description="Current page number (1-based)", ge=1)
+    page_size: int = Field(..., description="Number of items per page", gt=0)
+    total: Optional[int] = Field(
+        None, description="Total number of items across all pages, if counted", ge=0
+    )
+    is_estimate: bool = Field(
+        False, description="Whether total is an estimate rather than an exact count"
+    )
+    has_more: Optional[bool] = Field(
+        None, description="Whether more items exist after this page, if known"
+    )
+
+    @model_validator(mode="after")
+    def _check_columns(self) -> "ColumnarPage":
+        """Validate that every column has the same length."""
+        lengths = {len(column) for column in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        return self
+
+    @field_serializer("columns")
+    def _serialize_columns(self, columns: Dict[str, Any]) -> Dict[str, List[Any]]:
+        return {name: _column_to_list(column) for name, column in columns.items()}
+
+    @property
+    def num_rows(self) -> int:
+        """Number of items in the page."""
+        for column in self.columns.values():
+            return len(column)
+        return 0
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """
+        Build the item at ``index`` as a dict.
+
+        Args:
+            index: Position of the item in the page
+
+        Returns:
+            dict: The item's value for every column
+        """
+        return {name: column[index] for name, column in self.columns.items()}
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the items as dicts, building each one on demand."""
+        names = list(self.columns)
+        for values in zip(*self.columns.values()):
+            yield dict(zip(names, values))
+
+    @classmethod
+    def from_page(
+        cls, page: Page[Any], columns: Optional[Sequence[str]] = None
+    ) -> "ColumnarPage":
+        """
+        Build a columnar page from a row-based page.
+
+        Args:
+            page: Page whose items are mappings or models
+            columns: Column names to extract; defaults to the keys (or fields)
+                of the first item
+
+        Returns:
+            ColumnarPage: The page with the same metadata
+        """
+        items = [
+            item.model_dump() if isinstance(item, BaseModel) else item
+            for item in page.items
+        ]
+        if columns is None:
+            columns = list(items[0]) if items else []
+        return cls(
+            columns={name: [item[name] for item in items] for name in columns},
+            page=page.page,
+            page_size=page.page_size,
+            total=page.total,
+            is_estimate=page.is_estimate,
+            has_more=page.has_more,
+        )
+
+    def to_page(self) -> Page[Dict[str, Any]]:
+        """
+        Convert to a row-based page of dicts.
+
+        Returns:
+            Page: The page with the same metadata
+        """
+        return Page[Dict[str, Any]](
+            items=list(self.rows()),
+            page=self.page,
+            page_size=self.page_size,
+            total=self.total,
+            is_estimate=self.is_estimate,
+            has_more=self.has_more,
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Encode the page in the binary columnar form.
+
+        The layout is a 4-byte magic, a 4-byte little-endian header length and
+        a JSON header with the metadata and column descriptions, followed by
+        the column payloads. ``array.array`` and numeric NumPy columns are
+        stored as raw little-endian values; other columns as JSON lists.
+
+        Returns:
+            bytes: The encoded page
+        """
+        specs = []
+        payloads = []
+        for name, column in self.columns.items():
+            raw = _raw_column(column)
+            if raw is None:
+                data = serialization.dumps(_column_to_list(column))
+                specs.append({"name": name, "type": "json", "size": len(data)})
+            else:
+                typecode, data = raw
+                itemsize = array.array(typecode).itemsize
+                specs.append(
+                    {
+                        "name": name,
+                        "type": typecode,
+                        "itemsize": itemsize,
+                        "size": len(data),
+                    }
+                )
+            payloads.append(data)
+        header = serialization.dumps(
+            {
+                "page": self.page,
+                "page_size": self.page_size,
+                "total": self.total,
+                "is_estimate": self.is_estimate,
+                "has_more": self.has_more,
+                "columns": specs,
+            }
+        )
+        return b"".join(
+            [_COLUMNAR_MAGIC, _HEADER_LENGTH.pack(len(header)), header, *payloads]
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ColumnarPage":
+        """
+        Decode a page produced by ``to_bytes``.
+
+        Raw columns are returned as ``array.array`` objects and JSON columns
+        as lists.
+
+        Args:
+            data: The encoded page
+
+        Returns:
+            ColumnarPage: The decoded page
+
+        Raises:
+            ValueError: If the data is not an encoded columnar page
+        """
+        view = memoryview(data)
+        if bytes(view[:4]) != _COLUMNAR_MAGIC or len(view) < 8:
+            raise ValueError("Not an encoded columnar page")
+        (header_size,) = _HEADER_LENGTH.unpack_from(view, 4)
+        offset = 8 + header_size
+        header = serialization.loads(bytes(view[8:offset]))
+        columns: Dict[str, Any] = {}
+        for spec in header.pop("columns"):
+            chunk = view[offset : offset + spec["size"]]
+            offset += spec["size"]
+            if len(chunk) != spec["size"]:
+                raise ValueError("Truncated columnar page")
+            if spec["type"] == "json":
+                columns[spec["name"]] = serialization.loads(bytes(chunk))
+            else:
+                column = array.array(spec["type"])
+                if column.itemsize != spec["itemsize"]:
+                    raise ValueError(
+                        f"Column '{spec['name']}' holds {spec['itemsize']}-byte"
+                        f" '{spec['type']}' values, unsupported on this platform"
+                    )
+                column.frombytes(chunk)
+                if not _NATIVE_LITTLE_ENDIAN:
+                    column.byteswap()
+                columns[spec["name"]] = column
+        if offset != len(view):
+            raise ValueError("Trailing data after columnar page")
+        return cls(columns=columns, **header)
+
+
+def _parse_query(raw: str) -> Dict[str, str]:
+    """Parse a query string like ``dict(parse_qsl(raw, keep_blank_values=True))``."""
+    raw = raw.lstrip("?")
+    if "%" in raw or "+" in raw:
+        return dict(parse_qsl(raw, keep_blank_values=True))
+    data = {}
+    for field in raw.split("&"):
+        if field:
+            name, _, value = field.partition("=")
+            data[name] = value
+    return data
+
+
 class PageFilter(BaseModel):
     page: int = Field(default=1, gt=0)
     limit: int = Field(default=10, gt=0, le=100)
     order: SortOrder = Field(default="asc")
+
+    _query_cache: ClassVar[Dict[Tuple[type, str], "PageFilter"]] = {}
+    _query_cache_size: ClassVar[int] = 1024
+    _query_probe: ClassVar = instrumentation.probe("pagination.page_filter.from_query")
+
+    @classmethod
+    def from_query(cls, raw: Union[str, Mapping[str, Any]]) -> "PageFilter":
+        """
+        Build a filter from a raw query string or an already parsed mapping.
+
+        Query strings are split without the general-purpose ``parse_qsl`` when
+        they need no decoding, and the validated filters of recently seen query
+        strings are cached, so repeated queries get a shallow copy of the cached
+        filter without parsing. Values
+        are always validated by the model itself, so accepted inputs and error
+        messages are exactly those of ``PageFilter.model_validate``.
+
+        Args:
+            raw: Query string such as "page=2&limit=20&order=desc" (an optional
+                leading "?" is ignored) or a mapping of query parameters
+
+        Returns:
+            PageFilter: The validated filter
+
+        Raises:
+            ValidationError: If a value is invalid
+        """
+        if not isinstance(raw, str):
+            return cls.model_validate(raw)
+
+        cache = cls._query_cache
+        cached = cache.get((cls, raw))
+        if cached is not None:
+            cls._query_probe.hit()
+            return cached.model_copy()
+        cls._query_probe.miss()
+
+        result = cls.model_validate(_parse_query(raw))
+        if len(cache) >= cls._query_cache_size:
+            cache.pop(next(iter(cache), None), None)
+        cache[(cls, raw)] = result
+        return result.model_copy()
+
+
+class TotalCount(NamedTuple):
+    """Result of a count provider: the total and whether it is an estimate."""
+
+    value: int
+    is_estimate: bool = False
+
+
+class CountProvider(Protocol):
+    """Anything able to return the total number of items matching a filter key."""
+
+    def count(self, key: Hashable) -> TotalCount: ...
+
+
+class ExactCount:
+    """
+    Count provider that runs the exact count on every call.
+
+    Args:
+        source: Callable returning the exact number of items for a filter key
+    """
+
+    __slots__ = ("_source",)
+
+    def __init__(self, source: Callable[[Hashable], int]) -> None:
+        self._source = source
+
+    def count(self, key: Hashable) -> TotalCount:
+        """Return the exact total for ``key``."""
+        return TotalCount(self._source(key))
+
+
+class CachedCount:
+    """
+    Count provider that caches exact counts per filter key for a limited time.
+
+    Args:
+        source: Callable returning the exact number of items for a filter key
+        ttl: Seconds a cached count stays valid
+        maxsize: Maximum number of filter keys kept in the cache
+        clock: Monotonic clock used to expire entries
+    """
+
+    def __init__(
+        self,
+        source: Callable[[Hashable], int],
+        *,
+        ttl: float = 60.0,
+        maxsize: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._source = source
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._clock = clock
+        self._cache: Dict[Hashable, Tuple[TotalCount, float]] = {}
+        self._probe = instrumentation.probe("pagination.cached_count")
+
+    def count(self, key: Hashable) -> TotalCount:
+        """Return the cached total for ``key``, counting again once it expired."""
+        now = self._clock()
+        entry = self._cache.get(key)
+        if entry is not None and entry[1] > now:
+            self._probe.hit()
+            return entry[0]
+
+        self._probe.miss()
+        result = TotalCount(self._source(key))
+        self._cache.pop(key, None)
+        if len(self._cache) >= self._maxsize:
+            # Oldest insertion first; dicts keep insertion order. pop() instead
+            # of del so concurrent evictions of the same key do not fail
+            self._cache.pop(next(iter(self._cache), None), None)
+        self._cache[key] = (result, now + self._ttl)
+        return result
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drop cached counts.
+
+        Args:
+            key: The filter key to drop; drops every key when None
+        """
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+
+class EstimatedCount:
+    """
+    Count provider that returns a cheap estimate (e.g. from planner statistics).
+
+    Small estimates are unreliable and cheap to count exactly, so when an exact
+    source is given, estimates below ``exact_below`` are replaced by an exact count.
+
+    Args:
+        estimator: Callable returning an estimated number of items for a filter key
+        exact: Optional callable returning the exact number of items
+        exact_below: Estimates below this value are counted exactly
+    """
+
+    __slots__ = ("_estimator", "_exact", "_exact_below")
+
+    def __init__(
+        self,
+        estimator: Callable[[Hashable], int],
+        *,
+        exact: Optional[Callable[[Hashable], int]] = None,
+        exact_below: int = 0,
+    ) -> None:
+        self._estimator = estimator
+        self._exact = exact
+        self._exact_below = exact_below
+
+    def count(self, key: Hashable) -> TotalCount:
+        """Return the estimated total for ``key``."""
+        estimate = max(int(self._estimator(key)), 0)
+        if self._exact is not None and estimate < self._exact_below:
+            return TotalCount(self._exact(key))
+        return TotalCount(estimate, is_estimate=True)
+
+
+class Watermark(BaseModel):
+    """
+    Change-feed cursor: the last change a consumer has fully processed.
+
+    Changes are identified by ULIDs generated when they are written, so their
+    order is the order of the IDs and "everything after the watermark" is a
+    plain ``id > last_id`` range scan. An empty watermark (``last_id`` unset)
+    starts from the beginning of the collection.
+
+    ULIDs are generated before their writes commit, so a change can become
+    visible after later IDs were already consumed. Consumers that must not
+    miss such stragglers can re-read a short window with ``rewind`` and
+    process changes idempotently.
+    """
+
+    model_config = {"frozen": True}
+
+    last_id: Optional[EntityId] = Field(
+        None, description="ULID of the last processed change"
+    )
+    timestamp: Optional[datetime] = Field(
+        None, description="Timestamp of the last processed change"
+    )
+
+    @classmethod
+    def after(cls, entity_id: str) -> "Watermark":
+        """
+        Build the watermark that follows a change.
+
+        Args:
+            entity_id: ULID of the change
+
+        Returns:
+            Watermark: The watermark, timestamped from the ULID
+
+        Raises:
+            ValueError: If the value is not a valid ULID
+        """
+        return cls(last_id=entity_id, timestamp=entity_id_timestamp(entity_id))
+
+    @classmethod
+    def at(cls, dt: datetime) -> "Watermark":
+        """
+        Build a watermark that selects every change made at or after ``dt``.
+
+        Args:
+            dt: The datetime to start from
+
+        Returns:
+            Watermark: The watermark just before the first ULID of ``dt``
+        """
+        first = entity_id_to_int(min_entity_id(dt))
+        return cls(last_id=entity_id_from_int(max(first - 1, 0)), timestamp=dt)
+
+    def rewind(self, delta: timedelta) -> "Watermark":
+        """
+        Move the watermark back in time, to re-read recent changes.
+
+        Args:
+            delta: How far back to move
+
+        Returns:
+            Watermark: The earlier watermark (unchanged if empty)
+        """
+        if self.last_id is None:
+            return self
+        return Watermark.at(entity_id_timestamp(self.last_id) - delta)
+
+    def includes(self, entity_id: str) -> bool:
+        """
+        Check whether a change comes after the watermark.
+
+        Args:
+            entity_id: ULID of the change
+
+        Returns:
+            bool: True if the change has not been processed yet
+        """
+        return self.last_id is None or entity_id > self.last_id
+
+    def since_clause(
+        self, column: str = "id", placeholder: str = "%s"
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        """
+        Build a SQL predicate selecting the changes after the watermark.
+
+        Args:
+            column: Name of the ULID column
+            placeholder: Parameter placeholder of the database driver
+
+        Returns:
+            tuple: The predicate and its parameters, e.g. ``("id > %s", (id,))``
+        """
+        if self.last_id is None:
+            return "TRUE", ()
+        return f"{column} > {placeholder}", (self.last_id,)
+
+
+class ChangeSource(Protocol[T]):
+    """Collection able to return its changes after a watermark, in ULID order."""
+
+    def fetch_since(self, watermark: Watermark, limit: int) -> Sequence[T]: ...
+
+
+class WatermarkStore(Protocol):
+    """Durable storage for the watermarks of named change feeds."""
+
+    def load(self, feed: str) -> Optional[Watermark]: ...
+
+    def save(self, feed: str, watermark: Watermark) -> None: ...
+
+
+class InMemoryWatermarkStore:
+    """Watermark store kept in a dict, for tests and single-process consumers."""
+
+    def __init__(self) -> None:
+        self.watermarks: Dict[str, Watermark] = {}
+
+    def load(self, feed: str) -> Optional[Watermark]:
+        return self.watermarks.get(feed)
+
+    def save(self, feed: str, watermark: Watermark) -> None:
+        self.watermarks[feed] = watermark
+
+
+def _change_id(item: Any) -> str:
+    """Return the ULID of a change given as a mapping or an object."""
+    if isinstance(item, Mapping):
+        return item["id"]
+    return item.id
+
+
+class ChangeFeed(Generic[T]):
+    """
+    Consumer that streams the changes of a source after a stored watermark.
+
+    Changes are fetched in batches of ``batch_size``. The watermark is saved
+    after a batch has been fully processed (when the consumer asks for the next
+    one), so a consumer that crashes mid-batch receives that batch again when
+    it restarts: delivery is at least once, and the cost of a sync depends on
+    the number of new changes, not on the size of the collection.
+
+    Args:
+        name: Feed name under which the watermark is stored
+        source: Source of changes
+        store: Storage for the watermark
+        batch_size: Maximum number of changes per batch
+        id_of: Function returning the ULID of a change (defaults to its "id"
+            key or attribute)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        source: ChangeSource[T],
+        store: WatermarkStore,
+        *,
+        batch_size: int = 500,
+        id_of: Callable[[T], str] = _change_id,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self.name = name
+        self.source = source
+        self.store = store
+        self.batch_size = batch_size
+        self.id_of = id_of
+
+    @property
+    def watermark(self) -> Watermark:
+        """The stored watermark, or an empty one for a new feed."""
+        return self.store.load(self.name) or Watermark()
+
+    def batches(self) -> Iterator[List[T]]:
+        """
+        Iterate over batches of new changes until the source is drained.
+
+        Returns:
+            Iterator: Lists of changes in ULID order
+        """
+        watermark = self.watermark
+        while True:
+            batch = [
+                change
+                for change in self.source.fetch_since(watermark, self.batch_size)
+                if watermark.includes(self.id_of(change))
+            ]
+            if not batch:
+                return
+            yield batch
+            watermark = Watermark.after(max(self.id_of(change) for change in batch))
+            self.store.save(self.name, watermark)
+
+    def __iter__(self) -> Iterator[T]:
+        for batch in self.batches():
+            yield from batch
+
+    def sync(self, handler: Callable[[List[T]], Any]) -> int:
+        """
+        Pass every new change to ``handler``, one batch at a time.
+
+        Args:
+            handler: Function processing a batch of changes
+
+        Returns:
+            int: Number of changes processed
+        """
+        processed = 0
+        for batch in self.batches():
+            handler(batch)
+            processed += len(batch)
+        return processed
@@ -6,7 +6,15 @@ token claims, and related utilities.
 """
 
 from spryx_core.security.claims import AccessToken
+from spryx_core.security.codec import decode_access_token, encode_access_token
+from spryx_core.security.revocation import RevocationStore
+from spryx_core.security.scopes import ScopeRegistry, register_scope_registry
 
 __all__ = [
     "AccessToken",
+    "RevocationStore",
+    "ScopeRegistry",
+    "decode_access_token",
+    "encode_access_token",
+    "register_scope_registry",
 ]
@@ -1,12 +1,112 @@
+from concurrent.futures import Executor
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from functools import partial
+from itertools import repeat
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
 from zoneinfo import ZoneInfo
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    Field,
+    ValidationError,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    ValidationInfo,
+    model_serializer,
+    model_validator,
+)
+
+from spryx_core import instrumentation
+from spryx_core.security.scopes import get_scope_registry
 
 UTC = ZoneInfo("UTC")
 
+_VALIDATE_PROBE = instrumentation.probe("security.access_token.validate")
+_VALIDATE_MANY_PROBE = instrumentation.probe("security.access_token.validate_many")
+
+# Validation context key overriding the clock used by the expiry check
+NOW_CONTEXT_KEY = "now"
+
+_H = TypeVar("_H", bound=Hashable)
+
+
+class InternPool(Generic[_H]):
+    """
+    Bounded pool that shares identical immutable values.
+
+    Claims such as issuers, role ids and scope sets repeat across most tokens;
+    interning them lets cached tokens reference one shared object instead of
+    holding their own copy. Once the pool is full, new values are returned
+    as-is so the pool never grows past ``maxsize``.
+
+    Args:
+        maxsize: Maximum number of distinct values kept in the pool
+    """
+
+    __slots__ = ("maxsize", "_values", "_probe")
+
+    def __init__(self, maxsize: int = 65_536) -> None:
+        self.maxsize = maxsize
+        self._values: Dict[_H, _H] = {}
+        self._probe = instrumentation.probe("security.claims.intern")
+
+    def intern(self, value: _H) -> _H:
+        """
+        Return the pooled instance equal to ``value``, pooling it if possible.
+
+        Args:
+            value: The value to intern
+
+        Returns:
+            The shared instance, or ``value`` itself when it is new
+        """
+        existing = self._values.get(value)
+        if existing is not None:
+            self._probe.hit()
+            return existing
+        self._probe.miss()
+        if len(self._values) < self.maxsize:
+            self._values[value] = value
+        return value
+
+    def clear(self) -> None:
+        """Drop every pooled value."""
+        self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+# Pool shared by every claim model
+INTERN_POOL: InternPool[Any] = InternPool()
+
+
+def _intern_str(value: str) -> str:
+    return INTERN_POOL.intern(value)
+
+
+def _intern_scopes(scopes: tuple[str, ...]) -> tuple[str, ...]:
+    return INTERN_POOL.intern(tuple(INTERN_POOL.intern(scope) for scope in scopes))
+
+
+# Claim types whose values are shared through INTERN_POOL
+InternedStr = Annotated[str, AfterValidator(_intern_str)]
+Scopes = Annotated[tuple[str, ...], AfterValidator(_intern_scopes)]
+
 
 class _CoreModel(BaseModel):
     """Shared Pydantic config for core models."""
@@ -29,23 +129,119 @@ class Meta(_CoreModel):
     sid: str | None = None
 
 
-class PltContext(_CoreModel):
-    role_id: str
-    scopes: list[str]
+class _ScopedContext(_CoreModel):
+    """
+    Base for contexts granting scopes.
+
+    Scopes are carried as plain names in ``scopes`` and, for compact tokens,
+    as a bitset in ``scope_bits`` indexed by the registry named in
+    ``scope_reg`` (see ``spryx_core.security.scopes``). Names the registry does
+    not know stay in ``scopes``. Subclasses declare the three fields so each
+    keeps its own field order.
+    """
+
+    if TYPE_CHECKING:
+        scopes: tuple[str, ...]
+        scope_bits: Optional[int]
+        scope_reg: Optional[str]
+
+    @model_validator(mode="after")
+    def _check_scope_bits(self):
+        """Validate that the bitset comes with a published registry that covers it."""
+        if (self.scope_bits is None) != (self.scope_reg is None):
+            raise ValueError("scope_bits and scope_reg must be given together")
+        if self.scope_bits is not None:
+            try:
+                registry = get_scope_registry(self.scope_reg)
+            except KeyError:
+                raise ValueError(f"Unknown scope registry '{self.scope_reg}'") from None
+            if self.scope_bits >> len(registry):
+                raise ValueError(
+                    f"scope_bits exceed the {len(registry)} scopes of '{self.scope_reg}'"
+                )
+        return self
+
+    @model_serializer(mode="wrap")
+    def _omit_unset_bits(
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ):
+        """Keep the claims of tokens without a bitset unchanged."""
+        # No return annotation: one would replace the serialization JSON schema
+        data = handler(self)
+        if self.scope_bits is None:
+            data.pop("scope_bits", None)
+            data.pop("scope_reg", None)
+        return data
 
+    @property
+    def scope_names(self) -> tuple[str, ...]:
+        """All granted scope names, expanded from the bitset by its registry."""
+        if self.scope_bits is None:
+            return self.scopes
+        return get_scope_registry(self.scope_reg).decode(self.scope_bits) + self.scopes
 
-class OrgContext(_CoreModel):
+    def has_scope(self, scope: str) -> bool:
+        """
+        Check whether a scope is granted.
+
+        Args:
+            scope: The scope name
+
+        Returns:
+            bool: True if the scope is granted
+        """
+        return self.has_scopes((scope,))
+
+    def has_scopes(self, scopes: Iterable[str]) -> bool:
+        """
+        Check whether every given scope is granted.
+
+        Registered scopes are checked with a single bitwise test against
+        ``scope_bits``; unregistered names, and registered names an issuer
+        listed in ``scopes`` instead of setting their bit, are looked up in
+        ``scopes``.
+
+        Args:
+            scopes: The required scope names
+
+        Returns:
+            bool: True if all scopes are granted
+
+        Raises:
+            KeyError: If the registry was never published (only possible for
+                contexts built without validation, e.g. with model_construct)
+        """
+        if self.scope_bits is None:
+            return all(scope in self.scopes for scope in scopes)
+        registry = get_scope_registry(self.scope_reg)
+        required, rest = registry.encode(scopes)
+        missing = required & ~self.scope_bits
+        if missing:
+            rest = registry.decode(missing) + rest
+        return all(scope in self.scopes for scope in rest)
+
+
+class PltContext(_ScopedContext):
+    role_id: InternedStr
+    scopes: Scopes = ()
+    scope_bits: Optional[int] = Field(None, ge=0)
+    scope_reg: Optional[InternedStr] = None
+
+
+class OrgContext(_ScopedContext):
     id: str
-    role_id: str
-    status: Optional[str] = None
-    scopes: list[str]
+    role_id: InternedStr
+    status: Optional[InternedStr] = None
+    scopes: Scopes = ()
+    scope_bits: Optional[int] = Field(None, ge=0)
+    scope_reg: Optional[InternedStr] = None
 
 
 class AccessToken(_CoreModel):
     # Registered
-    iss: str
+    iss: InternedStr
     sub: str
-    aud: str | list[str]
+    aud: InternedStr | list[InternedStr]
     iat: datetime
     exp: datetime
     nbf: datetime | None = None
@@ -57,9 +253,125 @@ class AccessToken(_CoreModel):
     plt_context: PltContext | None = None
     org_context: OrgContext | None = None
 
+    @classmethod
+    def validate_many(
+        cls,
+        payloads: Iterable[Any],
+        *,
+        now: Optional[datetime] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = 1000,
+    ) -> List["AccessToken | ValidationError"]:
+        """
+        Validate a batch of claim payloads without stopping at the first failure.
+
+        The clock is read once for the whole batch, and every payload goes
+        through the model's compiled validator directly.
+
+        Args:
+            payloads: Claim payloads (dicts or objects accepted by model_validate)
+            now: Time used for the expiry check (defaults to the current time;
+                naive values are taken as UTC)
+            executor: Optional thread or process pool used to validate chunks
+                of large batches in parallel
+            chunk_size: Number of payloads per chunk sent to the executor
+
+        Returns:
+            list: For each payload, the validated token or its ValidationError
+        """
+        if _VALIDATE_MANY_PROBE.active:
+            return _VALIDATE_MANY_PROBE.observe(
+                cls._validate_many, payloads, now, executor, chunk_size
+            )
+        return cls._validate_many(payloads, now, executor, chunk_size)
+
+    @classmethod
+    def _validate_many(
+        cls,
+        payloads: Iterable[Any],
+        now: Optional[datetime],
+        executor: Optional[Executor],
+        chunk_size: int,
+    ) -> List["AccessToken | ValidationError"]:
+        payloads = list(payloads)
+        if now is None:
+            now = datetime.now(UTC)
+        elif now.tzinfo is None:
+            # Naive times are UTC, as for exp; comparing them with aware
+            # claims would raise TypeError and abort the whole batch
+            now = now.replace(tzinfo=UTC)
+        if executor is None or len(payloads) <= chunk_size:
+            return _validate_chunk(cls, payloads, now)
+
+        chunks = [
+            payloads[i : i + chunk_size] for i in range(0, len(payloads), chunk_size)
+        ]
+        results: List[AccessToken | ValidationError] = []
+        for chunk_results in executor.map(
+            _validate_chunk, repeat(cls), chunks, repeat(now)
+        ):
+            results.extend(chunk_results)
+        return results
+
     @model_validator(mode="after")
-    def _check_exp(self):
+    def _check_exp(self, info: ValidationInfo):
         """Validate that the token hasn't expired."""
-        if self.exp < datetime.now(UTC):
+        now = info.context.get(NOW_CONTEXT_KEY) if info.context else None
+        exp = self.exp
+        if exp.tzinfo is None:
+            # Naive claims are taken as UTC; comparing them with an aware
+            # clock would raise TypeError instead of a validation error
+            exp = exp.replace(tzinfo=UTC)
+        if now is None:
+            now = datetime.now(UTC)
+        elif now.tzinfo is None:
+            now = now.replace(tzinfo=UTC)
+        if exp < now:
             raise ValueError("token already expired")
         return self
+
+
+def _validate_chunk(
+    cls: type[AccessToken], payloads: Sequence[Any], now: datetime
+) -> List[AccessToken | ValidationError]:
+    validate = cls.__pydantic_validator__.validate_python
+    context = {NOW_CONTEXT_KEY: now}
+    results: List[AccessToken | ValidationError] = []
+    for payload in payloads:
+        try:
+            results.append(validate(payload, context=context))
+        except ValidationError as e:
+            results.append(e)
+    return results
+
+
+class _ObservedValidator:
+    """
+    Compiled validator proxy that times its ``validate_*`` entry points.
+
+    Installed as ``AccessToken.__pydantic_validator__`` only while
+    instrumentation is enabled, so ``AccessToken(...)``, ``model_validate``,
+    ``model_validate_json`` and ``validate_many`` are all observed, and the
+    disabled path runs the original validator untouched.
+    """
+
+    def __init__(self, validator: Any, probe: instrumentation.Probe) -> None:
+        self.validator = validator
+        self.validate_python = partial(probe.observe, validator.validate_python)
+        self.validate_json = partial(probe.observe, validator.validate_json)
+        self.validate_strings = partial(probe.observe, validator.validate_strings)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.validator, name)
+
+
+def _observe_validation(enabled: bool) -> None:
+    current = AccessToken.__pydantic_validator__
+    if enabled and not isinstance(current, _ObservedValidator):
+        observed = _ObservedValidator(current, _VALIDATE_PROBE)
+        AccessToken.__pydantic_validator__ = observed
+    elif not enabled and isinstance(current, _ObservedValidator):
+        AccessToken.__pydantic_validator__ = current.validator
+
+
+instrumentation.on_toggle(_observe_validation)
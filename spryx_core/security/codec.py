@@ -0,0 +1,340 @@
+"""
+Compact binary encoding of access tokens.
+
+This module provides a versioned binary format for forwarding a decoded
+``AccessToken`` between services and through queues. Compared with the JSON
+form it stores timestamps as epoch microseconds, ULIDs as 16 bytes and every
+scope string once in a shared table. The token ``ver`` claim selects the
+layout, and decoding reproduces the original token exactly.
+
+The format trades CPU for size: ``python -m benchmarks.bench_codec`` measured
+encoded tokens at 30-45% of their JSON size, but decoding at about 2.5 times
+the cost of ``AccessToken.model_validate_json``, whose parser runs in Rust.
+Use it where tokens are stored or queued in bulk, not on request hot paths.
+
+Layout of schema version 1 (integers are unsigned LEB128 varints unless noted,
+strings are a varint length followed by UTF-8 bytes, and ids are a tag byte
+followed by either 16 ULID bytes or a string)::
+
+    magic      0xA7
+    ver        varint
+    flags      varint
+    iat, exp   int64 big-endian epoch microseconds
+    nbf        int64, if flags & NBF
+    iss        string
+    sub        id
+    aud        string, or varint count + strings if flags & AUD_LIST
+    jti        id
+    token_type byte
+    sid        id, if flags & SID
+    scopes     varint count + strings (table shared by both contexts)
+    plt        role_id id + varint count + table indexes
+               + [registry string + bits varint if flags & PLT_BITS], if flags & PLT
+    org        id id + role_id id + [status string if flags & STATUS]
+               + varint count + table indexes
+               + [registry string + bits varint if flags & ORG_BITS], if flags & ORG
+
+Naive ``iat``, ``exp`` and ``nbf`` values are encoded as UTC and marked by the
+NAIVE_IAT, NAIVE_EXP and NAIVE_NBF flags, so they decode naive again.
+"""
+
+from __future__ import annotations
+
+import struct
+from datetime import datetime
+from typing import Any, Callable, Dict
+
+from spryx_core.id import entity_id_from_bytes, entity_id_to_bytes, is_valid_ulid
+from spryx_core.security.claims import (
+    AccessToken,
+    OrgContext,
+    PltContext,
+    TokenType,
+)
+from spryx_core.time import from_epoch_micros, to_epoch_micros
+
+MAGIC = 0xA7
+
+_INT64 = struct.Struct(">q")
+
+_TAG_ULID = 0
+_TAG_STR = 1
+
+_FLAG_NBF = 1 << 0
+_FLAG_AUD_LIST = 1 << 1
+_FLAG_SID = 1 << 2
+_FLAG_PLT = 1 << 3
+_FLAG_ORG = 1 << 4
+_FLAG_STATUS = 1 << 5
+_FLAG_PLT_BITS = 1 << 6
+_FLAG_ORG_BITS = 1 << 7
+_FLAG_NAIVE_IAT = 1 << 8
+_FLAG_NAIVE_EXP = 1 << 9
+_FLAG_NAIVE_NBF = 1 << 10
+
+_TOKEN_TYPES = list(TokenType)
+_TOKEN_TYPE_CODES = {token_type: code for code, token_type in enumerate(_TOKEN_TYPES)}
+
+
+class _Writer:
+    __slots__ = ("buf",)
+
+    def __init__(self) -> None:
+        self.buf = bytearray()
+
+    def varint(self, value: int) -> None:
+        while value > 0x7F:
+            self.buf.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self.buf.append(value)
+
+    def int64(self, value: int) -> None:
+        self.buf += _INT64.pack(value)
+
+    def string(self, value: str) -> None:
+        data = value.encode()
+        self.varint(len(data))
+        self.buf += data
+
+    def entity_id(self, value: str) -> None:
+        if is_valid_ulid(value) and value[0] <= "7":
+            self.buf.append(_TAG_ULID)
+            self.buf += entity_id_to_bytes(value)
+        else:
+            self.buf.append(_TAG_STR)
+            self.string(value)
+
+
+class _Reader:
+    __slots__ = ("data", "pos")
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.pos = 0
+
+    def byte(self) -> int:
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
+
+    def varint(self) -> int:
+        value = self.data[self.pos]
+        self.pos += 1
+        if value < 0x80:
+            # Counts, indexes and lengths almost always fit in one byte
+            return value
+        result, shift = value & 0x7F, 7
+        while True:
+            value = self.byte()
+            result |= (value & 0x7F) << shift
+            if value < 0x80:
+                return result
+            shift += 7
+
+    def int64(self) -> int:
+        (value,) = _INT64.unpack_from(self.data, self.pos)
+        self.pos += 8
+        return value
+
+    def raw(self, size: int) -> bytes:
+        end = self.pos + size
+        if end > len(self.data):
+            raise IndexError("truncated data")
+        value = self.data[self.pos : end]
+        self.pos = end
+        return bytes(value)
+
+    def string(self) -> str:
+        size = self.varint()
+        end = self.pos + size
+        if end > len(self.data):
+            raise IndexError("truncated data")
+        value = str(self.data[self.pos : end], "utf-8")
+        self.pos = end
+        return value
+
+    def entity_id(self) -> str:
+        tag = self.byte()
+        if tag == _TAG_ULID:
+            return entity_id_from_bytes(self.raw(16))
+        if tag == _TAG_STR:
+            return self.string()
+        raise ValueError(f"unknown id tag {tag}")
+
+
+def _encode_v1(token: AccessToken, out: _Writer) -> None:
+    plt, org = token.plt_context, token.org_context
+    flags = 0
+    if token.iat.tzinfo is None:
+        flags |= _FLAG_NAIVE_IAT
+    if token.exp.tzinfo is None:
+        flags |= _FLAG_NAIVE_EXP
+    if token.nbf is not None:
+        flags |= _FLAG_NBF
+        if token.nbf.tzinfo is None:
+            flags |= _FLAG_NAIVE_NBF
+    if isinstance(token.aud, list):
+        flags |= _FLAG_AUD_LIST
+    if token.meta.sid is not None:
+        flags |= _FLAG_SID
+    if plt is not None:
+        flags |= _FLAG_PLT
+        if plt.scope_bits is not None:
+            flags |= _FLAG_PLT_BITS
+    if org is not None:
+        flags |= _FLAG_ORG
+        if org.status is not None:
+            flags |= _FLAG_STATUS
+        if org.scope_bits is not None:
+            flags |= _FLAG_ORG_BITS
+    out.varint(flags)
+
+    out.int64(to_epoch_micros(token.iat))
+    out.int64(to_epoch_micros(token.exp))
+    if token.nbf is not None:
+        out.int64(to_epoch_micros(token.nbf))
+    out.string(token.iss)
+    out.entity_id(token.sub)
+    if isinstance(token.aud, list):
+        out.varint(len(token.aud))
+        for aud in token.aud:
+            out.string(aud)
+    else:
+        out.string(token.aud)
+    out.entity_id(token.jti)
+    out.buf.append(_TOKEN_TYPE_CODES[token.meta.token_type])
+    if token.meta.sid is not None:
+        out.entity_id(token.meta.sid)
+
+    table: Dict[str, int] = {}
+    for context in (plt, org):
+        if context is not None:
+            for scope in context.scopes:
+                table.setdefault(scope, len(table))
+    out.varint(len(table))
+    for scope in table:
+        out.string(scope)
+
+    def scopes(context: PltContext | OrgContext) -> None:
+        out.varint(len(context.scopes))
+        for scope in context.scopes:
+            out.varint(table[scope])
+        if context.scope_bits is not None:
+            out.string(context.scope_reg)
+            out.varint(context.scope_bits)
+
+    if plt is not None:
+        out.entity_id(plt.role_id)
+        scopes(plt)
+    if org is not None:
+        out.entity_id(org.id)
+        out.entity_id(org.role_id)
+        if org.status is not None:
+            out.string(org.status)
+        scopes(org)
+
+
+def _timestamp(us: int, naive: int) -> datetime:
+    dt = from_epoch_micros(us)
+    return dt.replace(tzinfo=None) if naive else dt
+
+
+def _decode_v1(data: _Reader, ver: int) -> Dict[str, Any]:
+    flags = data.varint()
+    claims: Dict[str, Any] = {"ver": ver}
+
+    claims["iat"] = _timestamp(data.int64(), flags & _FLAG_NAIVE_IAT)
+    claims["exp"] = _timestamp(data.int64(), flags & _FLAG_NAIVE_EXP)
+    if flags & _FLAG_NBF:
+        claims["nbf"] = _timestamp(data.int64(), flags & _FLAG_NAIVE_NBF)
+    claims["iss"] = data.string()
+    claims["sub"] = data.entity_id()
+    if flags & _FLAG_AUD_LIST:
+        claims["aud"] = [data.string() for _ in range(data.varint())]
+    else:
+        claims["aud"] = data.string()
+    claims["jti"] = data.entity_id()
+    meta: Dict[str, Any] = {"token_type": _TOKEN_TYPES[data.byte()]}
+    if flags & _FLAG_SID:
+        meta["sid"] = data.entity_id()
+    claims["meta"] = meta
+
+    table = [data.string() for _ in range(data.varint())]
+
+    def scopes(context: Dict[str, Any], has_bits: int) -> Dict[str, Any]:
+        context["scopes"] = [table[data.varint()] for _ in range(data.varint())]
+        if has_bits:
+            context["scope_reg"] = data.string()
+            context["scope_bits"] = data.varint()
+        return context
+
+    if flags & _FLAG_PLT:
+        plt = {"role_id": data.entity_id()}
+        claims["plt_context"] = scopes(plt, flags & _FLAG_PLT_BITS)
+    if flags & _FLAG_ORG:
+        org: Dict[str, Any] = {"id": data.entity_id(), "role_id": data.entity_id()}
+        if flags & _FLAG_STATUS:
+            org["status"] = data.string()
+        claims["org_context"] = scopes(org, flags & _FLAG_ORG_BITS)
+    return claims
+
+
+_ENCODERS: Dict[int, Callable[[AccessToken, _Writer], None]] = {1: _encode_v1}
+_DECODERS: Dict[int, Callable[[_Reader, int], Dict[str, Any]]] = {1: _decode_v1}
+
+
+def encode_access_token(token: AccessToken) -> bytes:
+    """
+    Encode an access token into the compact binary format.
+
+    Args:
+        token: The token to encode
+
+    Returns:
+        bytes: The encoded token
+
+    Raises:
+        ValueError: If the token schema version has no binary layout
+    """
+    try:
+        encoder = _ENCODERS[token.ver]
+    except KeyError:
+        raise ValueError(f"Unsupported token schema version: {token.ver}") from None
+    out = _Writer()
+    out.buf.append(MAGIC)
+    out.varint(token.ver)
+    encoder(token, out)
+    return bytes(out.buf)
+
+
+def decode_access_token(data: bytes) -> AccessToken:
+    """
+    Decode an access token from the compact binary format.
+
+    The decoded claims go through the regular ``AccessToken`` validation,
+    including the expiry check.
+
+    Args:
+        data: Bytes produced by ``encode_access_token``
+
+    Returns:
+        AccessToken: The decoded token
+
+    Raises:
+        ValueError: If the data is malformed or uses an unsupported schema version
+    """
+    reader = _Reader(data)
+    try:
+        if reader.byte() != MAGIC:
+            raise ValueError("Not an encoded access token")
+        ver = reader.varint()
+        try:
+            decoder = _DECODERS[ver]
+        except KeyError:
+            raise ValueError(f"Unsupported token schema version: {ver}") from None
+        claims = decoder(reader, ver)
+    except (IndexError, struct.error, UnicodeDecodeError) as e:
+        raise ValueError("Malformed encoded access token") from e
+    if reader.pos != len(data):
+        raise ValueError("Malformed encoded access token")
+    return AccessToken.model_validate(claims)
@@ -0,0 +1,158 @@
+"""
+In-process token revocation.
+
+This module provides a denylist of revoked token ids (``jti``). Each entry is
+kept only until the token's own ``exp``: after that the token is rejected
+anyway, so the entry is swept. Lookups are plain dict reads and never take a
+lock, and replicated revocations from other nodes are applied in bulk with
+``sync``.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Mapping, Tuple
+
+from spryx_core.security.claims import AccessToken
+from spryx_core.time import to_epoch_micros
+
+RevocationDelta = Dict[str, int]
+"""Revoked token ids mapped to their expiry, in epoch seconds."""
+
+
+def _epoch_seconds(exp: datetime | int | float) -> int:
+    if isinstance(exp, datetime):
+        # Naive datetimes are UTC, as in the token expiry check
+        return -(-to_epoch_micros(exp) // 1_000_000)
+    return math.ceil(exp)
+
+
+class RevocationStore:
+    """
+    Denylist of revoked token ids that forgets entries once tokens expire.
+
+    Entries are held in a dict (``jti`` -> expiry in epoch seconds) for lookups
+    and in a min-heap ordered by expiry for sweeping. Expired entries are swept
+    opportunistically on every write, or explicitly with ``sweep``.
+
+    Revocations made locally are also collected in an outbox; ``take_delta``
+    returns them so they can be replicated and applied elsewhere with ``sync``.
+
+    Args:
+        clock: Function returning the current time in epoch seconds
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.time) -> None:
+        self._clock = clock
+        self._entries: Dict[str, int] = {}
+        self._expiries: List[Tuple[int, str]] = []
+        self._outbox: RevocationDelta = {}
+        self._lock = threading.Lock()
+
+    def is_revoked(self, jti: str) -> bool:
+        """
+        Check whether a token id was revoked.
+
+        Args:
+            jti: The token id
+
+        Returns:
+            bool: True if the token was revoked and may still be unexpired
+        """
+        return jti in self._entries
+
+    def __contains__(self, jti: object) -> bool:
+        return jti in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _add(self, jti: str, exp: int, now: float) -> bool:
+        if exp <= now or self._entries.get(jti, -1) >= exp:
+            return False
+        self._entries[jti] = exp
+        heapq.heappush(self._expiries, (exp, jti))
+        return True
+
+    def revoke(self, jti: str, exp: datetime | int | float) -> None:
+        """
+        Revoke a token id until its expiry.
+
+        Args:
+            jti: The token id
+            exp: The token expiry, as a datetime or epoch seconds
+        """
+        exp = _epoch_seconds(exp)
+        with self._lock:
+            now = self._clock()
+            if self._add(jti, exp, now):
+                self._outbox[jti] = exp
+            self._sweep(now)
+
+    def revoke_token(self, token: AccessToken) -> None:
+        """
+        Revoke an access token until its expiry.
+
+        Args:
+            token: The token to revoke
+        """
+        self.revoke(token.jti, token.exp)
+
+    def sync(
+        self, delta: Mapping[str, float] | Iterable[Tuple[str, float]]
+    ) -> int:
+        """
+        Apply revocations replicated from another node.
+
+        Entries already expired are ignored, and applied entries are not added
+        to this node's outbox.
+
+        Args:
+            delta: Token ids mapped to their expiry in epoch seconds (fractional
+                expiries are rounded up, as in ``revoke``)
+
+        Returns:
+            int: Number of new or extended revocations
+        """
+        items = delta.items() if isinstance(delta, Mapping) else delta
+        with self._lock:
+            now = self._clock()
+            applied = sum(self._add(jti, _epoch_seconds(exp), now) for jti, exp in items)
+            self._sweep(now)
+        return applied
+
+    def take_delta(self) -> RevocationDelta:
+        """
+        Collect the revocations made locally since the last call.
+
+        Returns:
+            RevocationDelta: Token ids mapped to their expiry in epoch seconds
+        """
+        with self._lock:
+            delta, self._outbox = self._outbox, {}
+        return delta
+
+    def _sweep(self, now: float) -> int:
+        removed = 0
+        expiries, entries = self._expiries, self._entries
+        while expiries and expiries[0][0] <= now:
+            exp, jti = heapq.heappop(expiries)
+            # Skip heap entries superseded by a later revocation of the same jti
+            if entries.get(jti) == exp:
+                del entries[jti]
+                removed += 1
+        return removed
+
+    def sweep(self) -> int:
+        """
+        Remove every entry whose token has expired.
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            return self._sweep(self._clock())
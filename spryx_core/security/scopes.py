@@ -0,0 +1,183 @@
+"""
+Registry-indexed scope bitsets.
+
+A ``ScopeRegistry`` assigns every known scope name a bit position, so a token
+can carry its scopes as one integer (``scope_bits``) plus the id of the
+registry that produced it (``scope_reg``) instead of a list of strings.
+Registries are versioned by id: once published, a registry must never reorder
+or remove names. Adding scopes means registering a new id (for example
+``"spryx.v2"``) that keeps the existing positions and appends new ones.
+
+Scopes missing from the registry stay as plain strings next to the bitset, so
+tokens issued before a scope was registered keep working.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, Sequence, Tuple
+
+_registries: Dict[str, "ScopeRegistry"] = {}
+
+
+class ScopeRegistry:
+    """
+    Fixed mapping of scope names to bit positions.
+
+    Args:
+        registry_id: Versioned identifier carried by tokens (e.g. ``"spryx.v1"``)
+        scopes: Scope names; the position in the sequence is the bit index
+
+    Raises:
+        ValueError: If a scope name is repeated
+    """
+
+    __slots__ = ("registry_id", "names", "_bits", "_masks", "_decoded")
+
+    def __init__(self, registry_id: str, scopes: Sequence[str]) -> None:
+        self.registry_id = registry_id
+        self.names: Tuple[str, ...] = tuple(scopes)
+        self._bits: Dict[str, int] = {
+            name: 1 << index for index, name in enumerate(self.names)
+        }
+        if len(self._bits) != len(self.names):
+            raise ValueError(f"Duplicate scope names in registry '{registry_id}'")
+        self._masks: Dict[Tuple[str, ...], Tuple[int, Tuple[str, ...]]] = {}
+        self._decoded: Dict[int, Tuple[str, ...]] = {}
+
+    def bit(self, scope: str) -> int:
+        """
+        Return the bit assigned to a scope, or 0 if the scope is not registered.
+
+        Args:
+            scope: The scope name
+
+        Returns:
+            int: A single-bit mask, or 0
+        """
+        return self._bits.get(scope, 0)
+
+    def encode(self, scopes: Iterable[str]) -> Tuple[int, Tuple[str, ...]]:
+        """
+        Split scope names into a bitset and the names the registry does not know.
+
+        Results are cached per scope tuple, so repeated checks of the same
+        required scopes cost a single dict lookup.
+
+        Args:
+            scopes: Scope names
+
+        Returns:
+            tuple: The bitset of registered scopes and the unregistered names
+        """
+        key = tuple(scopes)
+        cached = self._masks.get(key)
+        if cached is not None:
+            return cached
+        bits = 0
+        unknown = []
+        for scope in key:
+            bit = self._bits.get(scope)
+            if bit is None:
+                unknown.append(scope)
+            else:
+                bits |= bit
+        result = (bits, tuple(unknown))
+        if len(self._masks) < 4096:
+            self._masks[key] = result
+        return result
+
+    def decode(self, bits: int) -> Tuple[str, ...]:
+        """
+        Expand a bitset into scope names, in registry order.
+
+        Results are cached per bitset, like ``encode`` results.
+
+        Args:
+            bits: The bitset
+
+        Returns:
+            tuple: The scope names
+
+        Raises:
+            ValueError: If the bitset has bits outside the registry
+        """
+        cached = self._decoded.get(bits)
+        if cached is not None:
+            return cached
+        if bits >> len(self.names):
+            raise ValueError(
+                f"Scope bits {bits:#x} exceed registry '{self.registry_id}'"
+            )
+        names = self.names
+        result = tuple(names[i] for i in range(bits.bit_length()) if bits >> i & 1)
+        if len(self._decoded) < 4096:
+            self._decoded[bits] = result
+        return result
+
+    def to_claims(self, scopes: Iterable[str]) -> Dict[str, object]:
+        """
+        Build the scope claims of a context from scope names.
+
+        Args:
+            scopes: Scope names granted to the context
+
+        Returns:
+            dict: ``scope_bits``, ``scope_reg`` and the unregistered ``scopes``
+        """
+        bits, unknown = self.encode(scopes)
+        return {"scope_bits": bits, "scope_reg": self.registry_id, "scopes": unknown}
+
+    def __contains__(self, scope: object) -> bool:
+        return scope in self._bits
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"ScopeRegistry({self.registry_id!r}, {len(self.names)} scopes)"
+
+
+def register_scope_registry(registry: ScopeRegistry) -> ScopeRegistry:
+    """
+    Make a registry available to tokens that reference its id.
+
+    Registering the same id twice is only allowed with identical scope names,
+    since tokens already issued depend on the bit positions.
+
+    Args:
+        registry: The registry to publish
+
+    Returns:
+        ScopeRegistry: The registry, for use as an expression
+
+    Raises:
+        ValueError: If a different registry is already published under the id
+    """
+    existing = _registries.setdefault(registry.registry_id, registry)
+    if existing is not registry and existing.names != registry.names:
+        raise ValueError(
+            f"Scope registry '{registry.registry_id}' is already registered"
+        )
+    return existing
+
+
+def get_scope_registry(registry_id: str) -> ScopeRegistry:
+    """
+    Return a published registry.
+
+    Args:
+        registry_id: The registry id carried by a token
+
+    Returns:
+        ScopeRegistry: The registry
+
+    Raises:
+        KeyError: If no registry is published under the id
+    """
+    try:
+        return _registries[registry_id]
+    except KeyError:
+        raise KeyError(f"Unknown scope registry '{registry_id}'") from None
@@ -7,7 +7,25 @@ cases like "no value provided" in a way that's distinct from None.
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Any, Dict, Literal
+
+# First sentinel created for each name; unpickling resolves to these instances
+_registry: Dict[str, _SentinelBase] = {}
+
+
+def _restore_sentinel(name: str) -> _SentinelBase:
+    """
+    Resolve a sentinel by name when unpickling.
+
+    Args:
+        name: The name of the sentinel
+
+    Returns:
+        _SentinelBase: The registered sentinel, or a new one if none exists
+    """
+    if name in _registry:
+        return _registry[name]
+    return _SentinelBase(name)
 
 
 class _SentinelBase:
@@ -17,6 +35,10 @@ class _SentinelBase:
     Sentinel values are used to represent special states that are distinct
     from regular values including None. They always evaluate to False in
     boolean contexts and stringify to their name.
+
+    The first sentinel created with a given name is registered so that pickling,
+    copying and crossing process boundaries all preserve identity, which is what
+    ``is_given`` relies on.
     """
 
     __slots__ = ("_name",)
@@ -29,6 +51,7 @@ class _SentinelBase:
             name: The name of the sentinel
         """
         self._name = name
+        _registry.setdefault(name, self)
 
     def __bool__(self) -> Literal[False]:
         """
@@ -53,9 +76,17 @@ class _SentinelBase:
         Support for pickling sentinel instances.
 
         Returns:
-            tuple: Class and constructor arguments
+            tuple: Lookup function and the sentinel name
         """
-        return (self.__class__, (self._name,))
+        return (_restore_sentinel, (self._name,))
+
+    def __copy__(self) -> _SentinelBase:
+        """Sentinels are never copied."""
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> _SentinelBase:
+        """Sentinels are never copied."""
+        return self
 
 
 # Sentinel for indicating that a value was not provided
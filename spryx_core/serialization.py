@@ -0,0 +1,256 @@
+"""
+JSON serialization with pluggable backends.
+
+This module provides a single ``dumps``/``loads`` pair used to serialize core
+types (``Page``, ``SpryxError``, ``AccessToken``, ``EntityId`` and datetimes)
+with the fastest JSON library available: orjson or msgspec when installed,
+the standard library otherwise. Backends produce byte-identical output, with
+datetimes written in the ``to_iso`` wire format, except for floats written in
+exponent notation (below 1e-4 or from 1e16): each library prints those in its
+own shortest round-trip form, e.g. ``1e-05`` or ``0.00001``, which decode to
+the same value.
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, List, Protocol
+
+from pydantic import BaseModel
+
+from spryx_core import instrumentation
+from spryx_core.errors import SpryxError
+from spryx_core.time import to_iso
+
+
+class JsonBackend(Protocol):
+    """Interface implemented by JSON backends."""
+
+    name: str
+
+    def dumps(self, obj: Any) -> bytes: ...
+
+    def loads(self, data: bytes | str) -> Any: ...
+
+
+def _default(obj: Any) -> Any:
+    """
+    Convert objects the JSON libraries do not handle natively.
+
+    Args:
+        obj: The object to convert
+
+    Returns:
+        A JSON-compatible representation of the object
+
+    Raises:
+        TypeError: If the object type is not supported
+    """
+    if isinstance(obj, datetime):
+        return to_iso(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, SpryxError):
+        return obj.to_dict()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, (tuple, set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_key(key: Any) -> str:
+    """Convert a dict key the way ``json.dumps`` does."""
+    if isinstance(key, str):
+        return key.value if isinstance(key, Enum) else key
+    if key is None or isinstance(key, (int, float)):
+        return json.dumps(key)
+    raise TypeError(f"Keys must be str, int, float, bool or None, not {type(key)}")
+
+
+def _jsonable(obj: Any) -> Any:
+    """Recursively convert ``obj`` into plain JSON types."""
+    if obj is None:
+        return obj
+    if isinstance(obj, (str, int, float)) and not isinstance(obj, Enum):
+        return obj
+    if isinstance(obj, dict):
+        return {_json_key(key): _jsonable(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_jsonable(value) for value in obj]
+    return _jsonable(_default(obj))
+
+
+class StdlibBackend:
+    """Backend based on the standard library ``json`` module."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(
+            obj, default=_default, ensure_ascii=False, separators=(",", ":")
+        ).encode()
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonBackend:
+    """
+    Backend based on ``orjson``.
+
+    Non-string dict keys are converted like the standard library does, and
+    payloads orjson rejects (integers wider than 64 bits) are encoded by the
+    standard library instead of failing with this backend only.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        self._fallback = StdlibBackend()
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj, default=_default, option=self._option)
+        except TypeError:
+            return self._fallback.dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecBackend:
+    """
+    Backend based on ``msgspec``.
+
+    msgspec always encodes datetimes natively, so values are normalized to plain
+    JSON types first to keep the ``to_iso`` format.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(_jsonable(obj))
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+
+_DUMPS_PROBE = instrumentation.probe("serialization.dumps")
+
+_BACKENDS: Dict[str, Callable[[], JsonBackend]] = {
+    "orjson": OrjsonBackend,
+    "msgspec": MsgspecBackend,
+    "json": StdlibBackend,
+}
+
+
+def available_backends() -> List[str]:
+    """
+    List the names of the backends that can be used in this environment.
+
+    Returns:
+        list[str]: Backend names, fastest first
+    """
+    names = []
+    for name, factory in _BACKENDS.items():
+        try:
+            factory()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def create_backend(name: str) -> JsonBackend:
+    """
+    Instantiate a backend by name.
+
+    Args:
+        name: One of "orjson", "msgspec" or "json"
+
+    Returns:
+        JsonBackend: The backend instance
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the backend library is not installed
+    """
+    try:
+        factory = _BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown JSON backend: {name}") from None
+    return factory()
+
+
+def _default_backend() -> JsonBackend:
+    return create_backend(available_backends()[0])
+
+
+_backend: JsonBackend = _default_backend()
+
+
+def get_backend() -> JsonBackend:
+    """
+    Get the backend currently used by ``dumps`` and ``loads``.
+
+    Returns:
+        JsonBackend: The active backend
+    """
+    return _backend
+
+
+def set_backend(backend: str | JsonBackend) -> None:
+    """
+    Set the backend used by ``dumps`` and ``loads``.
+
+    Args:
+        backend: A backend name or instance
+    """
+    global _backend
+    _backend = create_backend(backend) if isinstance(backend, str) else backend
+
+
+def dumps(obj: Any, *, backend: JsonBackend | None = None) -> bytes:
+    """
+    Serialize an object to compact JSON bytes.
+
+    Args:
+        obj: The object to serialize (models, errors, datetimes and plain JSON types)
+        backend: Backend to use instead of the active one
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if _DUMPS_PROBE.active:
+        return _DUMPS_PROBE.observe((backend or _backend).dumps, obj)
+    return (backend or _backend).dumps(obj)
+
+
+def loads(data: bytes | str, *, backend: JsonBackend | None = None) -> Any:
+    """
+    Deserialize JSON into plain Python objects.
+
+    Args:
+        data: JSON bytes or string
+        backend: Backend to use instead of the active one
+
+    Returns:
+        The decoded value; pass it to ``Model.model_validate`` to rebuild models
+    """
+    return (backend or _backend).loads(data)
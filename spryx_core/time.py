@@ -8,11 +8,21 @@ including ISO-8601 formatting, parsing, and common time operations.
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator, List, Optional
+
+from spryx_core import instrumentation
 
 # Regular expression for validating ISO-8601 UTC timestamps
 ISO_8601_UTC_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z$")
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+_TO_ISO_PROBE = instrumentation.probe("time.to_iso")
+_PARSE_ISO_PROBE = instrumentation.probe("time.parse_iso")
+
 
 def now_utc() -> datetime:
     """
@@ -35,14 +45,20 @@ def to_iso(dt: datetime, *, milliseconds: bool = False) -> str:
     Returns:
         str: ISO-8601 formatted string in UTC
     """
+    if _TO_ISO_PROBE.active:
+        return _TO_ISO_PROBE.observe(_to_iso, dt, milliseconds)
+    return _to_iso(dt, milliseconds)
+
+
+def _to_iso(dt: datetime, milliseconds: bool) -> str:
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
+    # isoformat is faster than strftime and always pads the year to four
+    # digits; in UTC it ends with "+00:00", which is swapped for "Z"
     dt = dt.astimezone(timezone.utc)
-
     if milliseconds:
-        frac = f"{dt.microsecond // 1000:03d}"
-        return dt.strftime(f"%Y-%m-%dT%H:%M:%S.{frac}Z")
-    return dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        return dt.isoformat(timespec="milliseconds")[:-6] + "Z"
+    return dt.isoformat(timespec="microseconds")[:-6] + "Z"
 
 
 def parse_iso(value: str) -> datetime:
@@ -58,6 +74,12 @@ def parse_iso(value: str) -> datetime:
     Raises:
         ValueError: If the string is not in valid ISO-8601 UTC format
     """
+    if _PARSE_ISO_PROBE.active:
+        return _PARSE_ISO_PROBE.observe(_parse_iso, value)
+    return _parse_iso(value)
+
+
+def _parse_iso(value: str) -> datetime:
     if not ISO_8601_UTC_RE.fullmatch(value):
         raise ValueError("Formato ISO inválido")
     return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
@@ -108,3 +130,278 @@ def timestamp_from_iso(iso: str) -> int:
     Convert an ISO-8601 UTC string to a UNIX timestamp.
     """
     return int(parse_iso(iso).timestamp())
+
+
+def to_epoch_micros(dt: datetime) -> int:
+    """
+    Convert a datetime to integer microseconds since the UNIX epoch.
+
+    Unlike ``datetime.timestamp()`` this is exact for every datetime.
+
+    Args:
+        dt: The datetime to convert (naive datetimes are treated as UTC)
+
+    Returns:
+        int: Microseconds since 1970-01-01T00:00:00Z
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def from_epoch_micros(us: int) -> datetime:
+    """
+    Convert integer microseconds since the UNIX epoch to a UTC datetime.
+
+    Args:
+        us: Microseconds since 1970-01-01T00:00:00Z
+
+    Returns:
+        datetime: Corresponding datetime in UTC timezone
+    """
+    return _EPOCH + timedelta(microseconds=us)
+
+
+@dataclass(frozen=True, slots=True, order=True)
+class TimeRange:
+    """
+    Inclusive range of UTC instants, from ``start`` to ``end``.
+
+    Bounds are stored as integer microseconds since the epoch, which makes
+    comparisons and overlap checks plain integer operations. Ranges are
+    inclusive on both ends, like ``(start_of_day(x), end_of_day(y))``.
+
+    Args:
+        start_us: Start of the range in epoch microseconds
+        end_us: End of the range in epoch microseconds
+
+    Raises:
+        ValueError: If the range ends before it starts
+    """
+
+    start_us: int
+    end_us: int
+
+    def __post_init__(self) -> None:
+        if self.end_us < self.start_us:
+            raise ValueError("TimeRange end must not be before its start")
+
+    @classmethod
+    def from_datetimes(cls, start: datetime, end: datetime) -> TimeRange:
+        """
+        Build a range from two datetimes.
+
+        Args:
+            start: Start of the range (naive datetimes are treated as UTC)
+            end: End of the range, inclusive
+
+        Returns:
+            TimeRange: The range
+        """
+        return cls(to_epoch_micros(start), to_epoch_micros(end))
+
+    @classmethod
+    def days(
+        cls, first: datetime | None = None, last: datetime | None = None
+    ) -> TimeRange:
+        """
+        Build the range from the start of ``first``'s day to the end of ``last``'s day.
+
+        Args:
+            first: A datetime in the first day (defaults to today)
+            last: A datetime in the last day (defaults to ``first``)
+
+        Returns:
+            TimeRange: The range covering the whole days
+        """
+        return cls.from_datetimes(start_of_day(first), end_of_day(last or first))
+
+    @property
+    def start(self) -> datetime:
+        """Start of the range as a UTC datetime."""
+        return from_epoch_micros(self.start_us)
+
+    @property
+    def end(self) -> datetime:
+        """End of the range as a UTC datetime."""
+        return from_epoch_micros(self.end_us)
+
+    @property
+    def duration(self) -> timedelta:
+        """Time between the start and the end of the range."""
+        return timedelta(microseconds=self.end_us - self.start_us)
+
+    def __contains__(self, value: datetime) -> bool:
+        return self.start_us <= to_epoch_micros(value) <= self.end_us
+
+    def overlaps(self, other: TimeRange) -> bool:
+        """
+        Check whether two ranges share at least one instant.
+
+        Args:
+            other: The other range
+
+        Returns:
+            bool: True if the ranges overlap
+        """
+        return self.start_us <= other.end_us and other.start_us <= self.end_us
+
+    def intersection(self, other: TimeRange) -> Optional[TimeRange]:
+        """
+        Get the instants shared by two ranges.
+
+        Args:
+            other: The other range
+
+        Returns:
+            TimeRange | None: The overlapping range, or None if they do not overlap
+        """
+        if not self.overlaps(other):
+            return None
+        return TimeRange(
+            max(self.start_us, other.start_us), min(self.end_us, other.end_us)
+        )
+
+    def to_iso(self) -> str:
+        """
+        Format the range as an ISO-8601 interval, "start/end".
+
+        Returns:
+            str: Both bounds formatted with ``to_iso``
+        """
+        return f"{to_iso(self.start)}/{to_iso(self.end)}"
+
+    @classmethod
+    def parse_iso(cls, value: str) -> TimeRange:
+        """
+        Parse an ISO-8601 interval produced by ``to_iso``.
+
+        Args:
+            value: "start/end" with both bounds in ISO-8601 UTC format
+
+        Returns:
+            TimeRange: The parsed range
+
+        Raises:
+            ValueError: If the value is not a valid interval
+        """
+        start, sep, end = value.partition("/")
+        if not sep:
+            raise ValueError("Formato de intervalo ISO inválido")
+        return cls.from_datetimes(parse_iso(start), parse_iso(end))
+
+
+def merge_ranges(ranges: Iterable[TimeRange]) -> List[TimeRange]:
+    """
+    Merge overlapping ranges.
+
+    Args:
+        ranges: Ranges in any order
+
+    Returns:
+        list[TimeRange]: Disjoint ranges sorted by start
+    """
+    merged: List[TimeRange] = []
+    for current in sorted(ranges):
+        if merged and current.start_us <= merged[-1].end_us:
+            if current.end_us > merged[-1].end_us:
+                merged[-1] = TimeRange(merged[-1].start_us, current.end_us)
+        else:
+            merged.append(current)
+    return merged
+
+
+class TimeRangeIndex:
+    """
+    Static index answering "which ranges overlap this instant or range?".
+
+    Ranges are sorted by start and laid out as an implicit balanced binary
+    tree where every node also stores the latest end in its subtree. Queries
+    skip whole subtrees that end before the query starts or start after it
+    ends, so they take O(log n + k) for typical data instead of the O(n) of a
+    pairwise scan (the worst case is O(k log n)).
+
+    Args:
+        ranges: Ranges to index
+    """
+
+    __slots__ = ("_ranges", "_starts", "_ends", "_max_end")
+
+    def __init__(self, ranges: Iterable[TimeRange]) -> None:
+        self._ranges = sorted(ranges)
+        self._starts = [r.start_us for r in self._ranges]
+        self._ends = [r.end_us for r in self._ranges]
+        self._max_end = list(self._ends)
+        self._build(0, len(self._ranges))
+
+    def _build(self, lo: int, hi: int) -> int:
+        """Fill ``_max_end`` for the subtree rooted at ``(lo + hi) // 2``."""
+        if lo >= hi:
+            return -1
+        mid = (lo + hi) // 2
+        self._max_end[mid] = max(
+            self._ends[mid], self._build(lo, mid), self._build(mid + 1, hi)
+        )
+        return self._max_end[mid]
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def __iter__(self) -> Iterator[TimeRange]:
+        return iter(self._ranges)
+
+    def overlapping(self, query: datetime | TimeRange) -> List[TimeRange]:
+        """
+        Find the ranges that overlap an instant or a range.
+
+        Args:
+            query: A datetime or a range
+
+        Returns:
+            list[TimeRange]: Overlapping ranges sorted by start
+        """
+        if isinstance(query, TimeRange):
+            query_start, query_end = query.start_us, query.end_us
+        else:
+            query_start = query_end = to_epoch_micros(query)
+
+        starts, ends, max_end = self._starts, self._ends, self._max_end
+        found: List[int] = []
+        stack = [(0, len(starts))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if max_end[mid] < query_start:
+                continue
+            stack.append((lo, mid))
+            if starts[mid] <= query_end:
+                if ends[mid] >= query_start:
+                    found.append(mid)
+                stack.append((mid + 1, hi))
+        found.sort()
+        return [self._ranges[i] for i in found]
+
+    def overlapping_many(
+        self, queries: Iterable[datetime | TimeRange]
+    ) -> List[List[TimeRange]]:
+        """
+        Find the overlapping ranges for each query of a batch.
+
+        Args:
+            queries: Datetimes or ranges
+
+        Returns:
+            list[list[TimeRange]]: Overlapping ranges per query, in input order
+        """
+        return [self.overlapping(query) for query in queries]
+
+    def merged(self) -> List[TimeRange]:
+        """
+        Merge the indexed ranges that overlap.
+
+        Returns:
+            list[TimeRange]: Disjoint ranges sorted by start
+        """
+        return merge_ranges(self._ranges)
@@ -0,0 +1,190 @@
+"""
+Tests for the security claims module.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from spryx_core.security import claims as claims_module
+from spryx_core.security.claims import INTERN_POOL, AccessToken, InternPool
+
+
+def token_claims(**overrides):
+    claims = {
+        "iss": "https://auth.spryx.ai",
+        "sub": "user-1",
+        "aud": "spryx-api",
+        "iat": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "exp": datetime(2099, 1, 1, tzinfo=timezone.utc),
+        "jti": "token-1",
+        "meta": {"token_type": "user"},
+        "plt_context": {"role_id": "admin", "scopes": ["users:read", "users:write"]},
+        "org_context": {
+            "id": "org-1",
+            "role_id": "member",
+            "status": "active",
+            "scopes": ["users:read"],
+        },
+    }
+    claims.update(overrides)
+    return claims
+
+
+class TestAccessToken:
+    def test_valid_token(self):
+        """Test validating a complete token."""
+        token = AccessToken.model_validate(token_claims())
+
+        assert token.iss == "https://auth.spryx.ai"
+        assert token.plt_context.scopes == ("users:read", "users:write")
+        assert token.org_context.status == "active"
+
+    def test_expired_token(self):
+        """Test that expired tokens are rejected."""
+        expired = datetime.now(timezone.utc) - timedelta(seconds=1)
+        with pytest.raises(ValidationError, match="token already expired"):
+            AccessToken.model_validate(token_claims(exp=expired))
+
+    def test_extra_claims_forbidden(self):
+        """Test that unknown claims are rejected."""
+        with pytest.raises(ValidationError):
+            AccessToken.model_validate(token_claims(unknown="value"))
+
+
+class TestInterning:
+    def test_tokens_share_repeated_claims(self):
+        """Test that identical claims are shared between tokens."""
+        # Build the strings at runtime so they are not compile-time constants
+        first = AccessToken.model_validate(token_claims(iss="".join(["iss-", "shared"])))
+        second = AccessToken.model_validate(
+            token_claims(iss="".join(["iss-", "shared"]), sub="user-2", jti="token-2")
+        )
+
+        assert first.iss is second.iss
+        assert first.aud is second.aud
+        assert first.plt_context.role_id is second.plt_context.role_id
+        assert first.plt_context.scopes is second.plt_context.scopes
+        assert first.org_context.status is second.org_context.status
+        assert first.org_context.scopes[0] is second.plt_context.scopes[0]
+
+    def test_scopes_are_frozen(self):
+        """Test that scopes are stored as immutable tuples."""
+        token = AccessToken.model_validate(token_claims())
+        assert isinstance(token.plt_context.scopes, tuple)
+
+    def test_whitespace_is_stripped_before_interning(self):
+        """Test that interning sees the normalized value."""
+        token = AccessToken.model_validate(token_claims(iss="  https://auth.spryx.ai  "))
+        assert token.iss is INTERN_POOL.intern("https://auth.spryx.ai")
+
+    def test_pool_is_bounded(self):
+        """Test that a full pool stops growing and returns values as-is."""
+        pool = InternPool(maxsize=2)
+        a = pool.intern("".join(["a", "1"]))
+        pool.intern("b")
+
+        value = "".join(["c", "1"])
+        assert pool.intern(value) is value
+        assert len(pool) == 2
+        assert pool.intern("".join(["a", "1"])) is a
+
+        pool.clear()
+        assert len(pool) == 0
+
+
+class TestValidateMany:
+    def test_results_per_item(self):
+        """Test that failures are reported per item without raising."""
+        expired = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        payloads = [
+            token_claims(),
+            token_claims(exp=expired),
+            {"iss": "x"},
+            token_claims(),
+        ]
+
+        results = AccessToken.validate_many(payloads)
+
+        assert isinstance(results[0], AccessToken)
+        assert isinstance(results[1], ValidationError)
+        assert "token already expired" in str(results[1])
+        assert isinstance(results[2], ValidationError)
+        assert isinstance(results[3], AccessToken)
+
+    def test_naive_exp(self):
+        """Test that naive expiry times are checked as UTC, item by item."""
+        payloads = [
+            token_claims(exp="2099-01-01T00:00:00"),
+            token_claims(exp="2020-01-01T00:00:00"),
+            token_claims(),
+        ]
+
+        results = AccessToken.validate_many(payloads)
+
+        assert isinstance(results[0], AccessToken)
+        assert isinstance(results[1], ValidationError)
+        assert "token already expired" in str(results[1])
+        assert isinstance(results[2], AccessToken)
+
+    def test_clock_read_once(self, monkeypatch):
+        """Test that the batch reads the clock once for all payloads."""
+        reads = []
+
+        class Clock(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                reads.append(tz)
+                return datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+        monkeypatch.setattr(claims_module, "datetime", Clock)
+        payloads = [
+            token_claims(exp=datetime(2029, 12, 31, tzinfo=timezone.utc)),
+            token_claims(exp=datetime(2030, 1, 2, tzinfo=timezone.utc)),
+            token_claims(exp=datetime(2030, 1, 3, tzinfo=timezone.utc)),
+        ]
+
+        results = AccessToken.validate_many(payloads)
+
+        assert len(reads) == 1
+        assert isinstance(results[0], ValidationError)
+        assert isinstance(results[1], AccessToken)
+        assert isinstance(results[2], AccessToken)
+
+    def test_now_override(self):
+        """Test checking expiry against a given time, naive times taken as UTC."""
+        payloads = [
+            token_claims(exp=datetime(2029, 12, 31, tzinfo=timezone.utc)),
+            token_claims(exp=datetime(2030, 1, 2, tzinfo=timezone.utc)),
+        ]
+
+        for now in (datetime(2030, 1, 1, tzinfo=timezone.utc), datetime(2030, 1, 1)):
+            results = AccessToken.validate_many(payloads, now=now)
+
+            assert isinstance(results[0], ValidationError)
+            assert isinstance(results[1], AccessToken)
+
+    def test_matches_model_validate(self):
+        """Test that batch results equal single validation results."""
+        payload = token_claims()
+        expected = [AccessToken.model_validate(payload)]
+        assert AccessToken.validate_many([payload]) == expected
+
+    @pytest.mark.parametrize("executor_cls", [ThreadPoolExecutor, ProcessPoolExecutor])
+    def test_executor(self, executor_cls):
+        """Test spreading large batches over a pool."""
+        payloads = [token_claims(jti=f"token-{i}") for i in range(25)]
+        payloads[7] = token_claims(exp=datetime(2020, 1, 1, tzinfo=timezone.utc))
+
+        with executor_cls(max_workers=2) as executor:
+            results = AccessToken.validate_many(
+                payloads, executor=executor, chunk_size=4
+            )
+
+        assert len(results) == 25
+        assert isinstance(results[7], ValidationError)
+        assert [r.jti for i, r in enumerate(results) if i != 7] == [
+            f"token-{i}" for i in range(25) if i != 7
+        ]
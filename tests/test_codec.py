@@ -0,0 +1,138 @@
+"""
+Tests for the access token binary codec.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from spryx_core.security.claims import AccessToken
+from spryx_core.security.codec import decode_access_token, encode_access_token
+from spryx_core.security.scopes import ScopeRegistry, register_scope_registry
+
+register_scope_registry(
+    ScopeRegistry("codec.v1", ["users:read", "users:write", "billing:read", "admin"])
+)
+
+FUTURE = datetime(2099, 1, 1, 12, 30, 0, 654321, tzinfo=timezone.utc)
+
+
+def make_token(**overrides):
+    claims = {
+        "iss": "https://auth.spryx.ai",
+        "sub": "01H2XGMTVZ1QW1F4KJJNVD0YJR",
+        "aud": "spryx-api",
+        "iat": datetime(2024, 1, 1, 8, 0, 0, 123456, tzinfo=timezone.utc),
+        "exp": FUTURE,
+        "jti": "01H2XGMTVZ1QW1F4KJJNVD0YJS",
+        "meta": {"token_type": "user", "sid": "01H2XGMTVZ1QW1F4KJJNVD0YJT"},
+        "plt_context": {"role_id": "platform-admin", "scopes": ["users:read", "users:write"]},
+        "org_context": {
+            "id": "01H2XGMTVZ1QW1F4KJJNVD0YJV",
+            "role_id": "01H2XGMTVZ1QW1F4KJJNVD0YJW",
+            "status": "active",
+            "scopes": ["users:read", "billing:read"],
+        },
+    }
+    claims.update(overrides)
+    return AccessToken.model_validate(claims)
+
+
+class TestCodec:
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {},
+            {"aud": ["spryx-api", "spryx-web"]},
+            {"nbf": datetime(2024, 1, 1, tzinfo=timezone.utc)},
+            {"plt_context": None, "org_context": None},
+            {"meta": {"token_type": "app"}, "plt_context": None},
+            {"sub": "not-a-ulid", "jti": "7ZZZZZZZZZZZZZZZZZZZZZZZZZ"},
+            {"exp": datetime(2099, 1, 1, 9, 30, tzinfo=timezone(timedelta(hours=-3)))},
+            {"iat": datetime(2024, 1, 1, 8, 0, 0, 123456)},
+            {"exp": datetime(2099, 1, 1), "nbf": datetime(2024, 1, 1)},
+            {
+                "plt_context": {
+                    "role_id": "admin",
+                    "scopes": ["legacy:scope"],
+                    "scope_bits": 0b1011,
+                    "scope_reg": "codec.v1",
+                }
+            },
+        ],
+    )
+    def test_round_trip(self, overrides):
+        """Test that decoding returns an identical token."""
+        token = make_token(**overrides)
+        decoded = decode_access_token(encode_access_token(token))
+
+        assert decoded == token
+        assert decoded.model_dump() == token.model_dump()
+
+    def test_naive_timestamps_stay_naive(self):
+        """Test that naive timestamps do not come back timezone-aware."""
+        token = make_token(iat=datetime(2024, 1, 1), nbf=datetime(2024, 1, 1))
+        decoded = decode_access_token(encode_access_token(token))
+
+        assert decoded.iat.tzinfo is None
+        assert decoded.nbf.tzinfo is None
+        assert decoded.exp.tzinfo is timezone.utc
+
+    def test_org_without_status(self):
+        """Test round-tripping an org context without a status."""
+        token = make_token(
+            org_context={"id": "org-1", "role_id": "member", "scopes": []}
+        )
+        assert decode_access_token(encode_access_token(token)) == token
+
+    def test_smaller_than_json(self):
+        """Test that the binary form is smaller than the JSON form."""
+        token = make_token()
+        assert len(encode_access_token(token)) < len(token.model_dump_json()) // 2
+
+    def test_scope_table_deduplicates(self):
+        """Test that a scope shared by both contexts is stored once."""
+        encoded = encode_access_token(make_token())
+        assert encoded.count(b"users:read") == 1
+
+    def test_timestamps_are_epoch_integers(self):
+        """Test that timestamps are not stored as ISO strings."""
+        encoded = encode_access_token(make_token())
+        assert b"2099" not in encoded
+        assert int.from_bytes(encoded[11:19], "big") == 4_070_953_800_654_321
+
+    def test_unsupported_version(self):
+        """Test that unknown schema versions are rejected."""
+        with pytest.raises(ValueError, match="schema version"):
+            encode_access_token(make_token(ver=2))
+
+        encoded = bytearray(encode_access_token(make_token()))
+        encoded[1] = 2
+        with pytest.raises(ValueError, match="schema version"):
+            decode_access_token(bytes(encoded))
+
+    def test_malformed_data(self):
+        """Test that malformed data raises ValueError."""
+        encoded = encode_access_token(make_token())
+
+        with pytest.raises(ValueError):
+            decode_access_token(b"")
+        with pytest.raises(ValueError):
+            decode_access_token(b"\x00" + encoded[1:])
+        with pytest.raises(ValueError):
+            decode_access_token(encoded[:-3])
+        with pytest.raises(ValueError):
+            decode_access_token(encoded + b"\x00")
+
+    def test_expired_token_rejected(self):
+        """Test that decoding applies the regular token validation."""
+        token = make_token(exp=datetime.now(timezone.utc) + timedelta(seconds=1))
+        encoded = encode_access_token(token)
+        expired = bytearray(encoded)
+        # magic, ver and flags take one byte each, then iat and exp (8 bytes each)
+        exp = int.from_bytes(expired[11:19], "big", signed=True) - 86_400_000_000
+        expired[11:19] = exp.to_bytes(8, "big", signed=True)
+
+        with pytest.raises(ValidationError):
+            decode_access_token(bytes(expired))
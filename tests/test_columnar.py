@@ -0,0 +1,126 @@
+"""
+Tests for the columnar module.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from spryx_core.columnar import ColumnarReader, ColumnarWriter
+from spryx_core.id import entity_id_to_bytes, generate_entity_id
+from spryx_core.time import to_epoch_micros
+
+BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_rows(count: int):
+    return [
+        (generate_entity_id(), BASE + timedelta(microseconds=i * 1001))
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def export_file(tmp_path):
+    rows = make_rows(1000)
+    path = tmp_path / "export.spxc"
+    with ColumnarWriter(path) as writer:
+        writer.write_many(rows)
+        assert len(writer) == 1000
+    return path, rows
+
+
+class TestColumnar:
+    def test_round_trip(self, export_file):
+        """Test writing rows and reading them back."""
+        path, rows = export_file
+
+        with ColumnarReader(path) as reader:
+            assert len(reader) == 1000
+            assert list(reader) == rows
+            assert reader.id_at(10) == rows[10][0]
+            assert reader.timestamp_at(10) == rows[10][1]
+
+    def test_zero_copy_columns(self, export_file):
+        """Test the raw column views."""
+        path, rows = export_file
+        reader = ColumnarReader(path)
+
+        ids, timestamps = reader.ids, reader.timestamps
+        assert ids.nbytes == 1000 * 16
+        assert bytes(ids[:16]) == entity_id_to_bytes(rows[0][0])
+        assert list(timestamps[:3]) == [to_epoch_micros(dt) for _, dt in rows[:3]]
+        assert ids.readonly
+
+        ids.release()
+        timestamps.release()
+        reader.close()
+
+    def test_chunked_iteration(self, export_file):
+        """Test reading the columns in chunks."""
+        path, rows = export_file
+
+        with ColumnarReader(path) as reader:
+            sizes = []
+            for ids, timestamps in reader.iter_chunks(size=300):
+                assert ids.nbytes == len(timestamps) * 16
+                sizes.append(len(timestamps))
+                ids.release()
+                timestamps.release()
+
+        assert sizes == [300, 300, 300, 100]
+
+    def test_binary_ids_and_integer_timestamps(self, tmp_path):
+        """Test writing pre-encoded IDs and epoch-microsecond timestamps."""
+        entity_id = generate_entity_id()
+        path = tmp_path / "raw.spxc"
+        with ColumnarWriter(path) as writer:
+            writer.write(entity_id_to_bytes(entity_id), 1_700_000_000_000_000)
+
+        with ColumnarReader(path) as reader:
+            assert list(reader) == [
+                (entity_id, datetime.fromtimestamp(1_700_000_000, tz=timezone.utc))
+            ]
+
+    def test_empty_file(self, tmp_path):
+        """Test a file without rows."""
+        path = tmp_path / "empty.spxc"
+        ColumnarWriter(path).close()
+
+        with ColumnarReader(path) as reader:
+            assert len(reader) == 0
+            assert list(reader) == []
+
+    def test_invalid_files(self, tmp_path, export_file):
+        """Test that invalid or truncated files are rejected."""
+        path, _ = export_file
+        truncated = tmp_path / "truncated.spxc"
+        truncated.write_bytes(path.read_bytes()[:-8])
+        other = tmp_path / "other.bin"
+        other.write_bytes(b"x" * 64)
+        tiny = tmp_path / "tiny.bin"
+        tiny.write_bytes(b"SPXC")
+
+        for invalid in (truncated, other, tiny):
+            with pytest.raises(ValueError):
+                ColumnarReader(invalid)
+
+    def test_invalid_rows(self, tmp_path):
+        """Test that invalid IDs are rejected by the writer."""
+        with ColumnarWriter(tmp_path / "bad.spxc") as writer:
+            with pytest.raises(ValueError):
+                writer.write("not-a-ulid", BASE)
+            with pytest.raises(ValueError):
+                writer.write(b"short", BASE)
+
+    def test_numpy_views(self, export_file):
+        """Test NumPy arrays backed by the mapping."""
+        np = pytest.importorskip("numpy")
+        path, rows = export_file
+        reader = ColumnarReader(path)
+
+        ids, timestamps = reader.to_numpy()
+        assert ids.shape == (1000, 16)
+        assert timestamps.dtype == np.dtype("<i8")
+        assert bytes(ids[5]) == entity_id_to_bytes(rows[5][0])
+        assert int(timestamps[5]) == to_epoch_micros(rows[5][1])
@@ -0,0 +1,143 @@
+"""
+Tests for the errors module.
+"""
+
+import logging
+from enum import StrEnum
+
+from spryx_core.errors import (
+    ErrorReport,
+    ErrorReporter,
+    LoggingErrorSink,
+    SpryxError,
+    error_fingerprint,
+    normalize_message,
+)
+
+
+class Code(StrEnum):
+    UNAVAILABLE = "unavailable"
+    NOT_FOUND = "not_found"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ListSink:
+    def __init__(self):
+        self.reports = []
+
+    def emit(self, report):
+        self.reports.append(report)
+
+
+def make_reporter(**kwargs):
+    sink, clock = ListSink(), FakeClock()
+    options = {"rate": 1.0, "burst": 2, "window": 10.0, **kwargs}
+    return ErrorReporter(sink, clock=clock, **options), sink, clock
+
+
+class TestFingerprint:
+    def test_normalize_message(self):
+        """Test that variable parts of messages are replaced."""
+        assert (
+            normalize_message("User 01H2XGMTVZ1QW1F4KJJNVD0YJR not found after 3 tries")
+            == "User <ulid> not found after <n> tries"
+        )
+        assert (
+            normalize_message("Row 3f2a9c1e-0b6d-4b1a-9d3e-2a1b3c4d5e6f at 0xdeadbeef")
+            == "Row <uuid> at <hex>"
+        )
+        assert normalize_message("Database unavailable") == "Database unavailable"
+
+    def test_same_error_different_ids(self):
+        """Test that errors differing only in ids share a fingerprint."""
+        first = SpryxError(Code.NOT_FOUND, "User 01H2XGMTVZ1QW1F4KJJNVD0YJR not found")
+        second = SpryxError(Code.NOT_FOUND, "User 01H2XGMTVZ1QW1F4KJJNVD0YJS not found")
+        other = SpryxError(Code.UNAVAILABLE, "User 01H2XGMTVZ1QW1F4KJJNVD0YJS not found")
+
+        assert error_fingerprint(first) == error_fingerprint(second)
+        assert error_fingerprint(first) != error_fingerprint(other)
+
+
+class TestErrorReporter:
+    def test_burst_then_coalesce(self):
+        """Test that repeats past the burst are counted, not emitted."""
+        reporter, sink, clock = make_reporter()
+        error = SpryxError(Code.UNAVAILABLE, "Database unavailable")
+
+        results = [reporter.report(error) for _ in range(5)]
+
+        assert results == [True, True, False, False, False]
+        assert len(sink.reports) == 2
+        assert reporter.flush() == 1
+        assert sink.reports[-1].count == 3
+        assert reporter.flush() == 0
+
+    def test_tokens_refill(self):
+        """Test that the bucket refills at the configured rate."""
+        reporter, sink, clock = make_reporter()
+        error = SpryxError(Code.UNAVAILABLE, "Database unavailable")
+        for _ in range(3):
+            reporter.report(error)
+
+        clock.now = 1.0
+        assert reporter.report(error) is True
+        assert reporter.report(error) is False
+
+    def test_summary_per_window(self):
+        """Test that a summary is emitted once the window has elapsed."""
+        reporter, sink, clock = make_reporter(rate=0.0)
+        error = SpryxError(Code.UNAVAILABLE, "Database unavailable")
+        for _ in range(2):
+            reporter.report(error)
+
+        for step in range(11):
+            clock.now = float(step)
+            reporter.report(error)
+
+        summaries = [r for r in sink.reports if r.count > 1]
+        assert len(summaries) == 1
+        assert summaries[0].count == 11
+        assert summaries[0].duration == 10.0
+
+    def test_fingerprints_are_independent(self):
+        """Test that each fingerprint has its own budget."""
+        reporter, sink, clock = make_reporter(burst=1)
+
+        assert reporter.report(SpryxError(Code.UNAVAILABLE, "Cache down"))
+        assert reporter.report(SpryxError(Code.UNAVAILABLE, "Queue down"))
+        assert not reporter.report(SpryxError(Code.UNAVAILABLE, "Cache down"))
+        assert len(reporter) == 2
+
+    def test_bounded_fingerprints(self):
+        """Test that the oldest fingerprint is summarized and dropped when full."""
+        reporter, sink, clock = make_reporter(burst=1, max_fingerprints=2)
+        for message in ["A", "A", "B", "C"]:
+            reporter.report(SpryxError(Code.UNAVAILABLE, message))
+
+        assert len(reporter) == 2
+        assert [(r.error.message, r.count) for r in sink.reports] == [
+            ("A", 1),
+            ("B", 1),
+            ("A", 1),
+            ("C", 1),
+        ]
+
+    def test_logging_sink(self, caplog):
+        """Test the log lines written for single errors and summaries."""
+        sink = LoggingErrorSink()
+        error = SpryxError(Code.UNAVAILABLE, "Database unavailable")
+
+        with caplog.at_level(logging.ERROR, logger="spryx_core.errors"):
+            sink.emit(ErrorReport(error_fingerprint(error), error))
+            sink.emit(ErrorReport(error_fingerprint(error), error, 42, 60.0))
+
+        assert "unavailable: Database unavailable" in caplog.records[0].message
+        assert "repeated 42 times in 60.0s" in caplog.records[1].message
+        assert caplog.records[1].error == error.to_dict()
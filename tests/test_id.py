@@ -2,12 +2,32 @@
 Tests for the ID module.
 """
 
+import asyncio
+import copy
+import os
+import pickle
 import re
-import uuid
-from unittest.mock import patch
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 
+import pytest
 
-from spryx_core.id import EntityId, cast_entity_id, generate_entity_id, is_valid_ulid
+from spryx_core.id import (
+    EntityId,
+    EntityIdPool,
+    EntityIdSet,
+    SeenIdFilter,
+    ShardRouter,
+    TimePartitionRouter,
+    cast_entity_id,
+    entity_id_from_bytes,
+    entity_id_from_int,
+    entity_id_to_bytes,
+    entity_id_to_int,
+    generate_entity_id,
+    is_valid_ulid,
+)
 
 
 class TestId:
@@ -26,15 +46,6 @@ class TestId:
         assert len(entity_id) == 26
         assert re.match(r"^[0-9A-HJKMNP-TV-Z]{26}$", entity_id)
 
-    @patch("spryx_core.id._has_ulid", False)
-    def test_generate_entity_id_with_uuid_fallback(self):
-        """Test entity ID generation with UUID fallback."""
-        mock_uuid = "12345678-1234-5678-1234-567812345678"
-        with patch("uuid.uuid4", return_value=uuid.UUID(mock_uuid)):
-            entity_id = generate_entity_id()
-            assert isinstance(entity_id, str)
-            assert entity_id == mock_uuid
-
     def test_is_valid_ulid(self):
         """Test ULID validation."""
         # Valid ULID
@@ -54,3 +65,443 @@ class TestId:
         entity_id = cast_entity_id(id_value)
         assert isinstance(entity_id, str)
         assert entity_id == id_value
+
+    def test_entity_id_binary_round_trip(self):
+        """Test converting ULIDs to and from their binary form."""
+        entity_id = generate_entity_id()
+        binary = entity_id_to_bytes(entity_id)
+
+        assert len(binary) == 16
+        assert entity_id_from_bytes(binary) == entity_id
+        assert entity_id_from_int(entity_id_to_int(entity_id)) == entity_id
+        assert entity_id_from_bytes(bytes(16)) == "0" * 26
+        assert entity_id_from_bytes(b"\xff" * 16) == "7" + "Z" * 25
+
+    def test_entity_id_binary_order(self):
+        """Test that the binary form sorts like the string form."""
+        ids = sorted(generate_entity_id() for _ in range(100))
+        assert sorted(ids, key=entity_id_to_bytes) == ids
+
+    def test_entity_id_binary_invalid(self):
+        """Test that non-ULID values are rejected."""
+        with pytest.raises(ValueError):
+            entity_id_to_bytes("not-a-ulid")
+        with pytest.raises(ValueError):
+            entity_id_to_bytes("8" + "0" * 25)  # Overflows 128 bits
+        with pytest.raises(ValueError):
+            entity_id_from_bytes(b"\x00" * 15)
+        with pytest.raises(ValueError):
+            entity_id_from_int(1 << 128)
+        with pytest.raises(ValueError):
+            entity_id_from_int(-1)
+
+    def test_entity_id_from_int_matches_base32(self):
+        """Test the table-based encoder against Crockford base32 of the value."""
+        alphabet = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+        for _ in range(200):
+            value = int.from_bytes(os.urandom(16), "big")
+            expected = "".join(alphabet[value >> (125 - 5 * i) & 31] for i in range(26))
+            assert entity_id_from_int(value) == expected
+
+
+def make_id(ms: int, rand: int = 0) -> EntityId:
+    """Build a ULID with a given millisecond timestamp and random part."""
+    return entity_id_from_int((ms << 80) | rand)
+
+
+class TestEntityIdSet:
+    def test_membership_and_order(self):
+        """Test membership checks and ordered iteration."""
+        ids = [generate_entity_id() for _ in range(200)]
+        id_set = EntityIdSet(reversed(ids + ids[:10]))
+
+        assert len(id_set) == 200
+        assert list(id_set) == sorted(ids)
+        assert all(entity_id in id_set for entity_id in ids)
+        assert generate_entity_id() not in id_set
+        assert "not-a-ulid" not in id_set
+        assert 42 not in id_set
+        assert id_set[0] == min(ids)
+        assert id_set[-1] == max(ids)
+        with pytest.raises(IndexError):
+            id_set[200]
+
+    def test_invalid_ids_rejected(self):
+        """Test that only ULIDs can be stored."""
+        with pytest.raises(ValueError):
+            EntityIdSet(["12345678-1234-5678-1234-567812345678"])
+
+    def test_set_operations(self):
+        """Test union, intersection and difference."""
+        a_ids = {make_id(ms) for ms in range(0, 100, 2)}
+        b_ids = {make_id(ms) for ms in range(0, 100, 3)}
+        a, b = EntityIdSet(a_ids), EntityIdSet(b_ids)
+
+        assert list(a | b) == sorted(a_ids | b_ids)
+        assert list(a & b) == sorted(a_ids & b_ids)
+        assert list(a - b) == sorted(a_ids - b_ids)
+        assert list(b - a) == sorted(b_ids - a_ids)
+        assert a | EntityIdSet() == a
+        assert len(a & EntityIdSet()) == 0
+
+    def test_between(self):
+        """Test time-range slicing on the ULID timestamp prefix."""
+        base = 1_700_000_000_000
+        id_set = EntityIdSet(
+            make_id(base + offset, rand) for offset in range(10) for rand in (1, 2)
+        )
+
+        start = datetime.fromtimestamp((base + 3) / 1000, tz=timezone.utc)
+        end = datetime.fromtimestamp((base + 5) / 1000, tz=timezone.utc)
+        window = id_set.between(start, end)
+
+        assert len(window) == 6
+        assert list(window) == [make_id(base + o, r) for o in (3, 4, 5) for r in (1, 2)]
+        assert len(id_set.between(end, start)) == 0
+        before_epoch = datetime(1960, 1, 1, tzinfo=timezone.utc)
+        assert len(id_set.between(before_epoch, start)) == 8
+
+    def test_serialization(self, tmp_path):
+        """Test serializing, reloading and memory-mapping a set."""
+        id_set = EntityIdSet(generate_entity_id() for _ in range(50))
+        data = id_set.to_bytes()
+
+        assert len(data) == 50 * 16
+        assert EntityIdSet.from_buffer(data) == id_set
+
+        path = tmp_path / "ids.bin"
+        id_set.write(path)
+        mapped = EntityIdSet.open(path)
+        assert mapped == id_set
+        assert id_set[7] in mapped
+
+        (tmp_path / "empty.bin").write_bytes(b"")
+        assert len(EntityIdSet.open(tmp_path / "empty.bin")) == 0
+
+    def test_pickle_and_copy(self, tmp_path):
+        """Test that sets, including memory-mapped ones, pickle and copy."""
+        id_set = EntityIdSet(generate_entity_id() for _ in range(50))
+        path = tmp_path / "ids.bin"
+        id_set.write(path)
+
+        for original in (id_set, EntityIdSet.open(path), EntityIdSet()):
+            restored = pickle.loads(pickle.dumps(original))
+            assert restored == original
+            assert list(restored) == list(original)
+            assert copy.deepcopy(original) == original
+            assert copy.copy(original) == original
+
+    def test_from_buffer_validation(self):
+        """Test that corrupt buffers are rejected."""
+        data = EntityIdSet([make_id(1), make_id(2)]).to_bytes()
+
+        with pytest.raises(ValueError):
+            EntityIdSet.from_buffer(data[:-1])
+        with pytest.raises(ValueError):
+            EntityIdSet.from_buffer(data[16:] + data[:16])
+        with pytest.raises(ValueError):
+            EntityIdSet.from_buffer(data[:16] * 2)
+
+
+def random_ids(ms: int, count: int):
+    return [make_id(ms, int.from_bytes(os.urandom(10), "big")) for _ in range(count)]
+
+
+class TestSeenIdFilter:
+    def test_add_and_contains(self):
+        """Test that added IDs are reported as seen."""
+        seen = SeenIdFilter(capacity=1000, error_rate=0.01)
+        entity_id = generate_entity_id()
+
+        assert entity_id not in seen
+        assert seen.add(entity_id) is False
+        assert entity_id in seen
+        assert seen.add(entity_id) is True
+
+    def test_batch_api(self):
+        """Test add_many and contains_many."""
+        seen = SeenIdFilter(capacity=1000, error_rate=0.001)
+        ids = [generate_entity_id() for _ in range(100)]
+
+        assert seen.add_many(ids[:50] + ids[:1]) == [False] * 50 + [True]
+        assert seen.contains_many(ids[:50]) == [True] * 50
+        assert sum(seen.contains_many(ids[50:])) <= 1
+
+    def test_measured_false_positive_rate(self):
+        """Test that the measured false-positive rate is close to the target."""
+        seen = SeenIdFilter(capacity=5000, error_rate=0.01)
+        ms = 1_700_000_000_000
+        seen.add_many(random_ids(ms, 5000))
+
+        false_positives = sum(seen.contains_many(random_ids(ms, 20000)))
+
+        assert false_positives / 20000 < 0.02
+        assert seen.estimated_false_positive_rate() < 0.02
+
+    def test_monotonic_ids(self):
+        """Test IDs generated within the same millisecond (monotonic increments)."""
+        seen = SeenIdFilter(capacity=2000, error_rate=0.01)
+        ms, base = 1_700_000_000_000, int.from_bytes(os.urandom(9), "big")
+        ids = [make_id(ms, base + offset) for offset in range(2000)]
+
+        assert seen.add_many(ids[:1000]) == [False] * 1000
+        assert sum(seen.contains_many(ids[1000:])) < 20
+
+    def test_false_positive_rate_after_bursts(self):
+        """Test the rate against random IDs after filling with same-ms bursts."""
+        seen = SeenIdFilter(capacity=10000, error_rate=0.01)
+        ms = 1_700_000_000_000
+        for burst in range(10):
+            base = int.from_bytes(os.urandom(9), "big")
+            seen.add_many(make_id(ms, base + offset) for offset in range(1000))
+
+        false_positives = sum(seen.contains_many(random_ids(ms, 20000)))
+
+        assert false_positives / 20000 < 0.015
+
+    def test_future_ids_do_not_rotate_window(self):
+        """Test that an ID far in the future is not stored and evicts nothing."""
+        now_ms = 1_700_000_000_000
+        seen = SeenIdFilter(
+            capacity=100,
+            partition=timedelta(minutes=1),
+            retention=timedelta(minutes=5),
+            max_skew=timedelta(minutes=1),
+            clock=lambda: now_ms / 1000,
+        )
+        recent = make_id(now_ms, 1)
+        seen.add(recent)
+
+        future = make_id(now_ms + 10**10, 2)
+        assert seen.add(future) is False
+        assert seen.add(future) is False
+        assert future not in seen
+        assert seen.partitions == 1
+        assert seen.add(recent) is True
+
+    def test_redelivery_after_clock_advances(self):
+        """Test that a redelivered ID within the skew is seen as the clock moves."""
+        clock = [1_700_000_000.0]
+        seen = SeenIdFilter(
+            capacity=100,
+            partition=timedelta(minutes=1),
+            retention=timedelta(minutes=10),
+            max_skew=timedelta(minutes=5),
+            clock=lambda: clock[0],
+        )
+        ahead = make_id(int(clock[0] * 1000) + 4 * 60_000, 1)
+        assert seen.add(ahead) is False
+
+        clock[0] += 2 * 60
+        assert seen.add(ahead) is True
+
+        beyond = make_id(int(clock[0] * 1000) + 30 * 60_000, 2)
+        assert seen.add(beyond) is False
+        clock[0] += 2 * 60
+        assert seen.add(beyond) is False
+        clock[0] += 30 * 60
+        assert seen.add(beyond) is False
+        assert seen.add(beyond) is True
+
+    def test_partitions_age_out(self):
+        """Test that IDs older than the retention window are forgotten."""
+        seen = SeenIdFilter(
+            capacity=100, partition=timedelta(minutes=1), retention=timedelta(minutes=5)
+        )
+        start = 1_700_000_000_000
+        old_id = make_id(start, 1)
+        seen.add(old_id)
+
+        seen.add(make_id(start + 4 * 60_000, 2))
+        assert old_id in seen
+        assert seen.partitions == 2
+
+        seen.add(make_id(start + 5 * 60_000, 3))
+        assert old_id not in seen
+        assert seen.add(old_id) is False
+        assert old_id not in seen
+        assert seen.partitions == 2
+
+    def test_memory_stays_flat(self):
+        """Test that memory is bounded by the number of partitions."""
+        seen = SeenIdFilter(
+            capacity=100, partition=timedelta(minutes=1), retention=timedelta(minutes=3)
+        )
+        for minute in range(60):
+            seen.add(make_id(1_700_000_000_000 + minute * 60_000, minute))
+
+        assert seen.partitions == 3
+        assert seen.memory_bytes == 3 * ((seen.num_bits + 7) // 8)
+
+    def test_invalid_arguments(self):
+        """Test that invalid settings and IDs are rejected."""
+        with pytest.raises(ValueError):
+            SeenIdFilter(capacity=0)
+        with pytest.raises(ValueError):
+            SeenIdFilter(capacity=10, error_rate=1)
+        with pytest.raises(ValueError):
+            SeenIdFilter(capacity=10).add("not-a-ulid")
+
+
+class TestRouters:
+    def test_shard_distribution(self):
+        """Test that IDs are spread evenly across shards."""
+        router = ShardRouter(8)
+        ids = [generate_entity_id() for _ in range(16000)]
+
+        counts = Counter(router.route_many(ids))
+
+        assert sorted(counts) == list(range(8))
+        assert all(1700 < count < 2300 for count in counts.values())
+
+    def test_shard_distribution_monotonic(self):
+        """Test uniformity for IDs generated within the same millisecond."""
+        router = ShardRouter(8)
+        base = int.from_bytes(os.urandom(9), "big")
+        ids = [make_id(1_700_000_000_000, base + offset) for offset in range(16000)]
+
+        counts = Counter(router.route_many(ids))
+        assert all(1700 < count < 2300 for count in counts.values())
+
+    def test_shard_minimal_movement(self):
+        """Test that adding a shard only moves IDs to the new shard."""
+        ids = [generate_entity_id() for _ in range(10000)]
+        before = ShardRouter(10).route_many(ids)
+        after = ShardRouter(11).route_many(ids)
+
+        moved = [(old, new) for old, new in zip(before, after) if old != new]
+        assert all(new == 10 for _, new in moved)
+        assert 0.06 < len(moved) / len(ids) < 0.12
+
+    def test_route_matches_route_many(self):
+        """Test that single and batch routing agree."""
+        router = ShardRouter(5)
+        entity_id = generate_entity_id()
+        assert router.route(entity_id) == router.route_many([entity_id])[0]
+        assert ShardRouter(1).route(entity_id) == 0
+
+    def test_time_partition_router(self):
+        """Test routing by the ULID timestamp prefix."""
+        router = TimePartitionRouter(timedelta(days=1))
+        ms = int(datetime(2024, 5, 6, 13, 30, tzinfo=timezone.utc).timestamp() * 1000)
+
+        assert router.route(make_id(ms, 1)) == datetime(2024, 5, 6, tzinfo=timezone.utc)
+        assert router.route_many([make_id(ms, 1), make_id(ms + 86_400_000, 1)]) == [
+            datetime(2024, 5, 6, tzinfo=timezone.utc),
+            datetime(2024, 5, 7, tzinfo=timezone.utc),
+        ]
+
+    def test_invalid_router_settings(self):
+        """Test that invalid routers and IDs are rejected."""
+        with pytest.raises(ValueError):
+            ShardRouter(0)
+        with pytest.raises(ValueError):
+            TimePartitionRouter(timedelta(0))
+        with pytest.raises(ValueError):
+            ShardRouter(4).route("not-a-ulid")
+
+
+class TestEntityIdPool:
+    def test_next_id_uses_buffer(self):
+        """Test that a filled pool hands out buffered, unique IDs."""
+        pool = EntityIdPool(size=64, low_water=8)
+
+        async def take():
+            await pool.fill()
+            assert pool.fill_level == 64
+            return [pool.next_id() for _ in range(40)]
+
+        ids = asyncio.run(take())
+        assert len(set(ids)) == 40
+        assert all(is_valid_ulid(entity_id) for entity_id in ids)
+        assert pool.fill_level == 24
+        assert pool.refills == 1
+        assert pool.last_refill_seconds > 0
+
+    def test_refills_below_low_water(self):
+        """Test that draining below the low-water mark refills in the background."""
+        pool = EntityIdPool(size=16, low_water=4, max_age=None)
+
+        async def drain():
+            await pool.fill()
+            ids = [pool.next_id() for _ in range(14)]
+            await asyncio.sleep(0.1)
+            return ids
+
+        ids = asyncio.run(drain())
+        assert pool.refills == 2
+        assert pool.fill_level == 18
+        assert len(set(ids)) == 14
+
+    def test_without_event_loop(self):
+        """Test that the pool generates inline when no loop is running."""
+        pool = EntityIdPool(size=8)
+        assert is_valid_ulid(pool.next_id())
+        assert pool.fill_level == 0
+
+    def test_refill_runs_in_chunks_on_loop(self):
+        """Test that a refill is split into loop callbacks of ``chunk`` IDs."""
+        pool = EntityIdPool(size=10, chunk=3)
+
+        async def refill():
+            pool.next_id()
+            levels = []
+            while pool.refills == 0:
+                levels.append(pool.fill_level)
+                await asyncio.sleep(0)
+            return levels
+
+        levels = asyncio.run(refill())
+        assert len(levels) >= 4
+        assert set(levels) == {0}
+        assert pool.fill_level == 10
+
+    def test_executor_refill(self):
+        """Test that refills can run in an executor."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pool = EntityIdPool(size=32, executor=executor)
+
+            async def take():
+                await pool.fill()
+                return [pool.next_id() for _ in range(32)]
+
+            ids = asyncio.run(take())
+        assert len(set(ids)) == 32
+        assert ids == sorted(ids)
+
+    def test_max_age_defaults_to_one_second(self):
+        """Test that buffered IDs expire after a second by default."""
+        assert EntityIdPool().max_age == 1.0
+
+    def test_max_age(self):
+        """Test that stale buffered IDs are discarded."""
+        pool = EntityIdPool(size=8, low_water=0, max_age=0.01)
+
+        async def take():
+            await pool.fill()
+            await asyncio.sleep(0.05)
+            pool.next_id()
+            return pool.fill_level
+
+        assert asyncio.run(take()) == 0
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_fork_drops_buffer(self):
+        """Test that a forked child does not reuse the parent's buffered IDs."""
+        pool = EntityIdPool(size=32)
+        asyncio.run(pool.fill())
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - child process
+            os.close(read_fd)
+            os.write(write_fd, f"{pool.fill_level} {pool.next_id()}".encode())
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as reader:
+            child_level, child_id = reader.read().split()
+        os.waitpid(pid, 0)
+
+        assert child_level == "0"
+        parent_ids = [pool.next_id() for _ in range(32)]
+        assert child_id not in parent_ids
@@ -0,0 +1,162 @@
+"""
+Tests for the instrumentation module.
+"""
+
+import json
+import logging
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+from pydantic_core import SchemaValidator
+
+from spryx_core import instrumentation
+from spryx_core.id import generate_entity_id
+from spryx_core.pagination import CachedCount, Page
+from spryx_core.security.claims import AccessToken
+from spryx_core.serialization import dumps
+from spryx_core.time import parse_iso, to_iso
+
+
+CLAIMS = {
+    "iss": "spryx",
+    "sub": "user",
+    "aud": "api",
+    "iat": "2024-01-01T00:00:00Z",
+    "exp": "2099-01-01T00:00:00Z",
+    "jti": "token",
+    "meta": {"token_type": "app"},
+}
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class TestInstrumentation:
+    def test_disabled_by_default(self):
+        """Test that nothing is recorded while instrumentation is off."""
+        instrumentation.reset()
+        assert instrumentation.is_enabled() is False
+
+        generate_entity_id()
+        parse_iso("2024-01-01T00:00:00Z")
+
+        assert instrumentation.snapshot() == []
+
+    def test_hot_paths_are_counted(self, enabled):
+        """Test that the instrumented hot paths record calls and latency."""
+        for _ in range(3):
+            generate_entity_id()
+        to_iso(parse_iso("2024-01-01T00:00:00Z"))
+        dumps(Page(items=[1], page=1, page_size=1, total=1))
+        AccessToken.model_validate(CLAIMS)
+
+        sink = instrumentation.InMemorySink()
+        instrumentation.export(sink)
+        metrics = sink.latest
+
+        assert metrics["id.generate_entity_id"].calls == 3
+        assert sum(metrics["id.generate_entity_id"].buckets) == 3
+        assert metrics["time.parse_iso"].calls == 1
+        assert metrics["time.to_iso"].calls == 1
+        assert metrics["serialization.dumps"].calls == 1
+        assert metrics["security.access_token.validate"].calls == 1
+        assert metrics["time.to_iso"].total_seconds > 0
+
+    def test_validation_entry_points_are_counted(self, enabled):
+        """Test that every way of building a token hits the validation probe."""
+        AccessToken(**CLAIMS)
+        AccessToken.model_validate(CLAIMS)
+        token = AccessToken.model_validate_json(json.dumps(CLAIMS))
+        with pytest.raises(ValidationError):
+            AccessToken.model_validate({**CLAIMS, "exp": "2000-01-01T00:00:00Z"})
+
+        snapshot = instrumentation.probe("security.access_token.validate").snapshot()
+        assert token.sub == "user"
+        assert snapshot.calls == 4
+        assert snapshot.errors == 1
+
+    def test_page_dump_json_is_counted(self, enabled):
+        """Test that Pydantic's own JSON dump of a page hits the page probe."""
+        page = Page(items=[1, 2], page=1, page_size=2, total=4)
+        page.model_dump_json()
+        page.model_dump_json(indent=2)
+
+        assert instrumentation.probe("pagination.page.model_dump_json").calls == 2
+
+    def test_validator_hook_follows_toggle(self, enabled):
+        """Test that the validator proxy is only installed while enabled."""
+        assert not isinstance(AccessToken.__pydantic_validator__, SchemaValidator)
+        instrumentation.disable()
+        assert isinstance(AccessToken.__pydantic_validator__, SchemaValidator)
+
+    def test_on_toggle(self, enabled):
+        """Test that toggle callbacks get the current and every new state."""
+        states = []
+        instrumentation.on_toggle(states.append)
+        instrumentation.disable()
+        instrumentation.enable()
+
+        assert states == [True, False, True]
+        instrumentation._toggle_callbacks.remove(states.append)
+
+    def test_errors_are_counted(self, enabled):
+        """Test that failing calls are recorded as errors and re-raised."""
+        with pytest.raises(ValueError):
+            parse_iso("not a date")
+
+        snapshot = instrumentation.probe("time.parse_iso").snapshot()
+        assert snapshot.calls == 1
+        assert snapshot.errors == 1
+
+    def test_cache_hit_ratio(self, enabled):
+        """Test cache hit ratios reported by CachedCount."""
+        counts = CachedCount(lambda key: 1)
+        for key in ("a", "a", "a", "b"):
+            counts.count(key)
+
+        snapshot = instrumentation.probe("pagination.cached_count").snapshot()
+        assert snapshot.cache_hits == 2
+        assert snapshot.cache_misses == 2
+        assert snapshot.cache_hit_ratio == 0.5
+
+    def test_disable_keeps_metrics(self, enabled):
+        """Test that disabling stops collection without clearing metrics."""
+        generate_entity_id()
+        instrumentation.disable()
+        generate_entity_id()
+
+        assert instrumentation.probe("id.generate_entity_id").calls == 1
+
+    def test_new_probe_follows_global_toggle(self, enabled):
+        """Test that probes created after enable() are active."""
+        assert instrumentation.probe("test.late_probe").active is True
+
+    def test_logging_sink(self, enabled, caplog):
+        """Test that the logging sink writes one line per probe."""
+        generate_entity_id()
+
+        with caplog.at_level(logging.INFO, logger="spryx_core.instrumentation"):
+            instrumentation.export(instrumentation.LoggingSink())
+
+        assert "id.generate_entity_id calls=1 errors=0" in caplog.text
+
+    def test_prometheus_text(self, enabled):
+        """Test the Prometheus text exposition output."""
+        to_iso(datetime(2024, 1, 1, tzinfo=timezone.utc))
+        CachedCount(lambda key: 1).count("a")
+
+        sink = instrumentation.PrometheusTextSink()
+        instrumentation.export(sink)
+
+        assert "# TYPE spryx_core_time_to_iso_seconds histogram" in sink.text
+        assert 'spryx_core_time_to_iso_seconds_bucket{le="+Inf"} 1' in sink.text
+        assert "spryx_core_time_to_iso_seconds_count 1" in sink.text
+        assert "spryx_core_pagination_cached_count_cache_misses_total 1" in sink.text
+        assert instrumentation.prometheus_text([]) == ""
@@ -2,10 +2,28 @@
 Tests for the pagination module.
 """
 
+import array
+import json
+from datetime import timedelta
+from types import SimpleNamespace
+from urllib.parse import parse_qsl
+
 import pytest
-from pydantic import ValidationError
+from pydantic import Field, ValidationError
 
-from spryx_core.pagination import Page
+from spryx_core.id import entity_id_from_int, entity_id_timestamp
+from spryx_core.pagination import (
+    CachedCount,
+    ChangeFeed,
+    ColumnarPage,
+    EstimatedCount,
+    ExactCount,
+    InMemoryWatermarkStore,
+    Page,
+    PageFilter,
+    TotalCount,
+    Watermark,
+)
 
 
 class TestPagination:
@@ -95,3 +113,374 @@ class TestPagination:
         int_page = Page(items=[1, 2, 3], page=1, page_size=3, total=3)
         assert len(int_page.items) == 3
         assert int_page.items[0] == 1
+
+
+class FakeCountSource:
+    """In-memory count source that records how often it was queried."""
+
+    def __init__(self, totals):
+        self.totals = totals
+        self.calls = 0
+
+    def __call__(self, key):
+        self.calls += 1
+        return self.totals[key]
+
+
+class TestTotalCount:
+    def test_page_without_total(self):
+        """Test that an uncounted page relies on has_more for navigation."""
+        page = Page(items=[1, 2], page=1, page_size=2, has_more=True)
+
+        assert page.total is None
+        assert page.total_pages is None
+        assert page.has_next is True
+        assert page.next_page == 2
+
+        last = Page(items=[3], page=2, page_size=2, has_more=False)
+        assert last.has_next is False
+        assert last.next_page is None
+
+    def test_from_overfetch(self):
+        """Test has-more detection by over-fetching one row."""
+        page = Page.from_overfetch([1, 2, 3, 4], page=1, page_size=3)
+        assert page.items == [1, 2, 3]
+        assert page.has_more is True
+        assert page.has_next is True
+
+        page = Page.from_overfetch([1, 2, 3], page=1, page_size=3)
+        assert page.items == [1, 2, 3]
+        assert page.has_next is False
+
+    def test_exact_count(self):
+        """Test that ExactCount queries the source every time."""
+        source = FakeCountSource({"active": 10})
+        provider = ExactCount(source)
+
+        assert provider.count("active") == TotalCount(10, is_estimate=False)
+        provider.count("active")
+        assert source.calls == 2
+
+    def test_cached_count(self):
+        """Test that CachedCount caches per key until the TTL expires."""
+        now = [0.0]
+        source = FakeCountSource({"a": 10, "b": 20})
+        provider = CachedCount(source, ttl=5, clock=lambda: now[0])
+
+        assert provider.count("a").value == 10
+        assert provider.count("a").value == 10
+        assert provider.count("b").value == 20
+        assert source.calls == 2
+
+        source.totals["a"] = 11
+        now[0] = 4.9
+        assert provider.count("a").value == 10
+        now[0] = 5.0
+        assert provider.count("a").value == 11
+        assert source.calls == 3
+
+        provider.invalidate("b")
+        provider.count("b")
+        assert source.calls == 4
+
+    def test_cached_count_maxsize(self):
+        """Test that CachedCount evicts the oldest key when full."""
+        source = FakeCountSource({"a": 1, "b": 2, "c": 3})
+        provider = CachedCount(source, maxsize=2)
+
+        provider.count("a")
+        provider.count("b")
+        provider.count("c")
+        provider.count("b")
+        assert source.calls == 3
+        provider.count("a")
+        assert source.calls == 4
+
+    def test_estimated_count(self):
+        """Test estimated counts and the exact fallback for small tables."""
+        estimates = FakeCountSource({"big": 1_000_000, "small": 12})
+        exact = FakeCountSource({"big": 999_999, "small": 13})
+        provider = EstimatedCount(estimates, exact=exact, exact_below=1000)
+
+        assert provider.count("big") == TotalCount(1_000_000, is_estimate=True)
+        assert provider.count("small") == TotalCount(13, is_estimate=False)
+        assert exact.calls == 1
+
+    def test_page_from_count(self):
+        """Test that the estimate flag is exposed on the page."""
+        count = EstimatedCount(lambda key: 95).count(None)
+        page = Page.from_count(list(range(10)), page=1, page_size=10, count=count)
+
+        assert page.total == 95
+        assert page.is_estimate is True
+        assert page.total_pages == 10
+        assert page.has_next is True
+
+        data = page.model_dump()
+        assert data["is_estimate"] is True
+        assert data["total_pages"] == 10
+
+
+PARITY_CASES = [
+    "",
+    "?",
+    "page=2",
+    "page=2&limit=20&order=desc",
+    "?limit=100&order=asc",
+    "page=007",
+    "page=+5",
+    "limit= 5",
+    "limit=5.0",
+    "limit=1_0",
+    "page=0",
+    "page=-1",
+    "limit=0",
+    "limit=101",
+    "limit=999999999999",
+    "limit=",
+    "page=abc",
+    "order=ASC",
+    "order=asc%20",
+    "order=random",
+    "page=1&page=3",
+    "other=1&page=4",
+    "page=0&limit=101&order=up",
+    {"page": 3, "limit": 50},
+    {"page": "3"},
+    {"page": True},
+    {"page": 2.0},
+    {"page": 2.5},
+    {"page": None},
+    {"limit": [5]},
+    {"order": "desc", "unknown": object()},
+]
+
+
+def parse_with_model(raw):
+    if isinstance(raw, dict):
+        return PageFilter.model_validate(raw)
+    data = dict(parse_qsl(raw.lstrip("?"), keep_blank_values=True))
+    return PageFilter.model_validate(data)
+
+
+class TestPageFilterFromQuery:
+    @pytest.mark.parametrize("raw", PARITY_CASES)
+    def test_parity_with_model(self, raw):
+        """Test that from_query accepts and rejects exactly what the model does."""
+        try:
+            expected = parse_with_model(raw)
+        except ValidationError as e:
+            with pytest.raises(ValidationError) as exc_info:
+                PageFilter.from_query(raw)
+            assert exc_info.value.errors() == e.errors()
+            assert str(exc_info.value) == str(e)
+        else:
+            # Run twice to cover the cached path
+            for _ in range(2):
+                result = PageFilter.from_query(raw)
+                assert result == expected
+                assert result.model_fields_set == expected.model_fields_set
+
+    def test_subclass_with_alias(self):
+        """Test that aliased subclass fields survive the cached path."""
+
+        class SortedFilter(PageFilter):
+            sort_by: str = Field("id", alias="sortBy")
+
+        for raw in ["sortBy=name&page=2", "sortBy=name&page=2", "sort_by=name"]:
+            result = SortedFilter.from_query(raw)
+            expected = SortedFilter.model_validate(dict(parse_qsl(raw)))
+            assert result == expected
+            assert result.model_fields_set == expected.model_fields_set
+
+    def test_cached_filters_are_independent(self):
+        """Test that cached results are not shared between callers."""
+        first = PageFilter.from_query("page=9&limit=9")
+        first.page = 1
+        assert PageFilter.from_query("page=9&limit=9").page == 9
+
+    def test_subclass_uses_model_validation(self):
+        """Test that subclasses keep their own fields and validators."""
+
+        class SearchFilter(PageFilter):
+            q: str = ""
+
+        result = SearchFilter.from_query("q=abc&page=2")
+        assert isinstance(result, SearchFilter)
+        assert result.q == "abc"
+        assert result.page == 2
+
+
+class TestColumnarPage:
+    def make_page(self, **columns):
+        columns = columns or {
+            "id": ["a", "b", "c"],
+            "amount": array.array("d", [1.5, 2.0, 3.25]),
+            "count": (1, 2, 3),
+        }
+        return ColumnarPage(columns=columns, page=2, page_size=3, total=10)
+
+    def test_metadata(self):
+        """Test that navigation fields match those of Page."""
+        page = self.make_page()
+        rows = Page(items=[1, 2, 3], page=2, page_size=3, total=10)
+
+        assert page.num_rows == 3
+        assert page.total_pages == rows.total_pages
+        assert page.has_next is True
+        assert page.previous_page == 1
+
+    def test_row_access(self):
+        """Test building rows on demand."""
+        page = self.make_page()
+
+        assert page.row(1) == {"id": "b", "amount": 2.0, "count": 2}
+        assert list(page.rows())[2] == {"id": "c", "amount": 3.25, "count": 3}
+
+    def test_column_lengths_must_match(self):
+        """Test that ragged columns are rejected."""
+        with pytest.raises(ValidationError):
+            self.make_page(id=["a"], count=[1, 2])
+
+    def test_json_shape(self):
+        """Test that dumps are column-oriented."""
+        data = json.loads(self.make_page().model_dump_json())
+
+        assert data["columns"] == {
+            "id": ["a", "b", "c"],
+            "amount": [1.5, 2.0, 3.25],
+            "count": [1, 2, 3],
+        }
+        assert data["total_pages"] == 4
+
+    def test_page_round_trip(self):
+        """Test converting to and from a row-based page."""
+        rows = Page(
+            items=[{"id": "a", "n": 1}, {"id": "b", "n": 2}], page=1, page_size=2
+        )
+        page = ColumnarPage.from_page(rows)
+
+        assert page.columns == {"id": ["a", "b"], "n": [1, 2]}
+        assert page.to_page() == rows
+
+    def test_binary_round_trip(self):
+        """Test that numeric columns are written raw and read back as arrays."""
+        page = self.make_page()
+        decoded = ColumnarPage.from_bytes(page.to_bytes())
+
+        assert isinstance(decoded.columns["amount"], array.array)
+        assert decoded.columns["amount"].typecode == "d"
+        assert decoded.model_dump() == page.model_dump()
+
+    def test_binary_rejects_garbage(self):
+        """Test that invalid data is rejected."""
+        with pytest.raises(ValueError):
+            ColumnarPage.from_bytes(b"nope")
+        with pytest.raises(ValueError):
+            ColumnarPage.from_bytes(self.make_page().to_bytes()[:-1])
+
+    def test_numpy_columns(self):
+        """Test pages backed by NumPy arrays."""
+        np = pytest.importorskip("numpy")
+        page = self.make_page(value=np.arange(3, dtype=np.int64), id=["a", "b", "c"])
+
+        assert page.model_dump()["columns"]["value"] == [0, 1, 2]
+        decoded = ColumnarPage.from_bytes(page.to_bytes())
+        assert list(decoded.columns["value"]) == [0, 1, 2]
+
+
+class FakeChangeSource:
+    """In-memory collection of changes keyed by ULID."""
+
+    def __init__(self, ids):
+        self.changes = [{"id": entity_id, "n": n} for n, entity_id in enumerate(ids)]
+        self.fetched = 0
+
+    def fetch_since(self, watermark, limit):
+        rows = [c for c in self.changes if watermark.includes(c["id"])][:limit]
+        self.fetched += len(rows)
+        return rows
+
+
+def ulids(count, start_ms=1_700_000_000_000):
+    return [entity_id_from_int(((start_ms + i) << 80) | i) for i in range(count)]
+
+
+class TestChangeFeed:
+    def test_watermark_helpers(self):
+        """Test building watermarks and since predicates."""
+        first, second = ulids(2)
+        watermark = Watermark.after(first)
+
+        assert watermark.timestamp == entity_id_timestamp(first)
+        assert watermark.includes(second) and not watermark.includes(first)
+        assert watermark.since_clause() == ("id > %s", (first,))
+        assert Watermark().since_clause("change_id", "?") == ("TRUE", ())
+        assert Watermark().includes(first)
+
+    def test_watermark_at_datetime(self):
+        """Test selecting every change from a point in time."""
+        ids = ulids(3)
+        watermark = Watermark.at(entity_id_timestamp(ids[1]))
+
+        assert [watermark.includes(i) for i in ids] == [False, True, True]
+        assert Watermark.after(ids[2]).rewind(timedelta(milliseconds=1)).includes(
+            ids[1]
+        )
+
+    def test_sync_from_scratch(self):
+        """Test that a new feed processes the whole collection in batches."""
+        source = FakeChangeSource(ulids(7))
+        store = InMemoryWatermarkStore()
+        feed = ChangeFeed("cache", source, store, batch_size=3)
+        batches = []
+
+        assert feed.sync(batches.append) == 7
+        assert [len(batch) for batch in batches] == [3, 3, 1]
+        assert store.load("cache").last_id == source.changes[-1]["id"]
+
+    def test_incremental_sync(self):
+        """Test that later syncs only read the new changes."""
+        ids = ulids(10)
+        source = FakeChangeSource(ids[:6])
+        feed = ChangeFeed("cache", source, InMemoryWatermarkStore(), batch_size=4)
+        feed.sync(lambda batch: None)
+
+        source.changes += FakeChangeSource(ids[6:]).changes
+        source.fetched = 0
+        assert [c["id"] for c in feed] == ids[6:]
+        assert source.fetched == 4
+
+    def test_resume_after_crash(self):
+        """Test that a crash mid-batch redelivers only the unfinished batch."""
+        source = FakeChangeSource(ulids(6))
+        store = InMemoryWatermarkStore()
+        feed = ChangeFeed("cache", source, store, batch_size=2)
+
+        def crash_on_fourth(batch):
+            if any(change["n"] == 3 for change in batch):
+                raise RuntimeError("crash")
+
+        with pytest.raises(RuntimeError):
+            feed.sync(crash_on_fourth)
+
+        resumed = ChangeFeed("cache", source, store, batch_size=2)
+        assert [c["n"] for c in resumed] == [2, 3, 4, 5]
+
+    def test_custom_id_accessor(self):
+        """Test feeds over objects with a differently named ULID."""
+
+        class Source:
+            changes = [SimpleNamespace(change_id=i) for i in ulids(3)]
+
+            def fetch_since(self, watermark, limit):
+                return [c for c in self.changes if watermark.includes(c.change_id)]
+
+        feed = ChangeFeed(
+            "cache",
+            Source(),
+            InMemoryWatermarkStore(),
+            id_of=lambda change: change.change_id,
+        )
+        assert list(feed) == Source.changes
+        assert feed.watermark.last_id == Source.changes[-1].change_id
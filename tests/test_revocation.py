@@ -0,0 +1,127 @@
+"""
+Tests for the token revocation store.
+"""
+
+import time
+from datetime import datetime, timezone
+
+from spryx_core.security.claims import AccessToken
+from spryx_core.security.revocation import RevocationStore
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRevocationStore:
+    def test_revoke_and_lookup(self):
+        """Test revoking token ids."""
+        store = RevocationStore(clock=FakeClock())
+        store.revoke("jti-1", 2_000)
+
+        assert store.is_revoked("jti-1") is True
+        assert "jti-1" in store
+        assert store.is_revoked("jti-2") is False
+        assert len(store) == 1
+
+    def test_revoke_token(self):
+        """Test revoking an AccessToken until its exp."""
+        store = RevocationStore()
+        token = AccessToken(
+            iss="spryx",
+            sub="user",
+            aud="api",
+            iat=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            exp=datetime(2099, 1, 1, tzinfo=timezone.utc),
+            jti="token-1",
+            meta={"token_type": "user"},
+        )
+        store.revoke_token(token)
+
+        assert store.is_revoked(token.jti)
+        assert store.take_delta() == {"token-1": 4_070_908_800}
+
+    def test_naive_exp_is_utc(self, monkeypatch):
+        """Test that a naive expiry is read as UTC, whatever the host timezone."""
+        monkeypatch.setenv("TZ", "Asia/Tokyo")
+        time.tzset()
+        try:
+            store = RevocationStore(clock=FakeClock())
+            store.revoke("jti-1", datetime(2030, 1, 1))
+            store.revoke("jti-2", datetime(2030, 1, 1, 0, 0, 0, 1))
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        assert store.take_delta() == {"jti-1": 1_893_456_000, "jti-2": 1_893_456_001}
+
+    def test_expired_entries_are_swept(self):
+        """Test that entries disappear once the token expired."""
+        clock = FakeClock()
+        store = RevocationStore(clock=clock)
+        store.revoke("short", 1_010)
+        store.revoke("long", 5_000)
+        store.revoke("already-expired", 999)
+
+        assert "already-expired" not in store
+        clock.now = 1_010
+        assert store.sweep() == 1
+        assert "short" not in store
+        assert "long" in store
+
+    def test_sweep_on_write(self):
+        """Test that writes sweep expired entries opportunistically."""
+        clock = FakeClock()
+        store = RevocationStore(clock=clock)
+        store.revoke("a", 1_001)
+        clock.now = 1_002
+        store.revoke("b", 2_000)
+
+        assert "a" not in store
+        assert len(store) == 1
+
+    def test_extending_revocation(self):
+        """Test that a later expiry supersedes an earlier one."""
+        clock = FakeClock()
+        store = RevocationStore(clock=clock)
+        store.revoke("jti", 1_100)
+        store.revoke("jti", 1_500)
+        store.revoke("jti", 1_200)
+
+        clock.now = 1_300
+        store.sweep()
+        assert "jti" in store
+        clock.now = 1_500
+        store.sweep()
+        assert "jti" not in store
+
+    def test_replication(self):
+        """Test replicating revocations between nodes with deltas."""
+        clock = FakeClock()
+        node_a = RevocationStore(clock=clock)
+        node_b = RevocationStore(clock=clock)
+        node_a.revoke("jti-1", 2_000)
+        node_a.revoke("jti-2", 3_000)
+
+        delta = node_a.take_delta()
+        assert node_a.take_delta() == {}
+
+        assert node_b.sync(delta) == 2
+        assert node_b.sync(delta) == 0
+        assert node_b.sync([("jti-3", 500)]) == 0
+        assert "jti-1" in node_b and "jti-2" in node_b
+        assert node_b.take_delta() == {}
+
+    def test_sync_rounds_fractional_expiry_up(self):
+        """Test that synced entries are kept until their fractional expiry."""
+        clock = FakeClock(1_000.0)
+        store = RevocationStore(clock=clock)
+
+        assert store.sync({"jti-1": 1_000.5}) == 1
+        assert "jti-1" in store
+        clock.now = 1_000.9
+        assert "jti-1" in store
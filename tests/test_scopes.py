@@ -0,0 +1,138 @@
+"""
+Tests for the scope registry and bitset-backed scope checks.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from spryx_core.security.claims import AccessToken, PltContext
+from spryx_core.security.scopes import (
+    ScopeRegistry,
+    get_scope_registry,
+    register_scope_registry,
+)
+
+REGISTRY = register_scope_registry(
+    ScopeRegistry("test.v1", ["users:read", "users:write", "billing:read"])
+)
+
+
+class TestScopeRegistry:
+    def test_encode_decode(self):
+        """Test that registered scopes round-trip through a bitset."""
+        bits, unknown = REGISTRY.encode(["billing:read", "users:read", "legacy"])
+
+        assert bits == 0b101
+        assert unknown == ("legacy",)
+        assert REGISTRY.decode(bits) == ("users:read", "billing:read")
+
+    def test_decode_rejects_foreign_bits(self):
+        """Test that bits beyond the registry are rejected."""
+        with pytest.raises(ValueError):
+            REGISTRY.decode(1 << 3)
+
+    def test_duplicate_names(self):
+        """Test that a registry cannot assign two bits to one scope."""
+        with pytest.raises(ValueError):
+            ScopeRegistry("dup.v1", ["a", "a"])
+
+    def test_registration(self):
+        """Test publishing and looking up registries by id."""
+        assert get_scope_registry("test.v1") is REGISTRY
+        assert register_scope_registry(ScopeRegistry("test.v1", REGISTRY.names)) is REGISTRY
+        with pytest.raises(ValueError):
+            register_scope_registry(ScopeRegistry("test.v1", ["users:read"]))
+        with pytest.raises(KeyError):
+            get_scope_registry("missing.v1")
+
+
+class TestScopedContext:
+    def test_bitset_context(self):
+        """Test checks and lazy expansion on a bitset context."""
+        context = PltContext(
+            role_id="admin", **REGISTRY.to_claims(["users:read", "legacy:scope"])
+        )
+
+        assert context.scope_bits == 0b1
+        assert context.scopes == ("legacy:scope",)
+        assert context.has_scope("users:read")
+        assert context.has_scopes(["users:read", "legacy:scope"])
+        assert not context.has_scope("users:write")
+        assert not context.has_scopes(["users:read", "other"])
+        assert context.scope_names == ("users:read", "legacy:scope")
+
+    def test_string_context(self):
+        """Test that tokens without a bitset keep using scope names."""
+        context = PltContext(role_id="admin", scopes=["users:read"])
+
+        assert context.has_scope("users:read")
+        assert not context.has_scope("users:write")
+        assert context.scope_names == ("users:read",)
+
+    def test_scope_names_follow_copies(self):
+        """Test that scope names reflect the bitset of a copied context."""
+        context = PltContext(role_id="admin", **REGISTRY.to_claims(["users:read"]))
+        assert context.scope_names == ("users:read",)
+
+        copy = context.model_copy(update={"scope_bits": 0b11})
+        assert copy.scope_names == ("users:read", "users:write")
+        assert context.scope_names == ("users:read",)
+
+    def test_serialization_schema_keeps_fields(self):
+        """Test that omitting unset bits does not hide the context's schema."""
+        schema = PltContext.model_json_schema(mode="serialization")
+        assert {"role_id", "scopes", "scope_bits", "scope_reg"} <= set(
+            schema["properties"]
+        )
+
+    def test_bits_require_registry(self):
+        """Test that a bitset cannot be given without its registry."""
+        with pytest.raises(ValidationError):
+            PltContext(role_id="admin", scope_bits=1)
+
+    def test_unknown_registry(self):
+        """Test that a bitset from an unpublished registry fails validation."""
+        with pytest.raises(ValidationError, match="Unknown scope registry"):
+            PltContext(role_id="admin", scope_bits=1, scope_reg="missing.v1")
+
+    def test_bits_beyond_registry(self):
+        """Test that bits without a scope in the registry fail validation."""
+        with pytest.raises(ValidationError, match="exceed"):
+            PltContext(role_id="admin", scope_bits=0b1000, scope_reg="test.v1")
+
+    def test_registered_names_in_scopes(self):
+        """Test that registered names listed as strings still count as granted."""
+        context = PltContext(
+            role_id="admin", scopes=["users:read"], scope_bits=0b10, scope_reg="test.v1"
+        )
+
+        assert context.scope_names == ("users:write", "users:read")
+        assert context.has_scope("users:read")
+        assert context.has_scopes(["users:read", "users:write"])
+        assert not context.has_scope("billing:read")
+
+    def test_access_token(self):
+        """Test validating a token whose contexts carry bitsets."""
+        token = AccessToken.model_validate(
+            {
+                "iss": "https://auth.spryx.ai",
+                "sub": "user-1",
+                "aud": "spryx-api",
+                "iat": datetime(2024, 1, 1, tzinfo=timezone.utc),
+                "exp": datetime(2099, 1, 1, tzinfo=timezone.utc),
+                "jti": "token-1",
+                "meta": {"token_type": "user"},
+                "org_context": {
+                    "id": "org-1",
+                    "role_id": "member",
+                    "scope_bits": 0b110,
+                    "scope_reg": "test.v1",
+                },
+            }
+        )
+
+        assert token.org_context.has_scopes(["users:write", "billing:read"])
+        assert token.org_context.scope_names == ("users:write", "billing:read")
+        assert token == AccessToken.model_validate(token.model_dump())
@@ -2,10 +2,20 @@
 Tests for the sentinels module.
 """
 
+import copy
+import multiprocessing
 import pickle
+from concurrent.futures import ProcessPoolExecutor
+from enum import StrEnum
+from typing import Optional
 
+import pytest
+from pydantic import BaseModel
 
+from spryx_core.errors import SpryxError
+from spryx_core.pagination import Page
 from spryx_core.sentinels import NotGiven, _SentinelBase
+from spryx_core.types import NotGivenOr, is_given
 
 
 class TestSentinels:
@@ -57,3 +67,112 @@ class TestSentinels:
         assert unpickled._name == "NotGiven"
         assert str(unpickled) == "NotGiven"
         assert bool(unpickled) is False
+
+    def test_not_given_pickling_identity(self):
+        """Test that unpickled NotGiven is the NotGiven singleton."""
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            assert pickle.loads(pickle.dumps(NotGiven, protocol=protocol)) is NotGiven
+
+    def test_not_given_copy_identity(self):
+        """Test that copying NotGiven returns the singleton."""
+        assert copy.copy(NotGiven) is NotGiven
+        assert copy.deepcopy(NotGiven) is NotGiven
+        assert copy.deepcopy({"value": NotGiven})["value"] is NotGiven
+
+    def test_model_round_trip_keeps_not_given(self):
+        """Test that models with NotGivenOr fields survive pickling."""
+        payload = pickle.loads(pickle.dumps(PatchPayload(name="new")))
+
+        assert payload.name == "new"
+        assert payload.email is NotGiven
+        assert is_given(payload.email) is False
+
+
+class PatchPayload(BaseModel):
+    model_config = {"arbitrary_types_allowed": True}
+
+    name: NotGivenOr[str] = NotGiven
+    email: NotGivenOr[Optional[str]] = NotGiven
+
+
+class ErrorCode(StrEnum):
+    CONFLICT = "conflict"
+
+
+def given_fields(payload: PatchPayload):
+    """Return the fields set on a payload, as seen from a worker process."""
+    return payload, [name for name, value in payload if is_given(value)]
+
+
+def echo(value):
+    return value
+
+
+def raise_error(message: str):
+    raise SpryxError(ErrorCode.CONFLICT, message, {"field": "email"})
+
+
+class UserNotFound(SpryxError[ErrorCode]):
+    def __init__(self, user_id: str) -> None:
+        super().__init__(
+            ErrorCode.CONFLICT, f"User {user_id} not found", {"id": user_id}
+        )
+        self.user_id = user_id
+
+
+def raise_user_not_found(user_id: str):
+    raise UserNotFound(user_id)
+
+
+@pytest.fixture(scope="module", params=["fork", "spawn"])
+def process_pool(request):
+    if request.param not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{request.param} start method is not available")
+    context = multiprocessing.get_context(request.param)
+    with ProcessPoolExecutor(max_workers=2, mp_context=context) as pool:
+        yield pool
+
+
+class TestSentinelsAcrossProcesses:
+    def test_not_given_in_worker(self, process_pool):
+        """Test that is_given sees NotGiven fields as missing in workers."""
+        payloads = [PatchPayload(name="a"), PatchPayload(email=None), PatchPayload()]
+        results = list(process_pool.map(given_fields, payloads))
+
+        assert [fields for _, fields in results] == [["name"], ["email"], []]
+        returned, _ = results[0]
+        assert returned.email is NotGiven
+
+    def test_page_round_trip(self, process_pool):
+        """Test that pages survive the process boundary."""
+        page = Page(items=[NotGiven, 1], page=1, page_size=2, total=3)
+        returned = process_pool.submit(echo, page).result()
+
+        assert returned == page
+        assert returned.items[0] is NotGiven
+        assert returned.has_next is True
+
+    def test_spryx_error_round_trip(self, process_pool):
+        """Test that SpryxError keeps its code and details across processes."""
+        with pytest.raises(SpryxError) as exc_info:
+            process_pool.submit(raise_error, "Email taken").result()
+
+        assert exc_info.value.code is ErrorCode.CONFLICT
+        assert exc_info.value.to_dict() == {
+            "error": "conflict",
+            "message": "Email taken",
+            "details": {"field": "email"},
+        }
+
+    def test_spryx_error_subclass_round_trip(self, process_pool):
+        """Test that subclasses with their own constructor cross processes."""
+        with pytest.raises(UserNotFound) as exc_info:
+            process_pool.submit(raise_user_not_found, "u1").result()
+
+        assert exc_info.value.user_id == "u1"
+        assert exc_info.value.args == ("User u1 not found",)
+        assert exc_info.value.to_dict() == {
+            "error": "conflict",
+            "message": "User u1 not found",
+            "details": {"id": "u1"},
+        }
@@ -0,0 +1,150 @@
+"""
+Tests for the serialization module.
+"""
+
+import json
+from datetime import datetime, timezone
+from enum import StrEnum
+
+import pytest
+
+from spryx_core import serialization
+from spryx_core.errors import SpryxError
+from spryx_core.id import EntityId
+from spryx_core.pagination import Page
+from spryx_core.security.claims import AccessToken
+
+
+class ErrorCode(StrEnum):
+    NOT_FOUND = "not_found"
+
+
+PAGE = Page(
+    items=[
+        {
+            "id": EntityId("01H2XGMTVZ1QW1F4KJJNVD0YJR"),
+            "name": "Ação",
+            "created_at": datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo=timezone.utc),
+        }
+    ],
+    page=1,
+    page_size=10,
+    total=1,
+)
+PAGE_JSON = (
+    '{"items":[{"id":"01H2XGMTVZ1QW1F4KJJNVD0YJR","name":"Ação",'
+    '"created_at":"2024-05-06T07:08:09.123456Z"}],"page":1,"page_size":10,'
+    '"total":1,"is_estimate":false,"has_more":null,"total_pages":1,'
+    '"has_previous":false,"has_next":false,"next_page":null,"previous_page":null}'
+).encode()
+
+TOKEN = AccessToken(
+    iss="spryx",
+    sub="01H2XGMTVZ1QW1F4KJJNVD0YJR",
+    aud=["api", "web"],
+    iat=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    exp=datetime(2099, 1, 1, 12, 30, tzinfo=timezone.utc),
+    jti="01H2XGMTVZ1QW1F4KJJNVD0YJS",
+    meta={"token_type": "user", "sid": "s1"},
+    plt_context={"role_id": "admin", "scopes": ["a:read", "b:write"]},
+)
+TOKEN_JSON = (
+    '{"iss":"spryx","sub":"01H2XGMTVZ1QW1F4KJJNVD0YJR","aud":["api","web"],'
+    '"iat":"2024-01-01T00:00:00.000000Z","exp":"2099-01-01T12:30:00.000000Z",'
+    '"nbf":null,"jti":"01H2XGMTVZ1QW1F4KJJNVD0YJS","ver":1,'
+    '"meta":{"token_type":"user","sid":"s1"},'
+    '"plt_context":{"role_id":"admin","scopes":["a:read","b:write"]},'
+    '"org_context":null}'
+).encode()
+
+ERROR = SpryxError(
+    ErrorCode.NOT_FOUND, "Missing", {"at": datetime(2024, 1, 1, tzinfo=timezone.utc)}
+)
+ERROR_JSON = (
+    b'{"error":"not_found","message":"Missing",'
+    b'"details":{"at":"2024-01-01T00:00:00.000000Z"}}'
+)
+
+GOLDEN = [
+    (PAGE, PAGE_JSON),
+    (TOKEN, TOKEN_JSON),
+    (ERROR, ERROR_JSON),
+    (ERROR.to_dict(), ERROR_JSON),
+    (datetime(2024, 1, 1, 3, tzinfo=timezone.utc), b'"2024-01-01T03:00:00.000000Z"'),
+    (
+        {"floats": [0.1, 1.5, -123.456, 0.0025, 12345678.9, 1e15, 0.0]},
+        b'{"floats":[0.1,1.5,-123.456,0.0025,12345678.9,1000000000000000.0,0.0]}',
+    ),
+    (
+        {1: "a", 2.5: "b", False: "c", None: "d", ErrorCode.NOT_FOUND: "e"},
+        b'{"1":"a","2.5":"b","false":"c","null":"d","not_found":"e"}',
+    ),
+    ([2**70, -(2**64)], b"[1180591620717411303424,-18446744073709551616]"),
+]
+
+# Exponent-notation floats decode to the same value but are printed differently
+EXPONENT_FLOATS = [1e-05, 1e-07, 1e16, 1e22, 2.5e-300, 1.7976931348623157e308]
+
+
+def backend_names():
+    available = serialization.available_backends()
+    return [
+        pytest.param(
+            name,
+            marks=pytest.mark.skipif(
+                name not in available, reason=f"{name} is not installed"
+            ),
+        )
+        for name in ("json", "orjson", "msgspec")
+    ]
+
+
+class TestSerialization:
+    @pytest.mark.parametrize("name", backend_names())
+    @pytest.mark.parametrize("value,expected", GOLDEN)
+    def test_golden_output(self, name, value, expected):
+        """Test that every backend produces byte-identical output."""
+        backend = serialization.create_backend(name)
+        assert backend.dumps(value) == expected
+
+    @pytest.mark.parametrize("value,expected", GOLDEN)
+    def test_normalized_output(self, value, expected):
+        """Test the normalization pass used by backends without datetime hooks."""
+        normalized = serialization._jsonable(value)
+        encoded = json.dumps(normalized, ensure_ascii=False, separators=(",", ":"))
+        assert encoded.encode() == expected
+
+    @pytest.mark.parametrize("name", backend_names())
+    def test_round_trip(self, name):
+        """Test that decoded output validates back into the original models."""
+        backend = serialization.create_backend(name)
+
+        assert AccessToken.model_validate(backend.loads(backend.dumps(TOKEN))) == TOKEN
+        page = Page[dict].model_validate(backend.loads(backend.dumps(PAGE)))
+        assert page.items[0]["created_at"] == "2024-05-06T07:08:09.123456Z"
+        assert page.total == 1
+
+    @pytest.mark.parametrize("name", backend_names())
+    def test_exponent_floats_round_trip(self, name):
+        """Test that floats in exponent notation decode to the same value."""
+        backend = serialization.create_backend(name)
+        assert backend.loads(backend.dumps(EXPONENT_FLOATS)) == EXPONENT_FLOATS
+
+    def test_unsupported_type(self):
+        """Test that unsupported types raise TypeError."""
+        with pytest.raises(TypeError):
+            serialization.dumps(object())
+
+    def test_backend_selection(self):
+        """Test selecting backends by name."""
+        original = serialization.get_backend()
+        try:
+            serialization.set_backend("json")
+            assert serialization.get_backend().name == "json"
+            assert serialization.loads(serialization.dumps([1, "a"])) == [1, "a"]
+        finally:
+            serialization.set_backend(original)
+
+        assert serialization.available_backends()[-1] == "json"
+        with pytest.raises(ValueError):
+            serialization.create_backend("yaml")
@@ -0,0 +1,116 @@
+"""
+Thread-safety and scaling tests for the ID and time helpers.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from spryx_core import id as id_module
+from spryx_core.id import entity_id_to_int, generate_entity_id, is_valid_ulid
+from spryx_core.time import parse_iso, to_iso
+
+THREAD_COUNTS = [1, 2, 4, 8]
+IDS_PER_THREAD = 5000
+
+
+def generate_batch(count: int):
+    return [generate_entity_id() for _ in range(count)]
+
+
+def gil_enabled() -> bool:
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+@pytest.fixture
+def fresh_generator():
+    """Isolate tests that patch the clock from this thread's generator state."""
+    id_module._reset_generator_state()
+    yield
+    id_module._reset_generator_state()
+
+
+class TestIdThreadSafety:
+    @pytest.mark.parametrize("threads", THREAD_COUNTS)
+    def test_unique_and_monotonic(self, threads):
+        """Test that concurrent generation yields unique, per-thread ordered IDs."""
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            batches = list(pool.map(generate_batch, [IDS_PER_THREAD] * threads))
+
+        all_ids = [entity_id for batch in batches for entity_id in batch]
+        assert len(set(all_ids)) == threads * IDS_PER_THREAD
+        for batch in batches:
+            assert all(is_valid_ulid(entity_id) for entity_id in batch)
+            assert all(a < b for a, b in zip(batch, batch[1:]))
+
+    def test_monotonic_within_millisecond(self, fresh_generator):
+        """Test that IDs from a frozen clock still increase."""
+        frozen = 1_700_000_000_000_000_000
+        with patch.object(id_module.time, "time_ns", return_value=frozen):
+            ids = generate_batch(100)
+
+        values = [entity_id_to_int(entity_id) for entity_id in ids]
+        assert all(b == a + 1 for a, b in zip(values, values[1:]))
+        assert {value >> 80 for value in values} == {1_700_000_000_000}
+
+    def test_clock_going_backwards(self, fresh_generator):
+        """Test that IDs keep increasing if the clock goes backwards."""
+        first = generate_entity_id()
+        past = (time.time_ns() // 1_000_000 - 10_000) * 1_000_000
+        with patch.object(id_module.time, "time_ns", return_value=past):
+            second = generate_entity_id()
+        assert second > first
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_no_duplicates_after_fork(self, fresh_generator):
+        """Test that a forked child does not continue the parent's sequence."""
+        frozen = 1_700_000_000_000_000_000
+        with patch.object(id_module.time, "time_ns", return_value=frozen):
+            generate_entity_id()
+            read_fd, write_fd = os.pipe()
+            pid = os.fork()
+            if pid == 0:  # pragma: no cover - runs in the child
+                os.close(read_fd)
+                os.write(write_fd, generate_entity_id().encode())
+                os._exit(0)
+            os.close(write_fd)
+            parent_id = generate_entity_id()
+            os.waitpid(pid, 0)
+            child_id = os.read(read_fd, 26).decode()
+            os.close(read_fd)
+
+        assert is_valid_ulid(child_id)
+        assert child_id != parent_id
+
+    @pytest.mark.skipif(gil_enabled(), reason="scaling requires a free-threaded build")
+    def test_throughput_scales_with_threads(self):
+        """Test near-linear throughput scaling on free-threaded builds."""
+
+        def throughput(threads: int) -> float:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                list(pool.map(generate_batch, [20000] * threads))
+            return threads * 20000 / (time.perf_counter() - start)
+
+        threads = min(4, os.cpu_count() or 1)
+        if threads < 2:
+            pytest.skip("requires at least two CPUs")
+        assert throughput(threads) > 0.7 * threads * throughput(1)
+
+
+class TestTimeThreadSafety:
+    def test_concurrent_iso_round_trip(self):
+        """Test ISO formatting and parsing from many threads at once."""
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        def round_trip(offset: int):
+            dt = base + timedelta(microseconds=offset * 7919)
+            return parse_iso(to_iso(dt)) == dt
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert all(pool.map(round_trip, range(20000)))
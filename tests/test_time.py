@@ -2,6 +2,7 @@
 Tests for the time module.
 """
 
+import random
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
@@ -9,10 +10,15 @@ import pytest
 
 from spryx_core.time import (
     ISO_8601_UTC_RE,
+    TimeRange,
+    TimeRangeIndex,
     end_of_day,
+    from_epoch_micros,
+    merge_ranges,
     now_utc,
     parse_iso,
     start_of_day,
+    to_epoch_micros,
     to_iso,
     utc_from_timestamp,
 )
@@ -149,3 +155,118 @@ class TestTime:
         with patch("spryx_core.time.now_utc", return_value=mock_now):
             end = end_of_day()
             assert end == datetime(2023, 5, 18, 23, 59, 59, 999999, tzinfo=timezone.utc)
+
+    def test_epoch_micros_round_trip(self):
+        """Test exact conversion to and from epoch microseconds."""
+        dt = datetime(2099, 1, 1, 12, 30, 0, 654321, tzinfo=timezone.utc)
+
+        assert to_epoch_micros(dt) == 4_070_953_800_654_321
+        assert from_epoch_micros(to_epoch_micros(dt)) == dt
+        assert from_epoch_micros(0) == datetime(1970, 1, 1, tzinfo=timezone.utc)
+        assert to_epoch_micros(datetime(1970, 1, 1)) == 0
+
+        local = dt.astimezone(timezone(timedelta(hours=-3)))
+        assert to_epoch_micros(local) == to_epoch_micros(dt)
+
+
+def day_range(day: int, hours: int = 24) -> TimeRange:
+    start = datetime(2024, 1, day, tzinfo=timezone.utc)
+    return TimeRange.from_datetimes(start, start + timedelta(hours=hours, microseconds=-1))
+
+
+class TestTimeRange:
+    def test_bounds(self):
+        """Test building a range and reading its bounds."""
+        dt = datetime(2024, 5, 6, 13, 30, tzinfo=timezone.utc)
+        day = TimeRange.days(dt)
+
+        assert day.start == start_of_day(dt)
+        assert day.end == end_of_day(dt)
+        assert day.duration == timedelta(days=1, microseconds=-1)
+        assert dt in day
+        assert start_of_day(dt) in day and end_of_day(dt) in day
+        assert end_of_day(dt) + timedelta(microseconds=1) not in day
+
+    def test_invalid_range(self):
+        """Test that a range cannot end before it starts."""
+        with pytest.raises(ValueError):
+            TimeRange(10, 9)
+
+    def test_frozen_and_slotted(self):
+        """Test that ranges are immutable and have no instance dict."""
+        time_range = TimeRange(1, 2)
+        with pytest.raises(AttributeError):
+            time_range.start_us = 0
+        assert not hasattr(time_range, "__dict__")
+        assert {TimeRange(1, 2), TimeRange(1, 2)} == {time_range}
+
+    def test_overlap_and_intersection(self):
+        """Test overlap checks and intersections of inclusive ranges."""
+        a, b, c = TimeRange(0, 10), TimeRange(10, 20), TimeRange(11, 30)
+
+        assert a.overlaps(b) and b.overlaps(a)
+        assert not a.overlaps(c)
+        assert a.intersection(b) == TimeRange(10, 10)
+        assert b.intersection(c) == TimeRange(11, 20)
+        assert a.intersection(c) is None
+
+    def test_iso_round_trip(self):
+        """Test ISO interval formatting and parsing."""
+        time_range = TimeRange.from_datetimes(
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 1, 2, 12, 0, 0, 500, tzinfo=timezone.utc),
+        )
+        text = time_range.to_iso()
+
+        assert text == "2024-01-01T00:00:00.000000Z/2024-01-02T12:00:00.000500Z"
+        assert TimeRange.parse_iso(text) == time_range
+        with pytest.raises(ValueError):
+            TimeRange.parse_iso("2024-01-01T00:00:00Z")
+
+    def test_merge_ranges(self):
+        """Test merging overlapping ranges."""
+        ranges = [
+            TimeRange(20, 25),
+            TimeRange(0, 10),
+            TimeRange(5, 12),
+            TimeRange(12, 15),
+        ]
+        assert merge_ranges(ranges) == [TimeRange(0, 15), TimeRange(20, 25)]
+        assert merge_ranges([TimeRange(0, 10), TimeRange(2, 3)]) == [TimeRange(0, 10)]
+        assert merge_ranges([]) == []
+
+
+class TestTimeRangeIndex:
+    def test_overlapping_instant(self):
+        """Test finding the ranges containing an instant."""
+        index = TimeRangeIndex([day_range(1, 72), day_range(2), day_range(5)])
+        noon = datetime(2024, 1, 2, 12, tzinfo=timezone.utc)
+
+        assert index.overlapping(noon) == [day_range(1, 72), day_range(2)]
+        assert index.overlapping(datetime(2024, 1, 4, tzinfo=timezone.utc)) == []
+
+    def test_matches_pairwise_scan(self):
+        """Test the index against a brute-force pairwise scan."""
+        rng = random.Random(42)
+        ranges = []
+        for _ in range(500):
+            start = rng.randrange(0, 1_000_000)
+            ranges.append(TimeRange(start, start + rng.randrange(0, 50_000)))
+        index = TimeRangeIndex(ranges)
+        queries = [
+            TimeRange(q, q + rng.randrange(0, 10_000))
+            for q in range(0, 1_050_000, 7_001)
+        ]
+
+        for query, found in zip(queries, index.overlapping_many(queries)):
+            expected = sorted(r for r in ranges if r.overlaps(query))
+            assert found == expected
+
+        assert index.merged() == merge_ranges(ranges)
+        assert len(index) == 500
+
+    def test_empty_index(self):
+        """Test querying an empty index."""
+        index = TimeRangeIndex([])
+        assert index.overlapping(TimeRange(0, 100)) == []
+        assert index.merged() == []